@@ -8,6 +8,21 @@ public class BigIntegerConverterTest(PythonEnvironmentFixture fixture) :
 {
     public static TheoryData<BigInteger> TestCases => new()
     {
-        BigInteger.Parse("12345678987654345678764345678987654345678765")
+        BigInteger.Parse("12345678987654345678764345678987654345678765"),
+        BigInteger.Parse("-12345678987654345678764345678987654345678765"),
+        2,
+        -2,
+        127,
+        128,
+        255,
+        256,
+        -128,
+        -129,
+        long.MaxValue,
+        long.MinValue,
+        (BigInteger)ulong.MaxValue + 1,
+        BigInteger.Pow(2, 2048) - 1,
+        -BigInteger.Pow(2, 2048),
+        BigInteger.Pow(3, 100_000),
     };
 }
@@ -0,0 +1,64 @@
+using CSnakes.Runtime.Python;
+
+namespace CSnakes.Runtime.Tests.Converter;
+
+public class NumericArrayImporterTests(PythonEnvironmentFixture fixture) : RuntimeTestBase(fixture)
+{
+    [Fact]
+    public void Int64ArrayFromList()
+    {
+        using var obj = Env.ExecuteExpression("[1, -2, 9223372036854775807]");
+        var result = obj.ImportAs<long[], PyObjectImporters.Int64Array>();
+        Assert.Equal([1, -2, long.MaxValue], result);
+    }
+
+    [Fact]
+    public void Int64ArrayFromTuple()
+    {
+        using var obj = Env.ExecuteExpression("(1, 2, 3)");
+        var result = obj.ImportAs<long[], PyObjectImporters.Int64Array>();
+        Assert.Equal([1, 2, 3], result);
+    }
+
+    [Fact]
+    public void Int64ArrayFromOtherSequence()
+    {
+        using var range = Env.ExecuteExpression("range(5)");
+        var result = range.ImportAs<long[], PyObjectImporters.Int64Array>();
+        Assert.Equal([0, 1, 2, 3, 4], result);
+    }
+
+    [Fact]
+    public void Int64ArrayThrowsOnNonIntegerItem()
+    {
+        using var obj = Env.ExecuteExpression("[1, 'two', 3]");
+        Assert.Throws<PythonInvocationException>(() => obj.ImportAs<long[], PyObjectImporters.Int64Array>());
+    }
+
+    [Fact]
+    public void DoubleArrayFromList()
+    {
+        using var obj = Env.ExecuteExpression("[1.5, -2.25, 3]");
+        var result = obj.ImportAs<double[], PyObjectImporters.DoubleArray>();
+        Assert.Equal([1.5, -2.25, 3.0], result);
+    }
+
+    [Fact]
+    public void ListOfInt64IsImportedEagerly()
+    {
+        using var obj = Env.ExecuteExpression("[1, 2, 3]");
+        var result = obj.ImportAs<IReadOnlyList<long>, PyObjectImporters.List<long, PyObjectImporters.Int64>>();
+        Assert.IsType<long[]>(result);
+        Assert.Equal([1, 2, 3], result);
+    }
+
+    [Fact]
+    public void ListOfInt64FallsBackToLazyListOnOverflow()
+    {
+        using var obj = Env.ExecuteExpression("[1, 2 ** 64]");
+        var result = obj.ImportAs<IReadOnlyList<long>, PyObjectImporters.List<long, PyObjectImporters.Int64>>();
+        Assert.IsNotType<long[]>(result);
+        Assert.Equal(1, result[0]);
+        Assert.Throws<PythonInvocationException>(() => result[1]);
+    }
+}
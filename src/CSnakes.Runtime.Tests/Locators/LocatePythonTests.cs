@@ -0,0 +1,96 @@
+using CSnakes.Runtime.Locators;
+
+namespace CSnakes.Runtime.Tests.Locators;
+
+public class LocatePythonTests
+{
+    private static readonly Version PythonVersion = new(3, 12);
+
+    [Fact]
+    public async Task TestFirstRegisteredLocatorWins()
+    {
+        using var slow = new ManualResetEventSlim();
+        var first = new StubLocator("first", wait: slow);
+        var second = new StubLocator("second");
+
+        var locating = PythonEnvironment.LocatePythonAsync([first, second]);
+
+        // The second locator finishes first, but the first is still waited for.
+        Assert.True(second.Located.Wait(TimeSpan.FromSeconds(10), TestContext.Current.CancellationToken));
+        Assert.False(locating.IsCompleted);
+        slow.Set();
+
+        var location = await locating;
+        Assert.Equal("first", location?.Folder);
+    }
+
+    [Fact]
+    public async Task TestProbesRunConcurrently()
+    {
+        // Each locator waits for the other to start, so locating only completes if they run at the same time.
+        using var barrier = new Barrier(2);
+        var first = new StubLocator("first", barrier: barrier);
+        var second = new StubLocator("second", barrier: barrier);
+
+        var location = await PythonEnvironment.LocatePythonAsync([first, second]).WaitAsync(TimeSpan.FromSeconds(10), TestContext.Current.CancellationToken);
+
+        Assert.Equal("first", location?.Folder);
+    }
+
+    [Fact]
+    public async Task TestInstallingLocatorRunsOnlyWhenNeeded()
+    {
+        var installing = new StubLocator("installing", concurrent: false);
+
+        Assert.Equal("probe", (await PythonEnvironment.LocatePythonAsync([new StubLocator("probe"), installing]))?.Folder);
+        Assert.False(installing.Located.IsSet);
+
+        Assert.Equal("installing", (await PythonEnvironment.LocatePythonAsync([new StubLocator(null), installing]))?.Folder);
+        Assert.True(installing.Located.IsSet);
+    }
+
+    [Fact]
+    public async Task TestUnsupportedLocatorsAreSkipped()
+    {
+        var unsupported = new StubLocator("unsupported", supported: false);
+
+        Assert.Equal("supported", (await PythonEnvironment.LocatePythonAsync([unsupported, new StubLocator("supported")]))?.Folder);
+        Assert.False(unsupported.Located.IsSet);
+    }
+
+    [Fact]
+    public async Task TestLocatorErrorPropagates()
+    {
+        var failing = new StubLocator("failing", error: new DirectoryNotFoundException("Python not found."));
+
+        await Assert.ThrowsAsync<DirectoryNotFoundException>(() => PythonEnvironment.LocatePythonAsync([failing, new StubLocator("other")]));
+    }
+
+    private sealed class StubLocator(string? folder,
+                                     bool concurrent = true,
+                                     bool supported = true,
+                                     ManualResetEventSlim? wait = null,
+                                     Barrier? barrier = null,
+                                     Exception? error = null) : PythonLocator
+    {
+        public ManualResetEventSlim Located { get; } = new();
+
+        protected override Version Version => PythonVersion;
+
+        protected internal override bool CanLocateConcurrently => concurrent;
+
+        internal override bool IsSupported() => supported;
+
+        public override PythonLocationMetadata LocatePython()
+        {
+            barrier?.SignalAndWait(TimeSpan.FromSeconds(10));
+            wait?.Wait(TimeSpan.FromSeconds(10));
+            Located.Set();
+
+            if (error is not null)
+                throw error;
+
+            return folder is null ? null! : new PythonLocationMetadata(folder, Version, "", "", "");
+        }
+    }
+}
@@ -0,0 +1,168 @@
+using CSnakes.Runtime.Locators;
+using System.Formats.Tar;
+using System.Net;
+using ZstdSharp;
+
+namespace CSnakes.Runtime.Tests.Locators;
+
+public sealed class RedistributableInstallerTests : IDisposable
+{
+    private const string DownloadUrl = "https://example.invalid/cpython-3.12.11+20250902-x86_64-unknown-linux-gnu-pgo+lto-full.tar.zst";
+
+    private readonly string cachePath = Path.Join(Path.GetTempPath(), "csnakes-tests", Guid.NewGuid().ToString("N"));
+
+    public void Dispose()
+    {
+        if (Directory.Exists(cachePath))
+            Directory.Delete(cachePath, recursive: true);
+    }
+
+    /// <summary>
+    /// Serves a fixed archive in place of the redistributable download.
+    /// </summary>
+    private sealed class ArchiveHandler(byte[]? archive) : HttpMessageHandler
+    {
+        protected override Task<HttpResponseMessage> SendAsync(HttpRequestMessage request, CancellationToken cancellationToken) =>
+            Task.FromResult(archive is null
+                ? new HttpResponseMessage(HttpStatusCode.NotFound)
+                : new HttpResponseMessage(HttpStatusCode.OK) { Content = new StreamContent(new MemoryStream(archive)) });
+    }
+
+    private static byte[] CreateArchive(int largeFileSize = RedistributableInstaller.MaxBufferedFileSize + 1)
+    {
+        using var output = new MemoryStream();
+        using (var compressor = new CompressionStream(output))
+        using (var writer = new TarWriter(compressor, TarEntryFormat.Pax, leaveOpen: true))
+        {
+            writer.WriteEntry(new PaxTarEntry(TarEntryType.Directory, "python/install/bin/"));
+
+            for (var i = 0; i < 50; i++)
+            {
+                writer.WriteEntry(new PaxTarEntry(TarEntryType.RegularFile, $"python/install/lib/module{i}.py")
+                {
+                    DataStream = new MemoryStream(System.Text.Encoding.UTF8.GetBytes($"value = {i}\n")),
+                });
+            }
+
+            writer.WriteEntry(new PaxTarEntry(TarEntryType.RegularFile, "python/install/bin/python3")
+            {
+                Mode = UnixFileMode.UserRead | UnixFileMode.UserWrite | UnixFileMode.UserExecute,
+                DataStream = new MemoryStream([0x7f, (byte)'E', (byte)'L', (byte)'F']),
+            });
+
+            writer.WriteEntry(new PaxTarEntry(TarEntryType.RegularFile, "python/install/lib/libpython.a")
+            {
+                DataStream = new MemoryStream(new byte[largeFileSize]),
+            });
+
+            writer.WriteEntry(new PaxTarEntry(TarEntryType.RegularFile, "python/install/lib/empty.txt"));
+
+            writer.WriteEntry(new PaxTarEntry(TarEntryType.SymbolicLink, "python/install/bin/python")
+            {
+                LinkName = "python3",
+            });
+        }
+
+        return output.ToArray();
+    }
+
+    [Fact]
+    public void TestCacheDirectoryNameIsContentAddressed()
+    {
+        var name = RedistributableInstaller.GetCacheDirectoryName("3.12.11", DownloadUrl);
+        Assert.StartsWith("python3.12.11-", name);
+        Assert.Equal(name, RedistributableInstaller.GetCacheDirectoryName("3.12.11", DownloadUrl));
+        Assert.NotEqual(name, RedistributableInstaller.GetCacheDirectoryName("3.12.11", DownloadUrl.Replace("20250902", "20250101")));
+    }
+
+    [Fact]
+    public async Task TestInstallStreamsArchive()
+    {
+        using var client = new HttpClient(new ArchiveHandler(CreateArchive()));
+        var destination = Path.Join(cachePath, "python3.12.11");
+
+        await RedistributableInstaller.InstallAsync(client, DownloadUrl, destination, null, TestContext.Current.CancellationToken);
+
+        var install = Path.Join(destination, "python", "install");
+        Assert.Equal(50, Directory.GetFiles(Path.Join(install, "lib"), "module*.py").Length);
+        Assert.Equal("value = 42\n", File.ReadAllText(Path.Join(install, "lib", "module42.py")));
+        Assert.Equal(RedistributableInstaller.MaxBufferedFileSize + 1, new FileInfo(Path.Join(install, "lib", "libpython.a")).Length);
+        Assert.Equal(0, new FileInfo(Path.Join(install, "lib", "empty.txt")).Length);
+
+        if (!OperatingSystem.IsWindows())
+        {
+            Assert.True(File.GetUnixFileMode(Path.Join(install, "bin", "python3")).HasFlag(UnixFileMode.UserExecute));
+            Assert.Equal("python3", new FileInfo(Path.Join(install, "bin", "python")).LinkTarget);
+        }
+
+        // Nothing is left behind next to the installation.
+        Assert.Equal(destination, Assert.Single(Directory.GetFileSystemEntries(cachePath)));
+    }
+
+    [Fact]
+    public async Task TestInstallKeepsExistingInstallation()
+    {
+        var destination = Path.Join(cachePath, "python3.12.11");
+        var marker = Path.Join(destination, "python", "install", "marker");
+        Directory.CreateDirectory(Path.GetDirectoryName(marker)!);
+        File.WriteAllText(marker, "installed by another process");
+
+        using var client = new HttpClient(new ArchiveHandler(CreateArchive(largeFileSize: 0)));
+        await RedistributableInstaller.InstallAsync(client, DownloadUrl, destination, null, TestContext.Current.CancellationToken);
+
+        Assert.True(File.Exists(marker));
+        Assert.False(File.Exists(Path.Join(destination, "python", "install", "bin", "python3")));
+        Assert.Equal(destination, Assert.Single(Directory.GetFileSystemEntries(cachePath)));
+    }
+
+    [Fact]
+    public async Task TestFailedDownloadLeavesNothingBehind()
+    {
+        using var client = new HttpClient(new ArchiveHandler(null));
+        var destination = Path.Join(cachePath, "python3.12.11");
+
+        await Assert.ThrowsAsync<HttpRequestException>(() =>
+            RedistributableInstaller.InstallAsync(client, DownloadUrl, destination, null, TestContext.Current.CancellationToken));
+
+        Assert.Empty(Directory.GetFileSystemEntries(cachePath));
+    }
+
+    [Fact]
+    public void TestDeletePartialInstallations()
+    {
+        var destination = Path.Join(cachePath, "python3.12.11");
+        var stale = destination + ".partial-0123456789abcdef";
+        var active = destination + ".partial-fedcba9876543210";
+        var other = Path.Join(cachePath, "python3.13.7");
+        Directory.CreateDirectory(stale);
+        Directory.CreateDirectory(active);
+        Directory.CreateDirectory(other);
+        Directory.CreateDirectory(destination);
+        var staleTime = DateTime.UtcNow.AddHours(-2);
+        Directory.SetLastWriteTimeUtc(stale, staleTime);
+        Directory.SetLastWriteTimeUtc(other, staleTime);
+        Directory.SetLastWriteTimeUtc(destination, staleTime);
+
+        RedistributableInstaller.DeletePartialInstallations(destination, TimeSpan.FromHours(1));
+
+        Assert.False(Directory.Exists(stale));
+        Assert.True(Directory.Exists(active));
+        Assert.True(Directory.Exists(other));
+        Assert.True(Directory.Exists(destination));
+    }
+
+    [Fact]
+    public void TestDeletePartialInstallationsKeepsOneBeingWritten()
+    {
+        var destination = Path.Join(cachePath, "python3.12.11");
+        var partial = destination + ".partial-0123456789abcdef";
+        var file = Path.Join(partial, "python", "install", "bin", "python3");
+        Directory.CreateDirectory(Path.GetDirectoryName(file)!);
+        File.WriteAllText(file, "");
+        Directory.SetLastWriteTimeUtc(partial, DateTime.UtcNow.AddHours(-2));
+
+        RedistributableInstaller.DeletePartialInstallations(destination, TimeSpan.FromHours(1));
+
+        Assert.True(File.Exists(file));
+    }
+}
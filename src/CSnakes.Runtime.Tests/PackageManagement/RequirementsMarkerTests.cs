@@ -0,0 +1,95 @@
+using CSnakes.Runtime.Locators;
+using CSnakes.Runtime.PackageManagement;
+
+namespace CSnakes.Runtime.Tests.PackageManagement;
+
+public sealed class RequirementsMarkerTests : IDisposable
+{
+    private readonly string root = Path.Join(Path.GetTempPath(), "csnakes-tests", Guid.NewGuid().ToString("N"));
+    private readonly string environmentPath;
+    private readonly string sitePackagesPath;
+    private readonly string requirementsPath;
+
+    private static readonly PythonLocationMetadata Location =
+        new("/python", new Version(3, 12, 11), "/python/lib/libpython3.12.so", "/python/lib", "/python/bin/python3");
+
+    public RequirementsMarkerTests()
+    {
+        environmentPath = Path.Join(root, ".venv");
+        sitePackagesPath = Path.Join(environmentPath, "lib", "python3.12", "site-packages");
+        requirementsPath = Path.Join(root, "requirements.txt");
+        Directory.CreateDirectory(sitePackagesPath);
+        File.WriteAllText(requirementsPath, "numpy==2.0.0\n-r more-requirements.txt\n");
+        File.WriteAllText(Path.Join(root, "more-requirements.txt"), "requests\n");
+    }
+
+    public void Dispose() => Directory.Delete(root, recursive: true);
+
+    private RequirementsMarker CreateMarker(PythonLocationMetadata? location = null) =>
+        new(environmentPath, sitePackagesPath, location ?? Location, requirementsPath);
+
+    [Fact]
+    public void TestIsCurrentAfterWrite()
+    {
+        var marker = CreateMarker();
+        Assert.False(marker.IsCurrent());
+        marker.Write();
+        Assert.True(marker.IsCurrent());
+        Assert.True(CreateMarker().IsCurrent());
+    }
+
+    [Fact]
+    public void TestRequirementsChangeInvalidates()
+    {
+        CreateMarker().Write();
+        File.AppendAllText(requirementsPath, "pandas\n");
+        Assert.False(CreateMarker().IsCurrent());
+    }
+
+    [Fact]
+    public void TestIncludedRequirementsChangeInvalidates()
+    {
+        CreateMarker().Write();
+        File.WriteAllText(Path.Join(root, "more-requirements.txt"), "requests==2.32.0\n");
+        Assert.False(CreateMarker().IsCurrent());
+    }
+
+    [Fact]
+    public void TestInstalledDistributionsChangeInvalidates()
+    {
+        Directory.CreateDirectory(Path.Join(sitePackagesPath, "numpy-2.0.0.dist-info"));
+        CreateMarker().Write();
+        Assert.True(CreateMarker().IsCurrent());
+
+        Directory.Move(Path.Join(sitePackagesPath, "numpy-2.0.0.dist-info"), Path.Join(sitePackagesPath, "numpy-2.1.0.dist-info"));
+        Assert.False(CreateMarker().IsCurrent());
+    }
+
+    [Fact]
+    public void TestUnrelatedSitePackagesChangeDoesNotInvalidate()
+    {
+        CreateMarker().Write();
+        Directory.CreateDirectory(Path.Join(sitePackagesPath, "__pycache__"));
+        File.WriteAllText(Path.Join(sitePackagesPath, "module.py"), "");
+        Assert.True(CreateMarker().IsCurrent());
+    }
+
+    [Fact]
+    public void TestInterpreterChangeInvalidates()
+    {
+        CreateMarker().Write();
+        Assert.False(CreateMarker(Location with { Version = new Version(3, 12, 12) }).IsCurrent());
+        Assert.False(CreateMarker(Location with { FreeThreaded = true }).IsCurrent());
+    }
+
+    [Fact]
+    public void TestMarkersAreKeptPerRequirementsFile()
+    {
+        CreateMarker().Write();
+        var other = new RequirementsMarker(environmentPath, sitePackagesPath, Location, Path.Join(root, "more-requirements.txt"));
+        Assert.False(other.IsCurrent());
+        other.Write();
+        Assert.True(CreateMarker().IsCurrent());
+        Assert.True(other.IsCurrent());
+    }
+}
@@ -38,6 +38,32 @@ public class AwaitableTests(PythonEnvironmentFixture fixture) : RuntimeTestBase(
 
             Assert.False(awaitable.IsClosed);
         }
+
+        [Fact]
+        public async Task SameFutureCanBeAwaitedTwice()
+        {
+            var locals = new Dictionary<string, PyObject>();
+            var globals = new Dictionary<string, PyObject>();
+
+            using var result = Env.Execute(locals: locals, globals: globals, code: """
+                import asyncio
+                async def start():
+                    return asyncio.ensure_future(asyncio.sleep(0.1, 'done'))
+                a = start()
+
+                """);
+
+            using var start = locals["a"];
+            using var task = await Awaitable.WaitAsync(start, TestContext.Current.CancellationToken);
+
+            var first = Awaitable.WaitAsync(task, TestContext.Current.CancellationToken);
+            var second = Awaitable.WaitAsync(task, TestContext.Current.CancellationToken);
+
+            using var firstResult = await first;
+            using var secondResult = await second;
+            Assert.Equal("done", firstResult.As<string>());
+            Assert.Equal("done", secondResult.As<string>());
+        }
     }
 
     public enum DisposalTiming { AwaitTaskThenDispose, DisposeThenAwaitTask }
@@ -0,0 +1,76 @@
+using CSnakes.Runtime.CPython;
+using CSnakes.Runtime.Python;
+
+namespace CSnakes.Runtime.Tests.Python;
+public class ExceptionTests(PythonEnvironmentFixture fixture) : RuntimeTestBase(fixture)
+{
+    private const string RaisingCode = "int(text)";
+
+    private PythonInvocationException RaiseValueError()
+    {
+        var locals = new Dictionary<string, PyObject>
+        {
+            ["text"] = PyObject.From("not a number")
+        };
+        return Assert.Throws<PythonInvocationException>(() => Env.ExecuteExpression(RaisingCode, locals));
+    }
+
+    [Fact]
+    public void TestFrameIsCapturedOnAccess()
+    {
+        var exception = RaiseValueError();
+        Assert.Equal("ValueError", exception.PythonExceptionType);
+        var inner = Assert.IsType<PythonRuntimeException>(exception.InnerException);
+        Assert.NotEmpty(inner.PythonStackTrace);
+
+        var locals = Assert.IsAssignableFrom<IReadOnlyDictionary<string, PyObject>>(inner.Data["locals"]);
+        Assert.Equal("not a number", locals["text"].ToString());
+        Assert.NotNull(inner.Data["globals"]);
+        // Captured once, so the same dictionary is returned again.
+        Assert.Same(locals, inner.Data["locals"]);
+    }
+
+    [Fact]
+    public void TestLightweightExceptions()
+    {
+        PyObject.LightweightExceptions = true;
+        try
+        {
+            var exception = RaiseValueError();
+            Assert.Equal("ValueError", exception.PythonExceptionType);
+            var inner = Assert.IsType<PythonRuntimeException>(exception.InnerException);
+            Assert.Contains("not a number", inner.Message);
+            Assert.Empty(inner.PythonStackTrace);
+            Assert.Null(inner.Data["locals"]);
+            Assert.Null(inner.Data["globals"]);
+            Assert.Null(inner.InnerException);
+        }
+        finally
+        {
+            PyObject.LightweightExceptions = false;
+        }
+    }
+
+    [Fact]
+    public void TestLightweightExceptionsKeepCustomMessage()
+    {
+        PyObject.LightweightExceptions = true;
+        try
+        {
+            using (GIL.Acquire())
+            {
+                using var number = PyObject.From(42);
+                Assert.Equal(IntPtr.Zero, CPythonAPI.GetAttr(number, "missing"));
+                var exception = Assert.IsType<PythonInvocationException>(PyObject.ThrowPythonExceptionAsClrException("Custom message"));
+                Assert.Equal("Custom message", exception.Message);
+                Assert.Equal("AttributeError", exception.PythonExceptionType);
+                var inner = Assert.IsType<PythonRuntimeException>(exception.InnerException);
+                Assert.Contains("missing", inner.Message);
+            }
+        }
+        finally
+        {
+            PyObject.LightweightExceptions = false;
+        }
+    }
+}
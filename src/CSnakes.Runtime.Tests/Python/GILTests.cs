@@ -1,3 +1,4 @@
+using CSnakes.Runtime.CPython;
 using CSnakes.Runtime.Python;
 
 namespace CSnakes.Runtime.Tests.Python;
@@ -60,6 +61,31 @@ public class GILTests(PythonEnvironmentFixture fixture) : RuntimeTestBase(fixtur
         Assert.False(GIL.IsAcquired); // After outer dispose, GIL should be released
     }
 
+    [Fact]
+    public void RunBatch_HoldsGilForDurationOfAction()
+    {
+        Assert.False(GIL.IsAcquired);
+
+        var acquired = Env.RunBatch(() =>
+        {
+            using var obj = PyObject.From(42L);
+            Assert.Equal("42", obj.ToString());
+            return GIL.IsAcquired;
+        });
+
+        Assert.True(acquired);
+        Assert.False(GIL.IsAcquired); // Released once the batch ends
+    }
+
+    [Fact]
+    public void RunBatch_WhenActionThrows_ReleasesGil()
+    {
+        Assert.Throws<InvalidOperationException>(() =>
+            Env.RunBatch(() => throw new InvalidOperationException()));
+
+        Assert.False(GIL.IsAcquired);
+    }
+
     [Fact]
     public void MultipleThreads_ShouldMaintainCorrectGILState()
     {
@@ -104,4 +130,18 @@ public class GILTests(PythonEnvironmentFixture fixture) : RuntimeTestBase(fixtur
         Assert.True(thread1State.GilIsAcquired);
         Assert.False(thread2State.GilIsAcquired);
     }
+
+    [Fact]
+    public void QueuedDisposals_AreDrainedByReaper()
+    {
+        const int count = GIL.ReaperThreshold * 2;
+        using (GIL.Acquire())
+        {
+            for (int i = 0; i < count; i++)
+                GIL.QueueForDisposal(CPythonAPI.PyLong_FromLongLong(i + 100_000));
+        }
+
+        // Releasing the GIL above drained at most one slice, so the reaper has to do the rest.
+        Assert.True(SpinWait.SpinUntil(() => GIL.PendingDisposals == 0, TimeSpan.FromSeconds(10)));
+    }
 }
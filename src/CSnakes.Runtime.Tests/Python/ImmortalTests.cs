@@ -1,4 +1,5 @@
 using CSnakes.Runtime.Python;
+using CSnakes.Runtime.Python.Interns;
 using System.Numerics;
 
 namespace CSnakes.Runtime.Tests.Python;
@@ -93,3 +94,57 @@ public class ImmortalFalseTests(PythonEnvironmentFixture fixture) :
 
     static TheoryData<bool> IImmortalFromTestCasesContainer<bool>.TestCases => new() { false };
 }
+
+public class SmallIntegerTableTests(PythonEnvironmentFixture fixture) : RuntimeTestBase(fixture)
+{
+    [Theory]
+    [InlineData(-5)]
+    [InlineData(2)]
+    [InlineData(257)]
+    [InlineData(1024)]
+    public void TestFromReturnsSameInstance(long input)
+    {
+        using var first = PyObject.From(input);
+        using var second = PyObject.From(input);
+        Assert.Same(first, second);
+        Assert.Equal(input, first.As<long>());
+    }
+
+    [Theory]
+    [InlineData(-6)]
+    [InlineData(1025)]
+    public void TestFromOutsideRangeCreatesNewObject(long input)
+    {
+        using var first = PyObject.From(input);
+        using var second = PyObject.From(input);
+        Assert.NotSame(first, second);
+        Assert.Equal(input, first.As<long>());
+    }
+
+    [Fact]
+    public void TestDisposeKeepsCachedObjectAlive()
+    {
+        PyObject.From(700L).Dispose();
+        using var value = PyObject.From(700L);
+        Assert.Equal("700", value.ToString());
+    }
+
+    [Fact]
+    public void TestTable()
+    {
+        var table = new SmallIntegerTable(-2, 2);
+        Assert.True(table.TryGet(-2, out var min));
+        Assert.True(table.TryGet(2, out var max));
+        Assert.Equal(-2, min.As<long>());
+        Assert.Equal(2, max.As<long>());
+        Assert.False(table.TryGet(3, out _));
+        using (GIL.Acquire())
+            table.Clear();
+    }
+
+    [Fact]
+    public void TestTableThrowsOnTooLargeRange()
+    {
+        Assert.Throws<ArgumentOutOfRangeException>(() => new SmallIntegerTable(int.MinValue, int.MaxValue));
+    }
+}
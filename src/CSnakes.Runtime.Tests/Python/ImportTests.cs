@@ -66,4 +66,50 @@ public class ImportTests(PythonEnvironmentFixture fixture) : RuntimeTestBase(fix
         string path = ""; // Invalid path
         Assert.Throws<ArgumentException>(() => Import.ImportModule("test_module", source, path));
     }
+
+    private byte[] CompileBytecode(string source, string magicNumber = "__import__('importlib.util').util.MAGIC_NUMBER")
+    {
+        using var pySource = PyObject.From(source);
+        using var bytecode = Env.ExecuteExpression($"{magicNumber} + __import__('marshal').dumps(compile(source, 'elsewhere.py', 'exec'))",
+                                                   new Dictionary<string, PyObject> { ["source"] = pySource });
+        return bytecode.As<byte[]>();
+    }
+
+    [Fact]
+    public void TestImportFromBytecode()
+    {
+        using var bytecode = new MemoryStream(CompileBytecode("value = 'bytecode'\ndef f(): pass"));
+        string path = Path.Join(Environment.CurrentDirectory, "test_bytecode.py");
+
+        using PyObject module = Import.ImportModule("test_bytecode", "value = 'source'"u8, path, bytecode);
+
+        using var value = module.GetAttr("value");
+        Assert.Equal("bytecode", value.As<string>());
+
+        // The code objects report the module's path rather than the one they were compiled with.
+        using var f = module.GetAttr("f");
+        using var code = f.GetAttr("__code__");
+        using var fileName = code.GetAttr("co_filename");
+        Assert.Equal(path, fileName.As<string>());
+    }
+
+    [Fact]
+    public void TestImportFromBytecodeForOtherVersionUsesSource()
+    {
+        using var bytecode = new MemoryStream(CompileBytecode("value = 'bytecode'", magicNumber: "b'\\x00\\x00\\r\\n'"));
+
+        using PyObject module = Import.ImportModule("test_bytecode", "value = 'source'"u8, Environment.CurrentDirectory, bytecode);
+
+        using var value = module.GetAttr("value");
+        Assert.Equal("source", value.As<string>());
+    }
+
+    [Fact]
+    public void TestImportWithoutBytecodeUsesSource()
+    {
+        using PyObject module = Import.ImportModule("test_bytecode", "value = 'source'"u8, Environment.CurrentDirectory, bytecode: null);
+
+        using var value = module.GetAttr("value");
+        Assert.Equal("source", value.As<string>());
+    }
 }
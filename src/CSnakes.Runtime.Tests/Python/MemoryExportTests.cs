@@ -0,0 +1,75 @@
+using CSnakes.Runtime.CPython;
+using CSnakes.Runtime.Python;
+
+namespace CSnakes.Runtime.Tests.Python;
+public class MemoryExportTests(PythonEnvironmentFixture fixture) : RuntimeTestBase(fixture)
+{
+    [Fact]
+    public void TestReadOnlyView()
+    {
+        using var view = PyObject.From((ReadOnlyMemory<double>)new[] { 1.5, 2.5 });
+        Assert.Equal("d", view.GetAttr("format").As<string>());
+        Assert.True(view.GetAttr("readonly").As<bool>());
+        Assert.Equal("[1.5, 2.5]", view.GetAttr("tolist").Call().ToString());
+    }
+
+    [Fact]
+    public void TestFormats()
+    {
+        Assert.Equal("i", Format(new int[] { 1 }));
+        Assert.Equal("q", Format(new long[] { 1 }));
+        Assert.Equal("f", Format(new float[] { 1 }));
+        Assert.Equal("B", Format(new byte[] { 1 }));
+        Assert.Equal("B", Format(new Guid[] { Guid.Empty })); // exposed as raw bytes
+
+        static string Format<T>(T[] values) where T : unmanaged
+        {
+            using var view = PyObject.From((ReadOnlyMemory<T>)values);
+            using var format = view.GetAttr("format");
+            return format.As<string>();
+        }
+    }
+
+    [Fact]
+    public void TestWritableView()
+    {
+        var values = new int[] { 1, 2, 3 };
+        using var view = PyObject.From(values.AsMemory());
+        Assert.False(view.GetAttr("readonly").As<bool>());
+        using var setItem = view.GetAttr("__setitem__");
+        setItem.Call(PyObject.From(0L), PyObject.From(42L)).Dispose();
+        Assert.Equal(42, values[0]);
+    }
+
+    [Fact]
+    public void TestEmptyMemory()
+    {
+        using var view = PyObject.From(ReadOnlyMemory<int>.Empty);
+        Assert.Equal(0, view.GetAttr("nbytes").As<long>());
+    }
+
+    [Fact]
+    public void TestMemoryIsUnpinnedWhenViewIsDestroyed()
+    {
+        var count = CPythonAPI.MemoryExportCount;
+        var view = PyObject.From((ReadOnlyMemory<byte>)new byte[] { 1, 2, 3 });
+        Assert.Equal(count + 1, CPythonAPI.MemoryExportCount);
+        view.Dispose();
+        Assert.Equal(count, CPythonAPI.MemoryExportCount);
+    }
+
+    [Fact]
+    public void TestMemoryStaysPinnedWhileDerivedViewIsAlive()
+    {
+        var count = CPythonAPI.MemoryExportCount;
+        var view = PyObject.From((ReadOnlyMemory<int>)new[] { 1, 2, 3 });
+        PyObject derived;
+        using (var cast = view.GetAttr("cast"))
+            derived = cast.Call(PyObject.From("B"));
+        view.Dispose();
+        Assert.Equal(count + 1, CPythonAPI.MemoryExportCount);
+        Assert.Equal(12, derived.GetAttr("nbytes").As<long>());
+        derived.Dispose();
+        Assert.Equal(count, CPythonAPI.MemoryExportCount);
+    }
+}
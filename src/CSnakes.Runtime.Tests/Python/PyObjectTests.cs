@@ -214,4 +214,49 @@ public class PyObjectTests(PythonEnvironmentFixture fixture) : RuntimeTestBase(f
         var runtimeException = Assert.IsType<PythonRuntimeException>(invocationException.InnerException);
         Assert.Equal("keywords must be strings", runtimeException.Message);
     }
+
+    [Fact]
+    public void CallWithKeywordNames()
+    {
+        using var str = PyObject.From("Hello, World!");
+        using var encode = str.GetAttr("encode");
+        using var kwnames = PyObject.CreateKeywordNames("encoding", "errors");
+        using var encoding = PyObject.From("ascii");
+        using var errors = PyObject.From("strict");
+
+        // Reuse the same names tuple across calls
+        for (var i = 0; i < 2; i++)
+        {
+            using var result = encode.Call([], default, kwnames, [encoding, errors], default);
+            Assert.Equal("Hello, World!"u8.ToArray(), result.As<byte[]>());
+        }
+    }
+
+    [Fact]
+    public void CallWithKeywordNamesAndVariadicKeywords()
+    {
+        using var str = PyObject.From("Hello, World!");
+        using var encode = str.GetAttr("encode");
+        using var kwnames = PyObject.CreateKeywordNames("encoding");
+        using var encoding = PyObject.From("ascii");
+        using var errorsName = PyObject.From("errors");
+        using var errors = PyObject.From("strict");
+
+        using var result = encode.Call([], default, kwnames, [encoding], [new KeywordArg(errorsName, errors)]);
+
+        Assert.Equal("Hello, World!"u8.ToArray(), result.As<byte[]>());
+    }
+
+    [Fact]
+    public void CallWithMismatchedKeywordNamesThrowsException()
+    {
+        using var str = PyObject.From("Hello, World!");
+        using var encode = str.GetAttr("encode");
+        using var kwnames = PyObject.CreateKeywordNames("encoding", "errors");
+        using var encoding = PyObject.From("ascii");
+
+        void Act() => encode.Call([], default, kwnames, [encoding], default).Dispose();
+
+        Assert.Throws<ArgumentException>(Act);
+    }
 }
@@ -0,0 +1,73 @@
+using CSnakes.Runtime.Python;
+
+namespace CSnakes.Runtime.Tests.Python;
+
+public class PythonWorkerPoolTests(PythonEnvironmentFixture fixture) : RuntimeTestBase(fixture)
+{
+    [Fact]
+    public async Task Enqueue_RunsWorkOnDedicatedThreadWithGil()
+    {
+        using var pool = new PythonWorkerPool(1);
+
+        var (threadName, acquired, repr) = await pool.Enqueue(() =>
+        {
+            using var obj = PyObject.From(42L);
+            return (Thread.CurrentThread.Name, GIL.IsAcquired, obj.GetRepr());
+        }, TestContext.Current.CancellationToken);
+
+        Assert.Equal("CSnakes Python Worker #1", threadName);
+        Assert.True(acquired);
+        Assert.Equal("42", repr);
+    }
+
+    [Fact]
+    public async Task Enqueue_ManyItems_CompletesAll()
+    {
+        using var pool = new PythonWorkerPool(2);
+
+        var tasks = Enumerable.Range(0, 100)
+                              .Select(i => pool.Enqueue(() => i * 2, TestContext.Current.CancellationToken))
+                              .ToArray();
+
+        var results = await Task.WhenAll(tasks);
+
+        Assert.Equal(Enumerable.Range(0, 100).Select(i => i * 2), results);
+    }
+
+    [Fact]
+    public async Task Enqueue_WhenWorkThrows_FaultsTask()
+    {
+        using var pool = new PythonWorkerPool(1);
+
+        await Assert.ThrowsAsync<InvalidOperationException>(() =>
+            pool.Enqueue<int>(() => throw new InvalidOperationException(), TestContext.Current.CancellationToken));
+    }
+
+    [Fact]
+    public void Enqueue_AfterDispose_Throws()
+    {
+        var pool = new PythonWorkerPool(1);
+        pool.Dispose();
+
+        Assert.Throws<ObjectDisposedException>(() => pool.Enqueue(() => 1));
+    }
+
+    [Fact]
+    public async Task Dispose_FromWorkItem_DoesNotDeadlock()
+    {
+        var pool = new PythonWorkerPool(2);
+
+        await pool.Enqueue(() => { pool.Dispose(); return 0; }, TestContext.Current.CancellationToken)
+                  .WaitAsync(TimeSpan.FromSeconds(30), TestContext.Current.CancellationToken);
+
+        Assert.Throws<ObjectDisposedException>(() => pool.Enqueue(() => 1));
+    }
+
+    [Fact]
+    public async Task RunAsync_WithoutDedicatedThreads_RunsWithGil()
+    {
+        var acquired = await Env.RunAsync(() => GIL.IsAcquired, TestContext.Current.CancellationToken);
+
+        Assert.True(acquired);
+    }
+}
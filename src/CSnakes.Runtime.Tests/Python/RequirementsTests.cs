@@ -0,0 +1,29 @@
+namespace CSnakes.Runtime.Tests.Python;
+public sealed class RequirementsTests(PythonEnvironmentFixture fixture) : RuntimeTestBase(fixture), IDisposable
+{
+    private readonly string root = Path.Join(Path.GetTempPath(), "csnakes-tests", Guid.NewGuid().ToString("N"));
+
+    public void Dispose() => Directory.Delete(root, recursive: true);
+
+    [Fact]
+    public void TestMissingRequirements()
+    {
+        Directory.CreateDirectory(root);
+        var requirementsPath = Path.Join(root, "requirements.txt");
+        File.WriteAllText(requirementsPath, """
+            # A comment
+            --index-url https://example.invalid/simple
+            csnakes-does-not-exist==1.0  # pinned
+            -r more-requirements.txt
+
+            """);
+        File.WriteAllText(Path.Join(root, "more-requirements.txt"), """
+            csnakes-also-missing[extra]>=2
+            -r requirements.txt
+            """);
+
+        var missing = Env.CsnakesRequirements().MissingRequirements(requirementsPath);
+
+        Assert.Equal(["csnakes-does-not-exist==1.0", "csnakes-also-missing[extra]>=2"], missing);
+    }
+}
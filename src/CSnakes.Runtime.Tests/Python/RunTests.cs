@@ -78,4 +78,48 @@ b = c + a
         Assert.Equal(202, locals["c"].As<long>());
         Assert.Equal(101, locals["b"].As<long>());
     }
+
+    [Fact]
+    public void TestCompileExpressionIsCached()
+    {
+        var first = Env.CompileExpression("1 + 41");
+        var second = Env.CompileExpression("1 + 41");
+        Assert.Same(first, second);
+        Assert.Equal("1 + 41", first.Source);
+        using var result = first.Evaluate();
+        Assert.Equal(42, result.As<long>());
+    }
+
+    [Fact]
+    public void TestCompileExpressionWithBadString()
+    {
+        Assert.Throws<PythonInvocationException>(() => Env.CompileExpression("1+"));
+    }
+
+    [Fact]
+    public void TestCompiledExpressionWithLocals()
+    {
+        var code = Env.CompileExpression("len(items) > limit");
+        using var items = PyObject.From(new long[] { 1, 2, 3 });
+        using var itemsName = PyObject.From("items");
+        using var limitName = PyObject.From("limit");
+
+        foreach (var (limit, expected) in new[] { (2L, true), (3L, false) })
+        {
+            using var limitValue = PyObject.From(limit);
+            using var result = code.Evaluate(new KeywordArg(itemsName, items), new KeywordArg(limitName, limitValue));
+            Assert.Equal(expected, result.As<bool>());
+        }
+    }
+
+    [Fact]
+    public void TestCompiledCodeWithReusedLocals()
+    {
+        var code = Env.Compile("b = a * 2");
+        using var locals = PyObject.From(new Dictionary<string, PyObject> { ["a"] = PyObject.From(21) });
+        using var result = code.Evaluate(locals);
+        Assert.Equal("None", result.ToString());
+        var dict = locals.As<IReadOnlyDictionary<string, long>>();
+        Assert.Equal(42, dict["b"]);
+    }
 }
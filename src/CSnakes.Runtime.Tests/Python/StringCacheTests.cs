@@ -0,0 +1,99 @@
+using CSnakes.Runtime.CPython;
+using CSnakes.Runtime.Python;
+
+namespace CSnakes.Runtime.Tests.Python;
+public class StringCacheTests(PythonEnvironmentFixture fixture) : RuntimeTestBase(fixture)
+{
+    [Fact]
+    public void TestToPythonReturnsSameObject()
+    {
+        using (GIL.Acquire())
+        {
+            var cache = new StringCache(capacity: 8);
+            using var first = PyObject.Create(cache.GetPyString("hello"));
+            using var second = PyObject.Create(cache.GetPyString(new string("hello".AsSpan())));
+            Assert.True(first.Is(second));
+            Assert.Equal(1, cache.Count);
+            cache.Clear();
+        }
+    }
+
+    [Fact]
+    public void TestFromPythonByIdentityAndHash()
+    {
+        using (GIL.Acquire())
+        {
+            var cache = new StringCache(capacity: 8);
+            using var first = PyObject.From("world");
+            using var equal = Env.ExecuteExpression("''.join(['wor', 'ld'])");
+            Assert.False(first.Is(equal));
+
+            var value = cache.GetString(first.DangerousGetHandle());
+            Assert.Equal("world", value);
+            Assert.Same(value, cache.GetString(first.DangerousGetHandle()));
+            Assert.Same(value, cache.GetString(equal.DangerousGetHandle()));
+            cache.Clear();
+        }
+    }
+
+    [Fact]
+    public void TestEvictsLeastRecentlyUsed()
+    {
+        using (GIL.Acquire())
+        {
+            var cache = new StringCache(capacity: 2);
+            foreach (var s in new[] { "a", "b", "a", "c" })
+                CPythonAPI.Py_DecRefRaw(cache.GetPyString(s));
+            Assert.Equal(2, cache.Count);
+
+            using var b = PyObject.From("b");
+            var value = cache.GetString(b.DangerousGetHandle());
+            Assert.Equal("b", value);
+            Assert.Equal(2, cache.Count);
+            cache.Clear();
+            Assert.Equal(0, cache.Count);
+        }
+    }
+
+    [Fact]
+    public void TestLongStringsAreNotCached()
+    {
+        using (GIL.Acquire())
+        {
+            var cache = new StringCache(capacity: 8);
+            var text = new string('x', StringCache.MaxLength + 1);
+            using var obj = PyObject.Create(cache.GetPyString(text));
+            Assert.Equal(text, obj.As<string>());
+            Assert.Equal(0, cache.Count);
+        }
+    }
+
+    [Fact]
+    public void TestStringSubclassesAreNotCached()
+    {
+        using (GIL.Acquire())
+        {
+            var cache = new StringCache(capacity: 8);
+            using var member = Env.ExecuteExpression("__import__('enum').StrEnum('Color', {'RED': 'red'}).RED");
+
+            Assert.Equal("red", cache.GetString(member.DangerousGetHandle()));
+            Assert.Equal(0, cache.Count);
+
+            using var value = PyObject.Create(cache.GetPyString("red"));
+            Assert.Equal("<class 'str'>", value.GetPythonType().ToString());
+            Assert.False(value.Is(member));
+            cache.Clear();
+        }
+    }
+
+    [Fact]
+    public void TestNonStringThrows()
+    {
+        using (GIL.Acquire())
+        {
+            var cache = new StringCache(capacity: 8);
+            using var number = PyObject.From(42);
+            Assert.Throws<PythonInvocationException>(() => cache.GetString(number.DangerousGetHandle()));
+        }
+    }
+}
@@ -1,3 +1,4 @@
+using CSnakes.Runtime.PackageManagement;
 using Microsoft.Extensions.Hosting;
 
 namespace CSnakes.Runtime.Tests;
@@ -25,4 +26,118 @@ public class PythonEnvironmentBuilderTests
         pb.DisableSignalHandlers();
         Assert.False(pb.GetOptions().InstallSignalHandlers);
     }
+
+    [Fact]
+    public void Environment_WithDedicatedPythonThreads_ShouldSetThreadCount()
+    {
+        var builder = Host.CreateApplicationBuilder();
+        var services = builder.Services;
+        var pb = new PythonEnvironmentBuilder(services);
+        Assert.Equal(0, pb.GetOptions().DedicatedPythonThreads);
+        pb.WithDedicatedPythonThreads(2);
+        Assert.Equal(2, pb.GetOptions().DedicatedPythonThreads);
+    }
+
+    [Fact]
+    public void Environment_WithDedicatedPythonThreads_ThrowsOnZero()
+    {
+        var builder = Host.CreateApplicationBuilder();
+        var pb = new PythonEnvironmentBuilder(builder.Services);
+        Assert.Throws<ArgumentOutOfRangeException>(() => pb.WithDedicatedPythonThreads(0));
+    }
+
+    [Fact]
+    public void Environment_WithEventLoops_ShouldSetEventLoopCount()
+    {
+        var builder = Host.CreateApplicationBuilder();
+        var pb = new PythonEnvironmentBuilder(builder.Services);
+        Assert.Equal(1, pb.GetOptions().EventLoopCount);
+        pb.WithEventLoops(4);
+        Assert.Equal(4, pb.GetOptions().EventLoopCount);
+    }
+
+    [Fact]
+    public void Environment_WithEventLoops_ThrowsOnZero()
+    {
+        var builder = Host.CreateApplicationBuilder();
+        var pb = new PythonEnvironmentBuilder(builder.Services);
+        Assert.Throws<ArgumentOutOfRangeException>(() => pb.WithEventLoops(0));
+    }
+
+    [Fact]
+    public void Environment_CapturePythonLogs_ShouldSetLoggingOptions()
+    {
+        var builder = Host.CreateApplicationBuilder();
+        var pb = new PythonEnvironmentBuilder(builder.Services);
+        Assert.Null(pb.GetOptions().LoggingOptions);
+        var options = new PythonLoggingOptions { QueueCapacity = 1_000, DropPolicy = PythonLogDropPolicy.DropNewest };
+        pb.CapturePythonLogs(options);
+        Assert.Same(options, pb.GetOptions().LoggingOptions);
+    }
+
+    [Fact]
+    public void PythonLoggingOptions_ThrowsOnNonPositiveSizes()
+    {
+        Assert.Throws<ArgumentOutOfRangeException>(() => new PythonLoggingOptions { QueueCapacity = 0 });
+        Assert.Throws<ArgumentOutOfRangeException>(() => new PythonLoggingOptions { MaxBatchSize = -1 });
+    }
+
+    [Fact]
+    public void Environment_WithStringCache_ShouldSetStringCacheSize()
+    {
+        var builder = Host.CreateApplicationBuilder();
+        var pb = new PythonEnvironmentBuilder(builder.Services);
+        Assert.Equal(0, pb.GetOptions().StringCacheSize);
+        pb.WithStringCache(1_000);
+        Assert.Equal(1_000, pb.GetOptions().StringCacheSize);
+    }
+
+    [Fact]
+    public void Environment_WithStringCache_ThrowsOnZero()
+    {
+        var builder = Host.CreateApplicationBuilder();
+        var pb = new PythonEnvironmentBuilder(builder.Services);
+        Assert.Throws<ArgumentOutOfRangeException>(() => pb.WithStringCache(0));
+    }
+
+    [Fact]
+    public void Environment_WithSmallIntegerCache_ShouldSetRange()
+    {
+        var builder = Host.CreateApplicationBuilder();
+        var pb = new PythonEnvironmentBuilder(builder.Services);
+        Assert.Equal((-5, 1024), pb.GetOptions().SmallIntegerCache);
+        pb.WithSmallIntegerCache(-10, 4096);
+        Assert.Equal((-10, 4096), pb.GetOptions().SmallIntegerCache);
+        pb.DisableSmallIntegerCache();
+        Assert.Null(pb.GetOptions().SmallIntegerCache);
+    }
+
+    [Fact]
+    public void Environment_WithSmallIntegerCache_ThrowsOnEmptyRange()
+    {
+        var builder = Host.CreateApplicationBuilder();
+        var pb = new PythonEnvironmentBuilder(builder.Services);
+        Assert.Throws<ArgumentOutOfRangeException>(() => pb.WithSmallIntegerCache(10, 0));
+    }
+
+    [Fact]
+    public void Environment_WithLightweightExceptions_ShouldSetOption()
+    {
+        var builder = Host.CreateApplicationBuilder();
+        var pb = new PythonEnvironmentBuilder(builder.Services);
+        Assert.False(pb.GetOptions().LightweightExceptions);
+        pb.WithLightweightExceptions();
+        Assert.True(pb.GetOptions().LightweightExceptions);
+    }
+
+    [Fact]
+    public void Environment_WithRequirementsCheck_ShouldSetOption()
+    {
+        var builder = Host.CreateApplicationBuilder();
+        var pb = new PythonEnvironmentBuilder(builder.Services);
+        Assert.Equal(RequirementsCheck.Hash, pb.GetOptions().RequirementsCheck);
+        pb.WithRequirementsCheck(RequirementsCheck.Verify);
+        Assert.Equal(RequirementsCheck.Verify, pb.GetOptions().RequirementsCheck);
+        Assert.Throws<ArgumentOutOfRangeException>(() => pb.WithRequirementsCheck((RequirementsCheck)42));
+    }
 }
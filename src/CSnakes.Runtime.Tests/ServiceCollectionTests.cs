@@ -1,6 +1,7 @@
 using CSnakes.Runtime.Locators;
 using CSnakes.Runtime.PackageManagement;
 using Microsoft.Extensions.DependencyInjection;
+using Microsoft.Extensions.Hosting;
 using NSubstitute;
 
 namespace CSnakes.Runtime.Tests;
@@ -162,4 +163,21 @@ public class ServiceCollectionTests
         Assert.NotNull(installer);
         Assert.IsType<PipInstaller>(installer);
     }
+
+    [Fact]
+    public void WithHostedStartup_ShouldAddHostedService()
+    {
+        IPythonEnvironmentBuilder builder = Substitute.For<IPythonEnvironmentBuilder>();
+        ServiceCollection services = new();
+        services.AddLogging();
+        builder.Services.Returns(services);
+
+        builder.WithHostedStartup();
+
+        var serviceProvider = services.BuildServiceProvider();
+        var startup = serviceProvider.GetService<PythonEnvironmentStartup>();
+        Assert.NotNull(startup);
+        Assert.Same(startup, Assert.Single(serviceProvider.GetServices<IHostedService>()));
+        Assert.False(startup.IsReady);
+    }
 }
@@ -41,7 +41,9 @@ internal unsafe partial class CPythonAPI
 
     internal static void GetBuffer(PyObject p, out Py_buffer buffer)
     {
-        if (PyObject_GetBuffer(p, out buffer, (int)(PyBUF.Format | PyBUF.CContiguous)) != 0)
+        // Strided buffers are accepted so that slices and transposed arrays can be read without
+        // first being copied into contiguous memory by the exporter.
+        if (PyObject_GetBuffer(p, out buffer, (int)(PyBUF.Format | PyBUF.Strides)) != 0)
         {
             throw PyObject.ThrowPythonExceptionAsClrException();
         }
@@ -35,12 +35,18 @@ internal unsafe partial class CPythonAPI
     internal static IntPtr Call(PyObject callable, ReadOnlySpan<IntPtr> args, ReadOnlySpan<IntPtr> kwnames, ReadOnlySpan<IntPtr> kwvalues)
     {
         // These options are used for efficiency. Don't create a tuple if its not required.
-        if (false /* TODO: Implement vectorcall for kwargs*/ &&
-            PythonVersion.Major == 3 && PythonVersion.Minor > 10)
+        // Vectorcall requires the keyword names to be strings. Unlike PyObject_Call, it doesn't
+        // check for that so use the latter to raise the appropriate error if any are not.
+        if (PythonVersion.Major == 3 && PythonVersion.Minor > 10 && AreAllExactUnicodeRaw(kwnames))
         {
-            fixed (IntPtr* argsPtr = args)
+            var kwnamesTuple = PackTuple(kwnames);
+            try
             {
-                return PyObject_Vectorcall(callable, argsPtr, (nuint)args.Length, IntPtr.Zero);
+                return Vectorcall(callable, args, kwnamesTuple, kwvalues);
+            }
+            finally
+            {
+                Py_DecRefRaw(kwnamesTuple);
             }
         }
         else
@@ -54,6 +60,98 @@ internal unsafe partial class CPythonAPI
         }
     }
 
+    /// <summary>
+    /// Call a callable with positional arguments and keyword arguments whose names are given by
+    /// a prebuilt tuple (see <see cref="PackKeywordNames"/>).
+    /// </summary>
+    /// <param name="callable">Callable object</param>
+    /// <param name="args">Positional arguments</param>
+    /// <param name="kwnames">A tuple of keyword names with the same length as <paramref name="kwvalues"/></param>
+    /// <param name="kwvalues">Keyword argument values</param>
+    /// <returns>A new reference to the result, or null on failure</returns>
+    internal static IntPtr Call(PyObject callable, ReadOnlySpan<IntPtr> args, PyObject kwnames, ReadOnlySpan<IntPtr> kwvalues)
+    {
+        // The caller owns a reference to "kwnames" for the duration of the call.
+        var kwnamesTuple = kwnames.DangerousGetHandle();
+
+        var kwnamesLength = PyTuple_Size(kwnames);
+        if (kwnamesLength < 0)
+            throw PyObject.ThrowPythonExceptionAsClrException();
+        if (kwnamesLength != kwvalues.Length)
+            throw new ArgumentException("The number of keyword names and values must be the same.", nameof(kwnames));
+
+        IntPtr result;
+        if (PythonVersion.Major == 3 && PythonVersion.Minor > 10)
+        {
+            result = Vectorcall(callable, args, kwnamesTuple, kwvalues);
+        }
+        else
+        {
+            var kwargsDict = PyDict_New();
+            for (int i = 0; i < kwvalues.Length; i++)
+            {
+                if (PyDict_SetItemRaw(kwargsDict, PyTuple_GetItemRaw(kwnamesTuple, i), kwvalues[i]) == -1)
+                {
+                    Py_DecRefRaw(kwargsDict);
+                    throw PyObject.ThrowPythonExceptionAsClrException();
+                }
+            }
+            var argsTuple = PackTuple(args);
+            result = PyObject_Call(callable, argsTuple, kwargsDict);
+            Py_DecRefRaw(argsTuple);
+            Py_DecRefRaw(kwargsDict);
+        }
+
+        GC.KeepAlive(kwnames);
+        return result;
+    }
+
+    private static bool AreAllExactUnicodeRaw(ReadOnlySpan<IntPtr> objects)
+    {
+        foreach (var ob in objects)
+        {
+            if (!IsExactPyUnicodeRaw(ob))
+                return false;
+        }
+        return true;
+    }
+
+    /// <summary>
+    /// Set in the <c>nargsf</c> argument of <c>PyObject_Vectorcall</c> to allow the callee to
+    /// temporarily overwrite the slot before the first argument, which saves an allocation when,
+    /// for example, calling bound methods.
+    /// </summary>
+    private static readonly nuint PY_VECTORCALL_ARGUMENTS_OFFSET = (nuint)1 << (IntPtr.Size * 8 - 1);
+
+    private const int VectorcallStackThreshold = 32;
+
+    /// <summary>
+    /// Call a callable using the vectorcall protocol with positional and keyword arguments (3.11+).
+    /// </summary>
+    /// <param name="callable">Callable object</param>
+    /// <param name="args">Positional arguments</param>
+    /// <param name="kwnamesTuple">A tuple of the keyword names, or <see cref="IntPtr.Zero"/> if there are none</param>
+    /// <param name="kwvalues">Keyword argument values, in the same order as the names</param>
+    /// <returns>A new reference to the result, or null on failure</returns>
+    private static IntPtr Vectorcall(PyObject callable, ReadOnlySpan<IntPtr> args, IntPtr kwnamesTuple, ReadOnlySpan<IntPtr> kwvalues)
+    {
+        // Lay out the arguments contiguously, keyword values following positional ones, and
+        // reserve a leading slot for PY_VECTORCALL_ARGUMENTS_OFFSET.
+        var length = 1 + args.Length + kwvalues.Length;
+        Span<IntPtr> buffer = length <= VectorcallStackThreshold
+                            ? stackalloc IntPtr[VectorcallStackThreshold]
+                            : new IntPtr[length];
+        buffer[0] = IntPtr.Zero;
+        args.CopyTo(buffer[1..]);
+        kwvalues.CopyTo(buffer[(1 + args.Length)..]);
+
+        fixed (IntPtr* bufferPtr = buffer)
+        {
+            return PyObject_Vectorcall(callable, bufferPtr + 1, (nuint)args.Length | PY_VECTORCALL_ARGUMENTS_OFFSET,
+                                       kwvalues.IsEmpty ? IntPtr.Zero : kwnamesTuple);
+        }
+    }
+
     /// <summary>
     /// Call a callable with no arguments (3.9+)
     /// </summary>
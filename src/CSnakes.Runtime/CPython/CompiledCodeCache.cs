@@ -0,0 +1,84 @@
+using CSnakes.Runtime.Python;
+
+namespace CSnakes.Runtime.CPython;
+
+/// <summary>
+/// A bounded, least-recently-used cache of compiled Python code objects keyed on the source
+/// text and the start symbol it was compiled with.
+/// </summary>
+internal sealed class CompiledCodeCache(int capacity)
+{
+    private readonly record struct Key(string Source, CPythonAPI.InputType Start);
+
+    private readonly Lock @lock = new();
+    private readonly Dictionary<Key, LinkedListNode<PythonCompiledCode>> entries = [];
+    private readonly LinkedList<PythonCompiledCode> recency = []; // most recently used first
+
+    public int Count
+    {
+        get
+        {
+            lock (@lock)
+                return entries.Count;
+        }
+    }
+
+    /// <summary>
+    /// Gets the compiled code for <paramref name="source"/>, compiling it on a miss and
+    /// evicting the least recently used entry when the cache is full.
+    /// </summary>
+    /// <remarks>
+    /// The GIL must be held by the caller.
+    /// </remarks>
+    public PythonCompiledCode GetOrCompile(string source, CPythonAPI.InputType start)
+    {
+        var key = new Key(source, start);
+
+        lock (@lock)
+        {
+            if (entries.TryGetValue(key, out var node))
+            {
+                recency.Remove(node);
+                recency.AddFirst(node);
+                return node.Value;
+            }
+        }
+
+        // Compile outside the lock; a syntax error surfaces here as an exception and nothing
+        // gets cached.
+
+        var code = new PythonCompiledCode(CPythonAPI.Py_CompileString(source, "<string>", start), source, start);
+
+        lock (@lock)
+        {
+            if (entries.TryGetValue(key, out var node)) // another thread won the race
+            {
+                code.Code.Dispose();
+                return node.Value;
+            }
+
+            entries.Add(key, recency.AddFirst(code));
+
+            if (entries.Count > capacity && recency.Last is { } last)
+            {
+                recency.RemoveLast();
+                _ = entries.Remove(new Key(last.Value.Source, last.Value.Start));
+                // The evicted code object isn't disposed here since it may still be in use by a
+                // caller holding on to it; its reference is released when it gets collected.
+            }
+        }
+
+        return code;
+    }
+
+    public void Clear()
+    {
+        lock (@lock)
+        {
+            foreach (var code in recency)
+                code.Code.Dispose();
+            recency.Clear();
+            entries.Clear();
+        }
+    }
+}
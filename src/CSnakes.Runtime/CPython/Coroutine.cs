@@ -8,36 +8,70 @@ internal unsafe partial class CPythonAPI
         return HasAttr(p, "__await__");
     }
 
-    private static readonly Lock defaultEventLoopLock = new();
-    private static EventLoop? defaultEventLoop = null;
+    internal static bool IsPyAsyncIterator(PyObject p)
+    {
+        return HasAttr(p, "__anext__");
+    }
+
+    private static readonly Lock eventLoopsLock = new();
+    private static EventLoop[]? eventLoops = null;
+    private static int EventLoopCount = 1;
+    private static uint nextEventLoop;
     private static PyObject? AsyncioModule = null;
     private static PyObject? NewEventLoopFactory = null;
     private static PyObject? EnsureFutureFunction;
     private static PyObject? LoopKeyword;
 
-    internal static EventLoop GetDefaultEventLoop()
+    /// <summary>
+    /// Gets one of the event loops that awaitables are run on. When more than one event loop
+    /// has been configured, successive calls hand out the loops in a round-robin fashion.
+    /// </summary>
+    internal static EventLoop GetEventLoop()
+    {
+        var loops = Volatile.Read(ref eventLoops) ?? StartEventLoops();
+        if (loops.Length == 1)
+            return loops[0];
+
+        var index = Interlocked.Increment(ref nextEventLoop) % (uint)loops.Length;
+        return loops[index];
+    }
+
+    private static EventLoop[] StartEventLoops()
     {
         if (AsyncioModule is null)
         {
             throw new InvalidOperationException("Asyncio module not initialized");
         }
 
-        lock (defaultEventLoopLock)
-            return defaultEventLoop ??= EventLoop.RunNewForever();
+        lock (eventLoopsLock)
+        {
+            if (eventLoops is { } loops)
+                return loops;
+
+            loops = new EventLoop[EventLoopCount];
+            for (var i = 0; i < loops.Length; i++)
+                loops[i] = EventLoop.RunNewForever(i);
+
+            Volatile.Write(ref eventLoops, loops);
+            return loops;
+        }
     }
 
     internal static void CloseEventLoops()
     {
-        EventLoop? defaultEventLoop;
+        EventLoop[]? eventLoops;
 
-        lock (defaultEventLoopLock)
+        lock (eventLoopsLock)
         {
-            defaultEventLoop = CPythonAPI.defaultEventLoop;
-            CPythonAPI.defaultEventLoop = null;
+            eventLoops = CPythonAPI.eventLoops;
+            CPythonAPI.eventLoops = null;
         }
 
-        if (defaultEventLoop is { } someDefaultEventLoop)
-            someDefaultEventLoop.Dispose();
+        if (eventLoops is not null)
+        {
+            foreach (var eventLoop in eventLoops)
+                eventLoop.Dispose();
+        }
     }
 
     internal static PyObject EnsureFuture(PyObject obj, PyObject loop) =>
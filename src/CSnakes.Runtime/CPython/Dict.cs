@@ -116,4 +116,74 @@ internal unsafe partial class CPythonAPI
 
     [LibraryImport(PythonLibraryName)]
     internal static partial nint PyDict_Values(PyObject dict);
+
+    /// <summary>
+    /// Try to get the value for <paramref name="key"/> from the dictionary with a single lookup.
+    /// </summary>
+    /// <param name="dict">PyDict object</param>
+    /// <param name="key">Key object</param>
+    /// <param name="value">A new reference to the value, if the key is present.</param>
+    /// <returns><see langword="true"/> if the key is present; otherwise <see langword="false"/>.</returns>
+    /// <exception cref="PythonInvocationException">If the lookup raised, e.g. for an unhashable key.</exception>
+    internal static bool PyDict_TryGetItem(PyObject dict, PyObject key, out nint value)
+    {
+        if (IsGilDisabled)
+        {
+            // A borrowed reference isn't safe without the GIL since another thread may remove the
+            // item, so take a strong one (available from Python 3.13, like free-threading).
+            return PyDict_GetItemRef(dict, key, out value) switch
+            {
+                1 => true,
+                0 => false,
+                _ => throw PyObject.ThrowPythonExceptionAsClrException(),
+            };
+        }
+
+        value = PyDict_GetItemWithError_(dict, key);
+        if (value == IntPtr.Zero)
+        {
+            return PyErr_Occurred() ? throw PyObject.ThrowPythonExceptionAsClrException() : false;
+        }
+        Py_IncRefRaw(value);
+        return true;
+    }
+
+    /// <summary>
+    /// Return the object from dictionary p which has a key `key`.
+    /// Return NULL with an exception set if an exception occurred, or NULL without an exception
+    /// set if the key wasn't present.
+    /// </summary>
+    /// <returns>Borrowed reference.</returns>
+    [LibraryImport(PythonLibraryName, EntryPoint = "PyDict_GetItemWithError")]
+    private static partial nint PyDict_GetItemWithError_(PyObject dict, PyObject key);
+
+    /// <summary>
+    /// Look up the item with the key `key` in the dictionary.
+    /// </summary>
+    /// <returns>1 with a new reference in <paramref name="result"/> if the key is present, 0 if
+    /// it isn't, or -1 with an exception set if an error occurred.</returns>
+    [LibraryImport(PythonLibraryName)]
+    private static partial int PyDict_GetItemRef(PyObject p, PyObject key, out nint result);
+
+    /// <summary>
+    /// Return a new dictionary that contains the same key-value pairs as p.
+    /// </summary>
+    /// <returns>New reference.</returns>
+    [LibraryImport(PythonLibraryName)]
+    internal static partial nint PyDict_Copy(PyObject p);
+
+    /// <summary>
+    /// Iterate over all key-value pairs in the dictionary. <paramref name="pos"/> must be
+    /// initialized to 0 before the first call and is advanced by each call.
+    /// </summary>
+    /// <param name="dict">PyDict object</param>
+    /// <param name="pos">The iteration position.</param>
+    /// <param name="key">Borrowed reference to the key.</param>
+    /// <param name="value">Borrowed reference to the value.</param>
+    /// <returns><see langword="true"/> while a pair was returned; <see langword="false"/> when all pairs have been returned.</returns>
+    internal static bool PyDict_Next(PyObject dict, ref nint pos, out nint key, out nint value) =>
+        PyDict_Next_(dict, ref pos, out key, out value) != 0;
+
+    [LibraryImport(PythonLibraryName, EntryPoint = "PyDict_Next")]
+    private static partial int PyDict_Next_(PyObject dict, ref nint pos, out nint key, out nint value);
 }
@@ -1,16 +1,21 @@
 using CSnakes.Runtime.Python;
 using System.Collections.Concurrent;
 using System.Diagnostics;
+using MetricTag = System.Collections.Generic.KeyValuePair<string, object?>;
 
 namespace CSnakes.Runtime.CPython;
 internal sealed class EventLoop : IDisposable
 {
     private bool disposed;
+    private readonly MetricTag metricTag;
     private readonly PyObject loop = CPythonAPI.NewEventLoop();
     private Methods methods;
     private Task runForeverTask;
     private readonly ConcurrentQueue<Request> requestQueue = new();
-    private readonly PyObject futureLoopStopFunction;
+    private readonly PyObject completedFutures;
+    private readonly PyObject completedFuturesClear;
+    private readonly PyObject futureDoneCallback;
+    private int wakeupPending;
 
     private abstract class Request : IDisposable
     {
@@ -62,6 +67,12 @@ internal sealed class EventLoop : IDisposable
     private sealed class Future(PyObject pyFuture) : IDisposable
     {
         private readonly PyObject pyFuture = pyFuture;
+
+        /// <summary>
+        /// The address of the Python future object, used to match it when its done callback
+        /// reports it as completed.
+        /// </summary>
+        public nint Handle { get; } = pyFuture.DangerousGetHandle();
         private PyObject? doneMethod;
         private CancellationToken cancellationToken;
 
@@ -170,14 +181,27 @@ internal sealed class EventLoop : IDisposable
         }
     }
 
-    public static EventLoop RunNewForever() => new();
+    public static EventLoop RunNewForever(int id = 0) => new(id);
 
-    private EventLoop()
+    private EventLoop(int id)
     {
+        this.metricTag = new MetricTag("csnakes.event_loop.id", id);
         this.methods = new Methods(this.loop);
+
+        // Done callbacks append their future to a list shared with the .NET side and only the
+        // first completion since the list was last drained stops the loop. This way, one wakeup
+        // handles any number of completions and only the futures that are actually done get
+        // concluded instead of polling every outstanding one.
+
         using var vars = PyObject.Create(CPythonAPI.PyDict_New());
-        this.futureLoopStopFunction = CPythonAPI.PyRun_String("lambda fut: fut.get_loop().stop()", CPythonAPI.InputType.Py_eval_input, vars, vars);
-        this.runForeverTask = Task.Run(RunForever);
+        using var callbackFactory = CPythonAPI.PyRun_String("lambda completed, stop: lambda fut: (completed.append(fut), len(completed) == 1 and stop())",
+                                                            CPythonAPI.InputType.Py_eval_input, vars, vars);
+        this.completedFutures = PyObject.Create(CPythonAPI.PyList_New(0));
+        this.completedFuturesClear = this.completedFutures.GetAttr("clear");
+        this.futureDoneCallback = callbackFactory.Call(this.completedFutures, this.methods.Stop);
+        this.runForeverTask = Task.Factory.StartNew(RunForever, CancellationToken.None,
+                                                    TaskCreationOptions.LongRunning,
+                                                    TaskScheduler.Default);
     }
 
     public void Dispose()
@@ -198,7 +222,9 @@ internal sealed class EventLoop : IDisposable
 
         this.methods.Dispose();
         this.loop.Dispose();
-        this.futureLoopStopFunction.Dispose();
+        this.futureDoneCallback.Dispose();
+        this.completedFuturesClear.Dispose();
+        this.completedFutures.Dispose();
         this.disposed = true;
     }
 
@@ -213,7 +239,12 @@ internal sealed class EventLoop : IDisposable
     private void Enqueue(Request request)
     {
         this.requestQueue.Enqueue(request);
-        _ = this.methods.CallSoonThreadSafe.Call(this.methods.Stop);
+
+        // Only wake up the event loop if a wakeup is not already pending; the pending one will
+        // drain this request along with any others queued before it is serviced.
+
+        if (Interlocked.Exchange(ref this.wakeupPending, 1) == 0)
+            this.methods.CallSoonThreadSafe.Call(this.methods.Stop).Dispose();
     }
 
     enum RunState
@@ -225,7 +256,10 @@ internal sealed class EventLoop : IDisposable
     private void RunForever()
     {
         var state = RunState.Running;
-        var futures = new List<Future>();
+        // The same Python future can be awaited more than once, since ensure_future returns a
+        // future or task as is, so each .NET future is kept in a list for its Python object.
+        var futures = new Dictionary<nint, List<Future>>();
+        var completed = new List<Future>();
 
         do
         {
@@ -238,6 +272,13 @@ internal sealed class EventLoop : IDisposable
 
             _ = this.methods.RunForever.Call();
 
+            var wakeupTimestamp = Stopwatch.GetTimestamp();
+
+            // Clear the pending wakeup before draining so that a request enqueued after the
+            // queue has been drained schedules a new wakeup.
+
+            _ = Interlocked.Exchange(ref this.wakeupPending, 0);
+
             while (requestQueue.TryDequeue(out var poppedRequest))
             {
                 using (poppedRequest)
@@ -287,8 +328,14 @@ internal sealed class EventLoop : IDisposable
                                 var future = new Future(pyFuture);
                                 disposable = future; // yield ownership
 
-                                using (var addDoneCallbackMethod = pyFuture.GetAttr("add_done_callback"))
-                                    _ = addDoneCallbackMethod.Call(this.futureLoopStopFunction);
+                                // The done callback is only added once per Python future, and
+                                // reports it for all the .NET futures awaiting it.
+
+                                if (!futures.TryGetValue(future.Handle, out var awaiting))
+                                {
+                                    using (var addDoneCallbackMethod = pyFuture.GetAttr("add_done_callback"))
+                                        addDoneCallbackMethod.Call(this.futureDoneCallback).Dispose();
+                                }
 
                                 if (request.CancellationToken is { CanBeCanceled: true } cancellationToken)
                                 {
@@ -306,7 +353,10 @@ internal sealed class EventLoop : IDisposable
                                 // Create a "TaskCompletionSource" to represent the future on the
                                 // .NET side and add it to the list of futures.
 
-                                futures.Add(future);
+                                if (awaiting is null)
+                                    futures.Add(future.Handle, awaiting = []);
+                                awaiting.Add(future);
+                                RuntimeMetrics.EventLoopPendingFutures.Add(1, this.metricTag);
 
                                 // Signal that the future was successfully scheduled.
 
@@ -333,7 +383,7 @@ internal sealed class EventLoop : IDisposable
                         case (StopRequest, RunState.Running):
                         {
                             state = RunState.Stopping;
-                            foreach (var future in futures)
+                            foreach (var future in futures.Values.SelectMany(awaiting => awaiting))
                                 future.Cancel(CancellationToken.None);
                             break;
                         }
@@ -341,11 +391,55 @@ internal sealed class EventLoop : IDisposable
                 }
             }
 
-            _ = futures.RemoveAll(t => t.Conclude());
+            TakeCompletedFutures(futures, completed);
+
+            foreach (var future in completed)
+            {
+                if (future.Conclude())
+                {
+                    var awaiting = futures[future.Handle];
+                    _ = awaiting.Remove(future);
+                    if (awaiting.Count == 0)
+                        _ = futures.Remove(future.Handle);
+                    RuntimeMetrics.EventLoopPendingFutures.Add(-1, this.metricTag);
+                }
+            }
+
+            completed.Clear();
+
+            RuntimeMetrics.EventLoopIterationTime.Record(Stopwatch.GetElapsedTime(wakeupTimestamp).TotalSeconds, this.metricTag);
         }
         while (state is RunState.Running || futures.Count > 0);
     }
 
+    /// <summary>
+    /// Moves the futures reported by the done callback since the last call into <paramref
+    /// name="completed"/> and clears the Python list of completed futures.
+    /// </summary>
+    private void TakeCompletedFutures(Dictionary<nint, List<Future>> futures, List<Future> completed)
+    {
+        using (GIL.Acquire())
+        {
+            var count = CPythonAPI.PyList_Size(this.completedFutures);
+            if (count == 0)
+                return;
+
+            for (nint i = 0; i < count; i++)
+            {
+                // Only the identity of the item is needed and the list keeps it alive until
+                // it is cleared, so the new reference can be released straight away.
+
+                var item = CPythonAPI.PyList_GetItem(this.completedFutures, i);
+                CPythonAPI.Py_DecRefRaw(item);
+
+                if (futures.TryGetValue(item, out var awaiting))
+                    completed.AddRange(awaiting);
+            }
+
+            this.completedFuturesClear.Call().Dispose();
+        }
+    }
+
     private struct Methods(PyObject loop) : IDisposable
     {
         private PyObject? callSoonThreadSafe;
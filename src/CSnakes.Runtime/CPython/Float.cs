@@ -33,6 +33,9 @@ internal unsafe partial class CPythonAPI
     [LibraryImport(PythonLibraryName, EntryPoint = "PyFloat_AsDouble")]
     private static partial double PyFloat_AsDouble_(PyObject obj);
 
+    [LibraryImport(PythonLibraryName, EntryPoint = "PyFloat_AsDouble")]
+    private static partial double PyFloat_AsDoubleRaw(nint obj);
+
     internal static bool IsPyFloat(PyObject p)
     {
         return PyObject_IsInstance(p, PyFloatType);
@@ -0,0 +1,29 @@
+using CSnakes.Runtime.Python;
+
+namespace CSnakes.Runtime.CPython;
+
+internal unsafe partial class CPythonAPI
+{
+    /// <summary>
+    /// Indicates whether the interpreter is a free-threaded build that was running without the GIL
+    /// when it was initialized.
+    /// </summary>
+    /// <remarks>
+    /// Threads still attach to and detach from the interpreter through <see cref="GIL.Acquire"/>,
+    /// but doing so doesn't serialize them. Importing an extension module that doesn't support
+    /// free-threading can turn the GIL back on at any time, so this must not be relied on where
+    /// waiting for the GIL could deadlock, such as on the finalizer thread.
+    /// </remarks>
+    internal static bool IsGilDisabled { get; private set; }
+
+    private static bool GetIsGilDisabled()
+    {
+        using var sys = Import("sys");
+        if (!HasAttr(sys, "_is_gil_enabled")) // before Python 3.13
+            return false;
+
+        using var isGilEnabled = PyObject.Create(GetAttr(sys, "_is_gil_enabled"));
+        using var result = isGilEnabled.Call();
+        return PyObject_IsTrue(result) == 0;
+    }
+}
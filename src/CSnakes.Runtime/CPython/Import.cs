@@ -1,4 +1,5 @@
 using CSnakes.Runtime.Python;
+using System.Buffers.Binary;
 using System.Runtime.InteropServices;
 using System.Runtime.InteropServices.Marshalling;
 
@@ -35,6 +36,43 @@ internal unsafe partial class CPythonAPI
         return PyObject.Create(PyImport_ExecCodeModuleObject(pyName, codeObject, pyPath, pyPath));
     }
 
+    /// <summary>
+    /// Imports a module from its code object, marshalled with <c>marshal.dumps</c> and prefixed with
+    /// the magic number of the Python that marshalled it, as given by <c>importlib.util.MAGIC_NUMBER</c>.
+    /// </summary>
+    /// <returns>
+    /// A new reference to the module, or <see langword="null"/> if the bytecode is for another
+    /// version of Python.
+    /// </returns>
+    internal static PyObject? ImportBytecode(string name, ReadOnlySpan<byte> bytecode, string path)
+    {
+        var magic = PyImport_GetMagicNumber().Value;
+        if (magic == -1)
+        {
+            PyErr_Clear();
+            return null;
+        }
+
+        if (bytecode.Length < sizeof(uint) || BinaryPrimitives.ReadUInt32LittleEndian(bytecode) != (uint)magic)
+            return null;
+
+        var marshalled = bytecode[sizeof(uint)..];
+        nint code;
+        fixed (byte* data = marshalled)
+            code = PyMarshal_ReadObjectFromString(data, marshalled.Length);
+
+        using var codeObject = PyObject.Create(code);
+        using var pyPath = PyObject.From(path);
+
+        // Point the code objects at the module's path, as importlib does for cached bytecode.
+        using (var imp = Import("_imp"))
+        using (var fixCodeFileName = imp.GetAttr("_fix_co_filename"))
+            fixCodeFileName.Call(codeObject, pyPath).Dispose();
+
+        using var pyName = PyObject.From(name);
+        return PyObject.Create(PyImport_ExecCodeModuleObject(pyName, codeObject, pyPath, pyPath));
+    }
+
     internal static PyObject ReloadModule(PyObject module)
     {
         nint reloaded = PyImport_ReloadModule(module);
@@ -65,6 +103,12 @@ internal unsafe partial class CPythonAPI
     internal static partial nint PyImport_Import(nint name);
 
 
+    [LibraryImport(PythonLibraryName)]
+    private static partial CLong PyImport_GetMagicNumber();
+
+    [LibraryImport(PythonLibraryName)]
+    private static partial nint PyMarshal_ReadObjectFromString(byte* data, nint len);
+
     [LibraryImport(PythonLibraryName)]
     private static partial nint PyImport_ExecCodeModuleObject(PyObject name, PyObject co, PyObject pathname, PyObject cpathname);
 
@@ -20,9 +20,15 @@ internal unsafe partial class CPythonAPI : IDisposable
     private readonly TaskCompletionSource finalizationTaskCompletionSource = new();
     private readonly bool initSignalHandlers;
 
-    public CPythonAPI(string pythonLibraryPath, Version version, string pythonExecutablePath, bool initSignalHandlers = true)
+    public CPythonAPI(string pythonLibraryPath, Version version, string pythonExecutablePath, bool initSignalHandlers = true, int eventLoopCount = 1, int stringCacheSize = 0, (int Min, int Max)? smallIntegerCache = null, bool lightweightExceptions = false)
     {
+        ArgumentOutOfRangeException.ThrowIfNegativeOrZero(eventLoopCount);
+        ArgumentOutOfRangeException.ThrowIfNegative(stringCacheSize);
         PythonVersion = version;
+        EventLoopCount = eventLoopCount;
+        StringCache = stringCacheSize > 0 ? new StringCache(stringCacheSize) : null;
+        PyObject.SmallIntegers = smallIntegerCache is var (min, max) ? new SmallIntegerTable(min, max) : null;
+        PyObject.LightweightExceptions = lightweightExceptions;
         CPythonAPI.pythonLibraryPath = pythonLibraryPath;
         CPythonAPI.pythonExecutablePath = pythonExecutablePath;
         this.initSignalHandlers = initSignalHandlers;
@@ -175,8 +181,11 @@ internal unsafe partial class CPythonAPI : IDisposable
             EnsureFutureFunction = PyObject.Create(CPythonAPI.GetAttr(AsyncioModule, "ensure_future"));
             if (pythonExecutablePath is not null)
                 SetSysExecutable(pythonExecutablePath);
+            IsGilDisabled = GetIsGilDisabled();
         }
 
+        GIL.EnableReaper();
+
         return tstate;
     }
 
@@ -216,6 +225,8 @@ internal unsafe partial class CPythonAPI : IDisposable
         if (!IsInitialized)
             return;
 
+        GIL.DisableReaper();
+
         // Shut down asyncio coroutines
         CloseEventLoops();
 
@@ -224,16 +235,29 @@ internal unsafe partial class CPythonAPI : IDisposable
         EnsureFutureFunction?.Dispose();
         LoopKeyword?.Dispose();
         AsyncioModule?.Dispose();
+        CompiledCode.Clear();
+        ClearMemoryExports();
+        if (StringCache is { } stringCache)
+        {
+            using (GIL.Acquire())
+                stringCache.Clear();
+        }
+        if (PyObject.SmallIntegers is { } smallIntegers)
+        {
+            using (GIL.Acquire())
+                smallIntegers.Clear();
+        }
         // TODO: Add more cleanup code here
 
         Debug.WriteLine($"Calling Py_Finalize() on thread {GetNativeThreadId()}");
 
-        // Acquire the GIL only to dispose it immediately because `PyGILState_Release`
-        // is not available after `Py_Finalize` is called. This is done primarily to
-        // trigger the disposal of handles that have been queued before the Python
-        // runtime is finalized.
+        // Dispose the handles that have been queued before the Python runtime is
+        // finalized, all at once since the reaper has been stopped. The GIL is
+        // released again because `PyGILState_Release` is not available after
+        // `Py_Finalize` is called.
 
-        GIL.Acquire().Dispose();
+        using (GIL.Acquire())
+            GIL.DrainDisposalQueues();
 
         PyEval_RestoreThread(initializationTState);
         Py_Finalize();
@@ -15,4 +15,31 @@ internal unsafe partial class CPythonAPI
     /// <returns>New refernce to the next item</returns>
     [LibraryImport(PythonLibraryName)]
     internal static partial nint PyIter_Next(PyObject iter);
+
+    internal enum PySendResult
+    {
+        /// <summary>The iterator returned; the result is the return value.</summary>
+        Return = 0,
+        /// <summary>An exception was raised; the result is NULL.</summary>
+        Error = -1,
+        /// <summary>The iterator yielded; the result is the yielded value.</summary>
+        Next = 1,
+    }
+
+    /// <summary>
+    /// Whether <see cref="PyIter_Send"/> is available (3.10+).
+    /// </summary>
+    internal static bool IsPyIterSendSupported => PythonVersion.Major == 3 && PythonVersion.Minor >= 10;
+
+    /// <summary>
+    /// Send the value into the iterator. Unlike calling the <c>send</c> method,
+    /// the end of iteration is signalled by the result code rather than by raising
+    /// <c>StopIteration</c> (3.10+).
+    /// </summary>
+    /// <param name="iter">The iterator</param>
+    /// <param name="arg">The value to send</param>
+    /// <param name="presult">A new reference to the yielded or returned value, or NULL on error</param>
+    /// <returns>The result code</returns>
+    [LibraryImport(PythonLibraryName)]
+    internal static partial PySendResult PyIter_Send(PyObject iter, PyObject arg, out nint presult);
 }
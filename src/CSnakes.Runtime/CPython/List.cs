@@ -49,6 +49,9 @@ internal unsafe partial class CPythonAPI
     [LibraryImport(PythonLibraryName, EntryPoint = "PyList_GetItem")]
     private static partial nint PyList_GetItem_(PyObject obj, nint pos);
 
+    [LibraryImport(PythonLibraryName, EntryPoint = "PyList_GetItem")]
+    private static partial nint PyList_GetItemRaw(nint obj, nint pos);
+
     internal static int PyList_SetItemRaw(nint ob, nint pos, nint o)
     {
         int result = PyList_SetItem_(ob, pos, o);
@@ -1,4 +1,5 @@
 using CSnakes.Runtime.Python;
+using System.Numerics;
 using System.Runtime.InteropServices;
 
 namespace CSnakes.Runtime.CPython;
@@ -31,6 +32,9 @@ internal unsafe partial class CPythonAPI
     [LibraryImport(PythonLibraryName, EntryPoint = "PyLong_AsLongLong")]
     private static partial long PyLong_AsLongLong_(PyObject p);
 
+    [LibraryImport(PythonLibraryName, EntryPoint = "PyLong_AsLongLong")]
+    private static partial long PyLong_AsLongLongRaw(nint p);
+
     internal static bool IsPyLong(PyObject p)
     {
         return PyObject_IsInstance(p, PyLongType);
@@ -38,4 +42,125 @@ internal unsafe partial class CPythonAPI
 
     [LibraryImport(PythonLibraryName)]
     internal static partial nint PyLong_FromUnicodeObject(PyObject unicode, int @base);
+
+    /// <summary>
+    /// Largest buffer, in bytes, used on the stack when converting to and from <see cref="BigInteger"/>.
+    /// </summary>
+    private const int BigIntegerStackBufferSize = 256;
+
+    private const int Py_ASNATIVEBYTES_LITTLE_ENDIAN = 1;
+
+    /// <summary>
+    /// Whether <c>PyLong_AsNativeBytes</c> and <c>PyLong_FromNativeBytes</c> are available (3.13+).
+    /// Earlier versions use the private <c>_PyLong_AsByteArray</c> and <c>_PyLong_FromByteArray</c>.
+    /// </summary>
+    private static bool IsPyLongNativeBytesSupported => PythonVersion.Major == 3 && PythonVersion.Minor >= 13;
+
+    /// <summary>
+    /// Converts a Python int to a <see cref="BigInteger"/> by copying its two's-complement bytes
+    /// rather than formatting and parsing its decimal representation.
+    /// </summary>
+    internal static BigInteger PyLong_AsBigInteger(PyObject p)
+    {
+        if (IsPyLongNativeBytesSupported)
+        {
+            Span<byte> buffer = stackalloc byte[BigIntegerStackBufferSize];
+            var length = PyLong_AsNativeBytes(p, buffer);
+            if (length > buffer.Length)
+            {
+                buffer = new byte[length];
+                length = PyLong_AsNativeBytes(p, buffer);
+            }
+            return new BigInteger(buffer[..length], isUnsigned: false, isBigEndian: false);
+        }
+        else
+        {
+            var bits = _PyLong_NumBits(p);
+            if (bits == nuint.MaxValue)
+                throw PyObject.ThrowPythonExceptionAsClrException();
+
+            // One extra byte leaves room for the sign bit.
+            var length = checked((int)(bits / 8) + 1);
+            Span<byte> buffer = length <= BigIntegerStackBufferSize ? stackalloc byte[length] : new byte[length];
+            fixed (byte* ptr = buffer)
+            {
+                if (_PyLong_AsByteArray(p, ptr, (nuint)length, little_endian: 1, is_signed: 1) == -1)
+                    throw PyObject.ThrowPythonExceptionAsClrException();
+            }
+            return new BigInteger(buffer, isUnsigned: false, isBigEndian: false);
+        }
+    }
+
+    private static int PyLong_AsNativeBytes(PyObject p, Span<byte> buffer)
+    {
+        nint result;
+        fixed (byte* ptr = buffer)
+            result = PyLong_AsNativeBytes(p, ptr, buffer.Length, Py_ASNATIVEBYTES_LITTLE_ENDIAN);
+        if (result < 0)
+            throw PyObject.ThrowPythonExceptionAsClrException();
+        return checked((int)result);
+    }
+
+    /// <summary>
+    /// Creates a Python int from a <see cref="BigInteger"/> by copying its two's-complement bytes
+    /// rather than formatting and parsing its decimal representation.
+    /// </summary>
+    /// <returns>A new reference to the int object.</returns>
+    internal static nint PyLong_FromBigInteger(BigInteger value)
+    {
+        var length = value.GetByteCount();
+        Span<byte> buffer = length <= BigIntegerStackBufferSize ? stackalloc byte[length] : new byte[length];
+        _ = value.TryWriteBytes(buffer, out var written, isUnsigned: false, isBigEndian: false);
+
+        nint result;
+        fixed (byte* ptr = buffer)
+        {
+            result = IsPyLongNativeBytesSupported
+                ? PyLong_FromNativeBytes(ptr, (nuint)written, Py_ASNATIVEBYTES_LITTLE_ENDIAN)
+                : _PyLong_FromByteArray(ptr, (nuint)written, little_endian: 1, is_signed: 1);
+        }
+
+        if (result == IntPtr.Zero)
+            throw PyObject.ThrowPythonExceptionAsClrException();
+        return result;
+    }
+
+    /// <summary>
+    /// Copy the two's-complement value of an int into a buffer (3.13+).
+    /// </summary>
+    /// <returns>
+    /// The number of bytes needed to store the value including a sign bit, which may be larger
+    /// than <paramref name="n_bytes"/>, or -1 with an exception set on failure.
+    /// </returns>
+    [LibraryImport(PythonLibraryName)]
+    private static partial nint PyLong_AsNativeBytes(PyObject v, byte* buffer, nint n_bytes, int flags);
+
+    /// <summary>
+    /// Create an int from a buffer holding a two's-complement value (3.13+).
+    /// </summary>
+    /// <returns>A new reference to the int object.</returns>
+    [LibraryImport(PythonLibraryName)]
+    private static partial nint PyLong_FromNativeBytes(byte* buffer, nuint n_bytes, int flags);
+
+    /// <summary>
+    /// Return the number of bits needed to represent the absolute value of an int, or
+    /// <c>(size_t)-1</c> with an exception set on overflow.
+    /// </summary>
+    [LibraryImport(PythonLibraryName)]
+    private static partial nuint _PyLong_NumBits(PyObject v);
+
+    /// <summary>
+    /// Copy the value of an int into a buffer. Only used before 3.13, where this signature is
+    /// still current.
+    /// </summary>
+    /// <returns>0 on success, or -1 with an exception set on failure.</returns>
+    [LibraryImport(PythonLibraryName)]
+    private static partial int _PyLong_AsByteArray(PyObject v, byte* bytes, nuint n, int little_endian, int is_signed);
+
+    /// <summary>
+    /// Create an int from a buffer holding its value.
+    /// </summary>
+    /// <returns>A new reference to the int object.</returns>
+    [LibraryImport(PythonLibraryName)]
+    private static partial nint _PyLong_FromByteArray(byte* bytes, nuint n, int little_endian, int is_signed);
 }
@@ -0,0 +1,319 @@
+using CSnakes.Runtime.Python;
+using System.Buffers;
+using System.Runtime.CompilerServices;
+using System.Runtime.InteropServices;
+using System.Runtime.InteropServices.Marshalling;
+
+namespace CSnakes.Runtime.CPython;
+
+internal unsafe partial class CPythonAPI
+{
+    /// <summary>
+    /// Represents <see href="https://docs.python.org/3/c-api/type.html#c.PyType_Spec"><c>PyType_Spec</c></see>.
+    /// </summary>
+    [StructLayout(LayoutKind.Sequential)]
+    private struct PyType_Spec
+    {
+        public byte*        /* const char*  */ name;
+        public int          /* int          */ basicsize;
+        public int          /* int          */ itemsize;
+        public uint         /* unsigned int */ flags;
+        public PyType_Slot* /* PyType_Slot* */ slots;
+    }
+
+    /// <summary>
+    /// Represents <see href="https://docs.python.org/3/c-api/type.html#c.PyType_Slot"><c>PyType_Slot</c></see>.
+    /// </summary>
+    [StructLayout(LayoutKind.Sequential)]
+    private struct PyType_Slot
+    {
+        public int   /* int   */ slot;
+        public void* /* void* */ pfunc;
+    }
+
+    private const int Py_bf_getbuffer = 1;
+    private const int Py_tp_dealloc = 52;
+    private const int Py_tp_free = 74;
+
+    private const uint Py_TPFLAGS_DISALLOW_INSTANTIATION = 1 << 7;
+    private const uint Py_TPFLAGS_DEFAULT = 1 << 18;
+
+    /// <summary>
+    /// Managed memory exported to Python, and how to describe it to a buffer request.
+    /// </summary>
+    private readonly struct MemoryExport(MemoryHandle pin, void* buf, nint format, nint itemSize, nint length, bool writable)
+    {
+        public readonly MemoryHandle Pin = pin;
+        public readonly void* Buf = buf;
+        public readonly nint Format = format;
+        public readonly nint ItemSize = itemSize;
+        public readonly nint Length = length;
+        public readonly bool Writable = writable;
+
+        /// <summary>
+        /// The shape followed by the strides, which a buffer refers to rather than copies, so they
+        /// are allocated for as long as the export.
+        /// </summary>
+        public readonly nint* ShapeAndStrides = AllocShapeAndStrides(length, itemSize);
+
+        private static nint* AllocShapeAndStrides(nint length, nint itemSize)
+        {
+            var shapeAndStrides = (nint*)NativeMemory.Alloc(2, (nuint)sizeof(nint));
+            shapeAndStrides[0] = length;
+            shapeAndStrides[1] = itemSize;
+            return shapeAndStrides;
+        }
+
+        public void Release()
+        {
+            Pin.Dispose();
+            NativeMemory.Free(ShapeAndStrides);
+        }
+    }
+
+    private static readonly Lock MemoryExportLock = new();
+
+    /// <summary>
+    /// Managed memory exported to Python, keyed on the exporter object. Every <c>memoryview</c>
+    /// over the memory, including ones derived from another through slicing or
+    /// <c>memoryview.cast</c>, holds a reference to the exporter in <c>Py_buffer.obj</c>, so an
+    /// entry is removed, and its memory unpinned, only once the last of them has been destroyed
+    /// and the exporter is deallocated.
+    /// </summary>
+    private static readonly Dictionary<nint, MemoryExport> MemoryExports = [];
+
+    /// <summary>
+    /// The type of the exporter objects, created on first use.
+    /// </summary>
+    private static nint memoryExportType;
+
+    /// <summary>
+    /// The <c>BufferError</c> type, raised when a buffer is requested from an exporter that is no
+    /// longer registered.
+    /// </summary>
+    private static nint memoryExportBufferError;
+
+    /// <summary>
+    /// Zero-terminated <c>struct</c> module format strings, allocated once because a
+    /// <c>memoryview</c> refers to the format of the buffer it was created from for its lifetime.
+    /// </summary>
+    private static readonly Dictionary<string, nint> BufferFormats = [];
+
+    /// <summary>
+    /// Stands in for the address of empty memory, which a <c>memoryview</c> can't be created over.
+    /// </summary>
+    private static readonly nint EmptyBuffer = (nint)NativeMemory.AllocZeroed(1);
+
+    internal static int MemoryExportCount
+    {
+        get
+        {
+            lock (MemoryExportLock)
+                return MemoryExports.Count;
+        }
+    }
+
+    /// <summary>
+    /// Creates a <c>memoryview</c> over <paramref name="memory"/> without copying it. The memory
+    /// stays pinned for as long as the <c>memoryview</c>, or any object exporting from it such as
+    /// a NumPy array created with <c>numpy.frombuffer</c>, is alive.
+    /// </summary>
+    /// <returns>A new reference to the <c>memoryview</c>.</returns>
+    internal static nint ExportMemory<T>(ReadOnlyMemory<T> memory, bool writable) where T : unmanaged
+    {
+        var (format, itemSize, length) = GetBufferFormat<T>(memory.Length);
+        var type = GetMemoryExportType();
+
+        var pin = memory.Pin();
+        nint exporter = IntPtr.Zero;
+        try
+        {
+            exporter = PyType_GenericAlloc(type, 0);
+            if (exporter == IntPtr.Zero)
+                throw PyObject.ThrowPythonExceptionAsClrException();
+
+            var buf = memory.IsEmpty ? (void*)EmptyBuffer : pin.Pointer;
+            lock (MemoryExportLock)
+                MemoryExports.Add(exporter, new MemoryExport(pin, buf, format, itemSize, length, writable));
+        }
+        catch
+        {
+            if (exporter != IntPtr.Zero)
+                Py_DecRefRaw(exporter);
+            pin.Dispose();
+            throw;
+        }
+
+        // From here on, deallocating the exporter releases the export.
+        var view = PyMemoryView_FromObject(exporter);
+        Py_DecRefRaw(exporter);
+        if (view == IntPtr.Zero)
+            throw PyObject.ThrowPythonExceptionAsClrException();
+
+        return view;
+    }
+
+    private static (nint Format, nint ItemSize, nint Length) GetBufferFormat<T>(int length) where T : unmanaged
+    {
+        var code = default(T) switch
+        {
+            bool => "?",
+            byte => "B",
+            sbyte => "b",
+            short => "h",
+            ushort => "H",
+            int => "i",
+            uint => "I",
+            long => "q",
+            ulong => "Q",
+            Half => "e",
+            float => "f",
+            double => "d",
+            _ => null,
+        };
+
+        nint itemSize = sizeof(T);
+        nint count = length;
+
+        if (code is null)
+        {
+            // Other unmanaged types are exposed as their raw bytes.
+            code = "B";
+            count *= itemSize;
+            itemSize = 1;
+        }
+
+        lock (MemoryExportLock)
+        {
+            if (!BufferFormats.TryGetValue(code, out var format))
+            {
+                format = Marshal.StringToCoTaskMemUTF8(code);
+                BufferFormats.Add(code, format);
+            }
+            return (format, itemSize, count);
+        }
+    }
+
+    private static nint GetMemoryExportType()
+    {
+        lock (MemoryExportLock)
+        {
+            if (memoryExportType != IntPtr.Zero)
+                return memoryExportType;
+
+            // The name is referred to by the type, so the specification is never freed.
+
+            var slots = (PyType_Slot*)NativeMemory.AllocZeroed(3, (nuint)sizeof(PyType_Slot));
+            slots[0] = new() { slot = Py_bf_getbuffer, pfunc = (delegate* unmanaged[Cdecl]<nint, Py_buffer*, int, int>)&GetMemoryExportBuffer };
+            slots[1] = new() { slot = Py_tp_dealloc, pfunc = (delegate* unmanaged[Cdecl]<nint, void>)&DeallocMemoryExport };
+
+            var spec = (PyType_Spec*)NativeMemory.AllocZeroed((nuint)sizeof(PyType_Spec));
+            spec->name = (byte*)Marshal.StringToCoTaskMemUTF8("csnakes.MemoryExport");
+            spec->flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_DISALLOW_INSTANTIATION;
+            spec->slots = slots;
+
+            var type = PyType_FromSpec(spec);
+            if (type == IntPtr.Zero)
+                throw PyObject.ThrowPythonExceptionAsClrException();
+
+            memoryExportBufferError = GetBuiltin("BufferError");
+            return memoryExportType = type;
+        }
+    }
+
+    /// <summary>
+    /// Called by Python, with the GIL held, to fill in <paramref name="view"/> for a buffer request
+    /// on an exporter, such as when a <c>memoryview</c> is created from it.
+    /// </summary>
+    [UnmanagedCallersOnly(CallConvs = [typeof(CallConvCdecl)])]
+    private static int GetMemoryExportBuffer(nint exporter, Py_buffer* view, int flags)
+    {
+        bool found;
+        MemoryExport export;
+        lock (MemoryExportLock)
+            found = MemoryExports.TryGetValue(exporter, out export);
+
+        if (!found)
+        {
+            view->obj = null;
+            PyErr_SetString(memoryExportBufferError, "exported memory has been released");
+            return -1;
+        }
+
+        // Fills in a buffer of unsigned bytes, checks a writable request against a read-only
+        // export, and takes the reference to the exporter that is released with the buffer.
+        if (PyBuffer_FillInfo(view, exporter, export.Buf, export.Length * export.ItemSize, export.Writable ? 0 : 1, flags) != 0)
+            return -1;
+
+        var request = (PyBUF)flags;
+        if ((request & PyBUF.Format) == PyBUF.Format)
+            view->format = (byte*)export.Format;
+        if ((request & PyBUF.ND) == PyBUF.ND)
+        {
+            view->itemsize = export.ItemSize;
+            view->shape = export.ShapeAndStrides;
+        }
+        if ((request & PyBUF.Strides) == PyBUF.Strides)
+            view->strides = export.ShapeAndStrides + 1;
+
+        return 0;
+    }
+
+    /// <summary>
+    /// Called by Python, with the GIL held, when the last reference to an exporter, including
+    /// those held by buffers over its memory, is released.
+    /// </summary>
+    [UnmanagedCallersOnly(CallConvs = [typeof(CallConvCdecl)])]
+    private static void DeallocMemoryExport(nint exporter)
+    {
+        bool found;
+        MemoryExport export;
+        lock (MemoryExportLock)
+            found = MemoryExports.Remove(exporter, out export);
+
+        if (found)
+            export.Release();
+
+        // Instances of heap types hold a reference to their type.
+        var type = GetTypeRaw(exporter);
+        var free = (delegate* unmanaged[Cdecl]<nint, void>)PyType_GetSlot(type, Py_tp_free);
+        free(exporter);
+        Py_DecRefRaw(type);
+        Py_DecRefRaw(type);
+    }
+
+    /// <summary>
+    /// Unpins all exported memory, when the interpreter is shut down.
+    /// </summary>
+    private static void ClearMemoryExports()
+    {
+        lock (MemoryExportLock)
+        {
+            foreach (var export in MemoryExports.Values)
+                export.Release();
+            MemoryExports.Clear();
+
+            // Freed by the runtime
+            memoryExportType = IntPtr.Zero;
+            memoryExportBufferError = IntPtr.Zero;
+        }
+    }
+
+    [LibraryImport(PythonLibraryName)]
+    private static partial nint PyType_FromSpec(PyType_Spec* spec);
+
+    [LibraryImport(PythonLibraryName)]
+    private static partial nint PyType_GenericAlloc(nint type, nint nitems);
+
+    [LibraryImport(PythonLibraryName)]
+    private static partial void* PyType_GetSlot(nint type, int slot);
+
+    [LibraryImport(PythonLibraryName)]
+    private static partial int PyBuffer_FillInfo(Py_buffer* view, nint exporter, void* buf, nint len, int @readonly, int flags);
+
+    [LibraryImport(PythonLibraryName)]
+    private static partial nint PyMemoryView_FromObject(nint obj);
+
+    [LibraryImport(PythonLibraryName, StringMarshalling = StringMarshalling.Custom, StringMarshallingCustomType = typeof(Utf8StringMarshaller))]
+    private static partial void PyErr_SetString(nint type, string message);
+}
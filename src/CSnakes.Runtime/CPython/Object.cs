@@ -183,6 +183,9 @@ internal unsafe partial class CPythonAPI
     [LibraryImport(PythonLibraryName)]
     internal static partial int PyObject_Hash(PyObject ob);
 
+    [LibraryImport(PythonLibraryName, EntryPoint = "PyObject_Hash")]
+    internal static partial nint PyObject_HashRaw(nint ob);
+
     internal static bool PyObject_RichCompare(PyObject ob1, PyObject ob2, RichComparisonType comparisonType)
     {
         int result = PyObject_RichCompareBool(ob1, ob2, comparisonType);
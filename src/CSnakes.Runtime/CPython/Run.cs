@@ -17,4 +17,47 @@ internal unsafe partial class CPythonAPI
 
     [LibraryImport(PythonLibraryName, EntryPoint = "PyRun_String", StringMarshalling = StringMarshalling.Custom, StringMarshallingCustomType = typeof(Utf8StringMarshaller))]
     private static partial nint PyRun_String_(string str, InputType start, PyObject globals, PyObject locals);
+
+    /// <summary>
+    /// Compiled code objects shared by <see cref="PythonRunString"/>, keyed on the source text.
+    /// </summary>
+    internal static readonly CompiledCodeCache CompiledCode = new(capacity: 1024);
+
+    internal static PyObject Py_CompileString(string str, string filename, InputType start) =>
+        PyObject.Create(Py_CompileString_(str, filename, start));
+
+    [LibraryImport(PythonLibraryName, EntryPoint = "Py_CompileString", StringMarshalling = StringMarshalling.Custom, StringMarshallingCustomType = typeof(Utf8StringMarshaller))]
+    private static partial nint Py_CompileString_(string str, string filename, InputType start);
+
+    internal static PyObject PyEval_EvalCode(PyObject co, PyObject globals, PyObject locals)
+    {
+        // Like "PyRun_String", make the builtins available to the code when the globals don't
+        // name any, otherwise older versions evaluate it with a near-empty set of builtins.
+
+        if (PyDict_GetItemString(globals, "__builtins__") == IntPtr.Zero
+            && PyDict_SetItemString(globals, "__builtins__", PyEval_GetBuiltins()) == -1)
+        {
+            throw PyObject.ThrowPythonExceptionAsClrException();
+        }
+
+        return PyObject.Create(PyEval_EvalCode_(co, globals, locals));
+    }
+
+    [LibraryImport(PythonLibraryName, EntryPoint = "PyEval_EvalCode")]
+    private static partial nint PyEval_EvalCode_(PyObject co, PyObject globals, PyObject locals);
+
+    /// <summary>
+    /// Return a dictionary of the builtins in the current execution frame, or the interpreter of
+    /// the thread state if no frame is currently executing.
+    /// </summary>
+    /// <returns>A borrowed reference.</returns>
+    [LibraryImport(PythonLibraryName)]
+    private static partial nint PyEval_GetBuiltins();
+
+    /// <returns>A borrowed reference, or null without an exception set if the key is absent.</returns>
+    [LibraryImport(PythonLibraryName, StringMarshalling = StringMarshalling.Custom, StringMarshallingCustomType = typeof(Utf8StringMarshaller))]
+    private static partial nint PyDict_GetItemString(PyObject dict, string key);
+
+    [LibraryImport(PythonLibraryName, StringMarshalling = StringMarshalling.Custom, StringMarshallingCustomType = typeof(Utf8StringMarshaller))]
+    private static partial int PyDict_SetItemString(PyObject dict, string key, nint value);
 }
@@ -1,4 +1,5 @@
 using CSnakes.Runtime.Python;
+using System.Diagnostics.CodeAnalysis;
 using System.Runtime.InteropServices;
 
 namespace CSnakes.Runtime.CPython;
@@ -37,4 +38,94 @@ internal unsafe partial class CPythonAPI
     /// <returns>New reference to the item or NULL.</returns>
     [LibraryImport(PythonLibraryName)]
     internal static partial nint PySequence_GetItem(PyObject seq, nint index);
+
+    /// <summary>
+    /// Converts every item of an exact <c>list</c> or <c>tuple</c> to a 64-bit integer in one
+    /// pass, reading the items directly rather than through the sequence protocol.
+    /// </summary>
+    /// <returns>
+    /// <see langword="false"/> if <paramref name="seq"/> is not an exact <c>list</c> or
+    /// <c>tuple</c> or any of its items could not be converted, in which case no Python error is
+    /// left set.
+    /// </returns>
+    internal static bool TryCopyInt64Items(PyObject seq, [NotNullWhen(true)] out long[]? items)
+    {
+        items = null;
+        if (!TryGetExactListOrTupleSize(seq, out var isList, out var size))
+            return false;
+
+        var result = new long[size];
+        var handle = seq.DangerousGetHandle();
+        for (nint i = 0; i < size; i++)
+        {
+            var item = isList ? PyList_GetItemRaw(handle, i) : PyTuple_GetItemRaw(handle, i);
+            var value = PyLong_AsLongLongRaw(item);
+            if (value == -1 && PyErr_Occurred())
+            {
+                PyErr_Clear();
+                return false;
+            }
+            result[i] = value;
+        }
+
+        items = result;
+        return true;
+    }
+
+    /// <summary>
+    /// Converts every item of an exact <c>list</c> or <c>tuple</c> to a double in one pass,
+    /// reading the items directly rather than through the sequence protocol.
+    /// </summary>
+    /// <returns>
+    /// <see langword="false"/> if <paramref name="seq"/> is not an exact <c>list</c> or
+    /// <c>tuple</c> or any of its items could not be converted, in which case no Python error is
+    /// left set.
+    /// </returns>
+    internal static bool TryCopyDoubleItems(PyObject seq, [NotNullWhen(true)] out double[]? items)
+    {
+        items = null;
+        if (!TryGetExactListOrTupleSize(seq, out var isList, out var size))
+            return false;
+
+        var result = new double[size];
+        var handle = seq.DangerousGetHandle();
+        for (nint i = 0; i < size; i++)
+        {
+            var item = isList ? PyList_GetItemRaw(handle, i) : PyTuple_GetItemRaw(handle, i);
+            var value = PyFloat_AsDoubleRaw(item);
+            if (value == -1 && PyErr_Occurred())
+            {
+                PyErr_Clear();
+                return false;
+            }
+            result[i] = value;
+        }
+
+        items = result;
+        return true;
+    }
+
+    private static bool TryGetExactListOrTupleSize(PyObject seq, out bool isList, out nint size)
+    {
+        var type = GetTypeRaw(seq.DangerousGetHandle());
+        Py_DecRefRaw(type);
+
+        if (type == PyListType)
+        {
+            isList = true;
+            size = PyList_Size(seq);
+            return true;
+        }
+
+        if (type == PyTupleType)
+        {
+            isList = false;
+            size = PyTuple_Size(seq);
+            return true;
+        }
+
+        isList = false;
+        size = 0;
+        return false;
+    }
 }
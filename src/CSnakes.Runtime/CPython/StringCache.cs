@@ -0,0 +1,190 @@
+using CSnakes.Runtime.Python;
+using System.Diagnostics.CodeAnalysis;
+
+namespace CSnakes.Runtime.CPython;
+
+/// <summary>
+/// A bounded, least-recently-used, two-way cache between .NET strings and Python <c>str</c>
+/// objects for short strings that cross the boundary repeatedly, such as dictionary keys and
+/// enumeration-like values.
+/// </summary>
+/// <remarks>
+/// The cache owns a strong reference to each Python string it holds, so a Python object's
+/// address is a stable identity while it is cached. A Python string that isn't cached by identity
+/// is looked up by its hash, which Python computes once and stores in the string, and then
+/// compared for equality. Python strings created by the cache are interned, so they are identical
+/// to the same literals in Python code. Only exact <c>str</c> objects are cached, so a subclass
+/// such as a <c>StrEnum</c> member is never handed out for plain text, and looking one up never
+/// runs an overridden <c>__hash__</c> or <c>__eq__</c>. All members must be called with the GIL
+/// held.
+/// </remarks>
+internal sealed class StringCache(int capacity)
+{
+    /// <summary>
+    /// Strings longer than this are converted without going through the cache.
+    /// </summary>
+    public const int MaxLength = 128;
+
+    private static readonly KeyValuePair<string, object?> ToPythonTag = new("csnakes.string_cache.direction", "to_python");
+    private static readonly KeyValuePair<string, object?> FromPythonTag = new("csnakes.string_cache.direction", "from_python");
+
+    private sealed record Entry(string Value, nint Handle, nint Hash);
+
+    private readonly Lock @lock = new();
+    private readonly Dictionary<string, LinkedListNode<Entry>> byValue = new(StringComparer.Ordinal);
+    private readonly Dictionary<nint, LinkedListNode<Entry>> byHandle = [];
+    private readonly Dictionary<nint, LinkedListNode<Entry>> byHash = [];
+    private readonly LinkedList<Entry> recency = []; // most recently used first
+
+    public int Count
+    {
+        get
+        {
+            lock (@lock)
+                return byHandle.Count;
+        }
+    }
+
+    /// <summary>
+    /// Gets a Python <c>str</c> for <paramref name="value"/>.
+    /// </summary>
+    /// <returns>A new reference, or null if an error occurred.</returns>
+    public nint GetPyString(string value)
+    {
+        if (value.Length > MaxLength)
+            return CPythonAPI.AsPyUnicodeObject(value);
+
+        lock (@lock)
+        {
+            if (byValue.TryGetValue(value, out var node))
+            {
+                Touch(node);
+                RuntimeMetrics.StringCacheHits.Add(1, ToPythonTag);
+                CPythonAPI.Py_IncRefRaw(node.Value.Handle);
+                return node.Value.Handle;
+            }
+        }
+
+        RuntimeMetrics.StringCacheMisses.Add(1, ToPythonTag);
+
+        var handle = CPythonAPI.AsPyUnicodeObject(value);
+        if (handle == IntPtr.Zero)
+            return handle;
+
+        CPythonAPI.PyUnicode_InternInPlace(ref handle);
+        Add(value, handle);
+        return handle;
+    }
+
+    /// <summary>
+    /// Gets the .NET string for the Python <c>str</c> at <paramref name="handle"/>.
+    /// </summary>
+    public string GetString(nint handle)
+    {
+        if (!CPythonAPI.IsExactPyUnicodeRaw(handle))
+            return CPythonAPI.PyUnicode_AsUTF8Raw(handle) ?? throw PyObject.ThrowPythonExceptionAsClrException();
+
+        lock (@lock)
+        {
+            if (byHandle.TryGetValue(handle, out var node))
+            {
+                Touch(node);
+                RuntimeMetrics.StringCacheHits.Add(1, FromPythonTag);
+                return node.Value.Value;
+            }
+
+            if (TryGetByHash(handle, out node))
+            {
+                Touch(node);
+                RuntimeMetrics.StringCacheHits.Add(1, FromPythonTag);
+                return node.Value.Value;
+            }
+        }
+
+        RuntimeMetrics.StringCacheMisses.Add(1, FromPythonTag);
+
+        var value = CPythonAPI.PyUnicode_AsUTF8Raw(handle) ?? throw PyObject.ThrowPythonExceptionAsClrException();
+        if (value.Length <= MaxLength)
+            Add(value, handle);
+        return value;
+    }
+
+    private bool TryGetByHash(nint handle, [NotNullWhen(true)] out LinkedListNode<Entry>? node)
+    {
+        var hash = CPythonAPI.PyObject_HashRaw(handle);
+        if (hash == -1)
+        {
+            CPythonAPI.PyErr_Clear();
+            node = null;
+            return false;
+        }
+
+        if (!byHash.TryGetValue(hash, out node))
+            return false;
+
+        if (CPythonAPI.PyUnicode_CompareRaw(handle, node.Value.Handle) == 0)
+            return true;
+
+        if (CPythonAPI.PyErr_Occurred())
+            CPythonAPI.PyErr_Clear();
+        node = null;
+        return false;
+    }
+
+    private void Touch(LinkedListNode<Entry> node)
+    {
+        recency.Remove(node);
+        recency.AddFirst(node);
+    }
+
+    private void Add(string value, nint handle)
+    {
+        lock (@lock)
+        {
+            if (byHandle.TryGetValue(handle, out var existing))
+            {
+                // Interning returned a string that is already cached by identity, so let the value
+                // find that entry too.
+                byValue.TryAdd(value, existing);
+                return;
+            }
+
+            var hash = CPythonAPI.PyObject_HashRaw(handle);
+            if (hash == -1)
+            {
+                CPythonAPI.PyErr_Clear();
+                return;
+            }
+
+            CPythonAPI.Py_IncRefRaw(handle);
+            var node = recency.AddFirst(new Entry(value, handle, hash));
+            byHandle.Add(handle, node);
+            byValue.TryAdd(value, node);
+            byHash.TryAdd(hash, node);
+
+            if (byHandle.Count > capacity && recency.Last is { } last)
+                Evict(last);
+        }
+    }
+
+    private void Evict(LinkedListNode<Entry> node)
+    {
+        var (value, handle, hash) = node.Value;
+        recency.Remove(node);
+        _ = byHandle.Remove(handle);
+        if (byValue.TryGetValue(value, out var other) && other == node)
+            _ = byValue.Remove(value);
+        if (byHash.TryGetValue(hash, out other) && other == node)
+            _ = byHash.Remove(hash);
+        CPythonAPI.Py_DecRefRaw(handle);
+    }
+
+    public void Clear()
+    {
+        lock (@lock)
+        {
+            while (recency.Last is { } last)
+                Evict(last);
+        }
+    }
+}
@@ -33,6 +33,31 @@ internal unsafe partial class CPythonAPI
         return tuple;
     }
 
+    /// <summary>
+    /// Create a PyTuple of interned strings for use as the keyword names of a vectorcall.
+    /// </summary>
+    /// <param name="names">The keyword names</param>
+    /// <returns>A new reference to the resulting tuple object.</returns>
+    internal static nint PackKeywordNames(ReadOnlySpan<string> names)
+    {
+        if (names.Length == 0)
+            return GetPyEmptyTuple();
+
+        nint tuple = PyTuple_New(names.Length);
+        for (int i = 0; i < names.Length; i++)
+        {
+            nint name = PyUnicode_InternFromString(names[i]);
+            if (name == IntPtr.Zero)
+            {
+                Py_DecRefRaw(tuple);
+                throw PyObject.ThrowPythonExceptionAsClrException();
+            }
+            PyTuple_SetItemRaw(tuple, i, name);
+            Py_DecRefRaw(name); // The tuple holds its own reference now.
+        }
+        return tuple;
+    }
+
     /// <summary>
     /// Create a new tuple of size `size` as ssize_t
     /// </summary>
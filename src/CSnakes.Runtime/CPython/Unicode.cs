@@ -6,6 +6,27 @@ internal unsafe partial class CPythonAPI
 {
     private static IntPtr PyUnicodeType = IntPtr.Zero;
 
+    /// <summary>
+    /// The optional cache of short strings converted in either direction, or <see
+    /// langword="null"/> when string caching is disabled.
+    /// </summary>
+    internal static StringCache? StringCache { get; private set; }
+
+    /// <summary>
+    /// Converts <paramref name="s"/> to a Python <c>str</c>, going through the <see
+    /// cref="StringCache"/> when it is enabled.
+    /// </summary>
+    /// <returns>A new reference, or null if an error occurred.</returns>
+    internal static nint AsCachedPyUnicodeObject(string s) =>
+        StringCache is { } cache ? cache.GetPyString(s) : AsPyUnicodeObject(s);
+
+    /// <summary>
+    /// Converts the string object to a .NET string, going through the <see cref="StringCache"/>
+    /// when it is enabled.
+    /// </summary>
+    internal static string PyUnicode_AsCachedUTF8(PyObject s) =>
+        StringCache is { } cache ? cache.GetString(s.DangerousGetHandle()) : PyUnicode_AsUTF8(s);
+
     internal static nint AsPyUnicodeObject(string s)
     {
         fixed (char* c = s)
@@ -40,8 +61,40 @@ internal unsafe partial class CPythonAPI
     [LibraryImport(PythonLibraryName, StringMarshalling = StringMarshalling.Custom, StringMarshallingCustomType = typeof(NonFreeUtf8StringMarshaller), EntryPoint = "PyUnicode_AsUTF8")]
     internal static partial string? PyUnicode_AsUTF8Raw(nint s);
 
+    /// <summary>
+    /// Create an interned string object from a UTF-8 encoded string.
+    /// </summary>
+    /// <param name="v">The string value</param>
+    /// <returns>A new reference to the interned string object, or NULL on failure.</returns>
+    [LibraryImport(PythonLibraryName, StringMarshalling = StringMarshalling.Utf8)]
+    internal static partial nint PyUnicode_InternFromString(string v);
+
+    /// <summary>
+    /// Compare two strings and return -1, 0, 1 for less than, equal, and greater than,
+    /// respectively. Returns -1 with an exception set on failure.
+    /// </summary>
+    [LibraryImport(PythonLibraryName, EntryPoint = "PyUnicode_Compare")]
+    internal static partial int PyUnicode_CompareRaw(nint left, nint right);
+
+    /// <summary>
+    /// Intern the string object in place, replacing it with a new reference to the interned
+    /// string if an equal one has already been interned.
+    /// </summary>
+    [LibraryImport(PythonLibraryName)]
+    internal static partial void PyUnicode_InternInPlace(ref nint p);
+
     public static bool IsPyUnicode(PyObject p)
     {
         return PyObject_IsInstance(p, PyUnicodeType);
     }
+
+    /// <summary>
+    /// Checks whether the object is a <c>str</c>, and not an instance of a subclass.
+    /// </summary>
+    internal static bool IsExactPyUnicodeRaw(nint ob)
+    {
+        var type = GetTypeRaw(ob);
+        Py_DecRefRaw(type);
+        return type == PyUnicodeType;
+    }
 }
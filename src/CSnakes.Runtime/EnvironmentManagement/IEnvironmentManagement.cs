@@ -23,4 +23,13 @@ public interface IEnvironmentManagement
     }
     public void EnsureEnvironment(PythonLocationMetadata pythonLocation);
 
+    /// <summary>
+    /// Ensures the environment exists without blocking the calling thread while it is created.
+    /// Defaults to calling <see cref="EnsureEnvironment(PythonLocationMetadata)"/>.
+    /// </summary>
+    public virtual Task EnsureEnvironmentAsync(PythonLocationMetadata pythonLocation, CancellationToken cancellationToken = default)
+    {
+        EnsureEnvironment(pythonLocation);
+        return Task.CompletedTask;
+    }
 }
@@ -6,7 +6,10 @@ internal class VenvEnvironmentManagement(ILogger? logger, string path, bool ensu
 {
     ILogger? IEnvironmentManagement.Logger => logger;
 
-    public void EnsureEnvironment(PythonLocationMetadata pythonLocation)
+    public void EnsureEnvironment(PythonLocationMetadata pythonLocation) =>
+        EnsureEnvironmentAsync(pythonLocation).GetAwaiter().GetResult();
+
+    public async Task EnsureEnvironmentAsync(PythonLocationMetadata pythonLocation, CancellationToken cancellationToken = default)
     {
         if (!ensureExists)
             return;
@@ -20,8 +23,8 @@ internal class VenvEnvironmentManagement(ILogger? logger, string path, bool ensu
         if (!Directory.Exists(path))
         {
             logger?.LogDebug("Creating virtual environment at {VirtualEnvPath} using {PythonBinaryPath}", fullPath, pythonLocation.PythonBinaryPath);
-            var (exitCode1, _, _) = ProcessUtils.ExecutePythonCommand(logger, pythonLocation, "-VV");
-            var (exitCode2, _, error) = ProcessUtils.ExecutePythonCommand(logger, pythonLocation, "-m", "venv",  fullPath);
+            var (exitCode1, _, _) = await ProcessUtils.ExecutePythonCommandAsync(logger, pythonLocation, cancellationToken, "-VV").ConfigureAwait(false);
+            var (exitCode2, _, error) = await ProcessUtils.ExecutePythonCommandAsync(logger, pythonLocation, cancellationToken, "-m", "venv",  fullPath).ConfigureAwait(false);
 
             if (exitCode1 != 0 || exitCode2 != 0)
             {
@@ -1,4 +1,5 @@
 using CSnakes.Runtime.CPython;
+using CSnakes.Runtime.Python;
 using Microsoft.Extensions.Logging;
 
 namespace CSnakes.Runtime;
@@ -23,5 +24,61 @@ public interface IPythonEnvironment : IDisposable
 
     public bool IsDisposed();
 
+    /// <summary>
+    /// Runs <paramref name="action"/> while holding the GIL for its whole duration.
+    /// </summary>
+    /// <remarks>
+    /// Generated module methods and <see cref="PyObject"/> members called from within
+    /// the batch re-enter the lock already held by the thread instead of restoring and
+    /// saving the Python thread state on every call. Queued disposals are drained once,
+    /// when the batch ends.
+    /// </remarks>
+    public void RunBatch(Action action)
+    {
+        ArgumentNullException.ThrowIfNull(action);
+        using (GIL.Acquire())
+        {
+            action();
+        }
+    }
+
+    /// <summary>
+    /// Runs <paramref name="func"/> while holding the GIL for its whole duration and
+    /// returns its result.
+    /// </summary>
+    /// <inheritdoc cref="RunBatch(Action)" path="/remarks"/>
+    public T RunBatch<T>(Func<T> func)
+    {
+        ArgumentNullException.ThrowIfNull(func);
+        using (GIL.Acquire())
+        {
+            return func();
+        }
+    }
+
+    /// <summary>
+    /// Runs <paramref name="action"/> asynchronously while holding the GIL.
+    /// </summary>
+    /// <remarks>
+    /// When the environment was built with dedicated Python threads (see
+    /// <see cref="IPythonEnvironmentBuilder.WithDedicatedPythonThreads(int)"/>), the work is
+    /// queued to those threads. Otherwise it runs on the .NET thread pool.
+    /// </remarks>
+    public Task RunAsync(Action action, CancellationToken cancellationToken = default)
+    {
+        ArgumentNullException.ThrowIfNull(action);
+        return RunAsync<object?>(() => { action(); return null; }, cancellationToken);
+    }
+
+    /// <summary>
+    /// Runs <paramref name="func"/> asynchronously while holding the GIL and returns its result.
+    /// </summary>
+    /// <inheritdoc cref="RunAsync(Action, CancellationToken)" path="/remarks"/>
+    public Task<T> RunAsync<T>(Func<T> func, CancellationToken cancellationToken = default)
+    {
+        ArgumentNullException.ThrowIfNull(func);
+        return Task.Run(() => RunBatch(func), cancellationToken);
+    }
+
     public ILogger<IPythonEnvironment>? Logger { get; }
 }
@@ -1,3 +1,4 @@
+using CSnakes.Runtime.PackageManagement;
 using Microsoft.Extensions.DependencyInjection;
 using Microsoft.Extensions.Logging;
 
@@ -49,6 +50,78 @@ public interface IPythonEnvironmentBuilder
     /// <returns>The current instance of the <see cref="IPythonEnvironmentBuilder"/>.</returns>
     IPythonEnvironmentBuilder CapturePythonLogs();
 
+    /// <summary>
+    /// Capture Python logs and emit them to the <see cref="ILogger"/> API used in the environment
+    /// </summary>
+    /// <param name="options">Controls how log records are buffered before they are emitted.</param>
+    /// <returns>The current instance of the <see cref="IPythonEnvironmentBuilder"/>.</returns>
+    IPythonEnvironmentBuilder CapturePythonLogs(PythonLoggingOptions options);
+
+    /// <summary>
+    /// Marshals Python work submitted through <see cref="IPythonEnvironment.RunAsync{T}(Func{T}, CancellationToken)"/>
+    /// onto a fixed set of dedicated threads instead of the .NET thread pool.
+    /// </summary>
+    /// <param name="threadCount">The number of dedicated threads.</param>
+    /// <returns>The current instance of the <see cref="IPythonEnvironmentBuilder"/>.</returns>
+    IPythonEnvironmentBuilder WithDedicatedPythonThreads(int threadCount = 1);
+
+    /// <summary>
+    /// Distributes coroutines and other awaitables across a pool of asyncio event loops, each
+    /// serviced by its own thread, instead of a single event loop.
+    /// </summary>
+    /// <remarks>
+    /// asyncio objects such as futures, locks and queues are bound to the event loop that created
+    /// them, and consecutive calls can run on different loops, so such objects can't be shared
+    /// between calls.
+    /// </remarks>
+    /// <param name="count">The number of event loops.</param>
+    /// <returns>The current instance of the <see cref="IPythonEnvironmentBuilder"/>.</returns>
+    IPythonEnvironmentBuilder WithEventLoops(int count);
+
+    /// <summary>
+    /// Caches short strings that repeatedly cross between .NET and Python, such as dictionary
+    /// keys, so that they are not converted again each time.
+    /// </summary>
+    /// <param name="capacity">The maximum number of cached strings.</param>
+    /// <returns>The current instance of the <see cref="IPythonEnvironmentBuilder"/>.</returns>
+    IPythonEnvironmentBuilder WithStringCache(int capacity = 4096);
+
+    /// <summary>
+    /// Sets the range of integers whose Python <c>int</c> objects are created once and then reused
+    /// when converting from .NET, so that passing them as arguments doesn't allocate.
+    /// </summary>
+    /// <param name="min">The smallest cached integer.</param>
+    /// <param name="max">The largest cached integer.</param>
+    /// <returns>The current instance of the <see cref="IPythonEnvironmentBuilder"/>.</returns>
+    IPythonEnvironmentBuilder WithSmallIntegerCache(int min = -5, int max = 1024);
+
+    /// <summary>
+    /// Disables the cache of small integers set up by default or by <see cref="WithSmallIntegerCache"/>.
+    /// </summary>
+    /// <returns>The current instance of the <see cref="IPythonEnvironmentBuilder"/>.</returns>
+    IPythonEnvironmentBuilder DisableSmallIntegerCache();
+
+    /// <summary>
+    /// Translates Python exceptions into .NET exceptions that only record the Python exception's
+    /// type name and message, for code paths where exceptions are raised often and expected.
+    /// </summary>
+    /// <remarks>
+    /// The <see cref="PythonRuntimeException"/> of a lightweight exception has no Python stack
+    /// trace, no <c>locals</c> or <c>globals</c> in its <see cref="Exception.Data"/> and no inner
+    /// exception for the Python exception's cause.
+    /// </remarks>
+    /// <returns>The current instance of the <see cref="IPythonEnvironmentBuilder"/>.</returns>
+    IPythonEnvironmentBuilder WithLightweightExceptions();
+
+    /// <summary>
+    /// Sets how the pip and uv installers decide whether a requirements file needs to be
+    /// installed when the environment starts. By default, the installation is skipped when
+    /// nothing changed since the last successful installation into the virtual environment.
+    /// </summary>
+    /// <param name="check">How to check the requirements.</param>
+    /// <returns>The current instance of the <see cref="IPythonEnvironmentBuilder"/>.</returns>
+    IPythonEnvironmentBuilder WithRequirementsCheck(RequirementsCheck check);
+
     /// <summary>
     /// Gets the options for the Python environment being built.
     /// </summary>
@@ -102,4 +102,11 @@ public abstract class PythonLocator
     /// </summary>
     /// <remarks>This would be used to do an OS check and ignore a particular <see cref="PythonLocator"/> if the OS does not match the one it supports. See the <see cref="WindowsInstallerLocator"/> as an example.</remarks>
     internal virtual bool IsSupported() => true;
+
+    /// <summary>
+    /// Specifies whether <see cref="LocatePython"/> only probes for an existing installation, so it
+    /// can run at the same time as other locators. Defaults to <see langword="true"/>.
+    /// </summary>
+    /// <remarks>Locators that download or install Python must return <see langword="false"/>, so they only run when every locator registered before them has found nothing.</remarks>
+    protected internal virtual bool CanLocateConcurrently => true;
 }
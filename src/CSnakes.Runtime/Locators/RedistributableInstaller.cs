@@ -0,0 +1,264 @@
+using Microsoft.Extensions.Logging;
+using System.Formats.Tar;
+using System.Security.Cryptography;
+using System.Text;
+using ZstdSharp;
+
+namespace CSnakes.Runtime.Locators;
+
+/// <summary>
+/// Downloads and extracts a <c>python-build-standalone</c> archive in a single streaming pass,
+/// from the HTTP response through Zstandard decompression to the files of the tarball, without
+/// writing the archive to disk first.
+/// </summary>
+internal static class RedistributableInstaller
+{
+    /// <summary>
+    /// Files up to this size are read from the tarball into memory and written out in parallel,
+    /// while the tarball reader moves on to the next entry. Larger files are written as they are
+    /// read.
+    /// </summary>
+    internal const int MaxBufferedFileSize = 4 * 1024 * 1024;
+
+    /// <summary>
+    /// The maximum number of files being written at once, which together with <see
+    /// cref="MaxBufferedFileSize"/> bounds the memory used for buffered files.
+    /// </summary>
+    internal const int MaxParallelWrites = 8;
+
+    private const string PartialDirectoryInfix = ".partial-";
+
+    /// <summary>
+    /// Gets the name of the cache directory for the archive at <paramref name="downloadUrl"/>.
+    /// </summary>
+    /// <remarks>
+    /// A download URL identifies an immutable release artifact, so the name is derived from its
+    /// hash. Applications sharing a cache directory then share an extracted runtime only when
+    /// they would have downloaded exactly the same archive.
+    /// </remarks>
+    internal static string GetCacheDirectoryName(string dottedVersion, string downloadUrl)
+    {
+        var hash = SHA256.HashData(Encoding.UTF8.GetBytes(downloadUrl));
+        return $"python{dottedVersion}-{Convert.ToHexString(hash, 0, 6).ToLowerInvariant()}";
+    }
+
+    /// <summary>
+    /// Downloads the archive at <paramref name="downloadUrl"/> and extracts it to <paramref
+    /// name="destinationPath"/>.
+    /// </summary>
+    /// <remarks>
+    /// The archive is extracted to a sibling directory that is moved into place once complete,
+    /// so <paramref name="destinationPath"/> either doesn't exist or holds a complete
+    /// installation, even to processes that don't share the installation mutex. If another
+    /// process has installed to <paramref name="destinationPath"/> in the meantime, its
+    /// installation is kept and the one extracted here is discarded.
+    /// </remarks>
+    public static async Task InstallAsync(HttpClient client, string downloadUrl, string destinationPath, ILogger? logger, CancellationToken cancellationToken = default)
+    {
+        var partialPath = destinationPath + PartialDirectoryInfix + Guid.NewGuid().ToString("N");
+        Directory.CreateDirectory(partialPath);
+
+        try
+        {
+            logger?.LogDebug("Downloading Python from {DownloadUrl}", downloadUrl);
+
+            using var response = await client.GetAsync(downloadUrl, HttpCompletionOption.ResponseHeadersRead, cancellationToken).ConfigureAwait(false);
+            response.EnsureSuccessStatusCode();
+
+            var content = await response.Content.ReadAsStreamAsync(cancellationToken).ConfigureAwait(false);
+            await using (content.ConfigureAwait(false))
+            {
+                await ExtractAsync(content, partialPath, logger, cancellationToken).ConfigureAwait(false);
+            }
+
+            try
+            {
+                Directory.Move(partialPath, destinationPath);
+                logger?.LogDebug("Extracted Python to {DestinationPath}", destinationPath);
+            }
+            catch (IOException) when (Directory.Exists(destinationPath))
+            {
+                logger?.LogDebug("Python was installed to {DestinationPath} by another process", destinationPath);
+            }
+        }
+        finally
+        {
+            DeleteDirectory(partialPath);
+        }
+    }
+
+    /// <summary>
+    /// Deletes any directories left behind by an installation to <paramref
+    /// name="destinationPath"/> that was interrupted, which haven't been written to for at least
+    /// <paramref name="inactivity"/>.
+    /// </summary>
+    /// <remarks>
+    /// An interrupted installation can't otherwise be told apart from one still under way in
+    /// another process, which must be left alone.
+    /// </remarks>
+    public static void DeletePartialInstallations(string destinationPath, TimeSpan inactivity)
+    {
+        var parent = Path.GetDirectoryName(destinationPath);
+        if (parent is null || !Directory.Exists(parent))
+            return;
+
+        var cutoff = DateTime.UtcNow - inactivity;
+        foreach (var path in Directory.EnumerateDirectories(parent, Path.GetFileName(destinationPath) + PartialDirectoryInfix + "*"))
+        {
+            if (GetLastWriteTimeUtc(path) is { } lastWrite && lastWrite < cutoff)
+                DeleteDirectory(path);
+        }
+    }
+
+    /// <summary>
+    /// Gets the time anything in the directory at <paramref name="path"/> was last written to, or
+    /// <see langword="null"/> if it has been moved or deleted in the meantime.
+    /// </summary>
+    private static DateTime? GetLastWriteTimeUtc(string path)
+    {
+        try
+        {
+            var lastWrite = Directory.GetLastWriteTimeUtc(path);
+            foreach (var entry in new DirectoryInfo(path).EnumerateFileSystemInfos("*", SearchOption.AllDirectories))
+            {
+                if (entry.LastWriteTimeUtc > lastWrite)
+                    lastWrite = entry.LastWriteTimeUtc;
+            }
+            return lastWrite;
+        }
+        catch (Exception ex) when (ex is DirectoryNotFoundException or FileNotFoundException)
+        {
+            return null;
+        }
+    }
+
+    /// <summary>
+    /// Extracts the Zstandard-compressed tarball read from <paramref name="archive"/> to
+    /// <paramref name="extractPath"/>.
+    /// </summary>
+    public static async Task ExtractAsync(Stream archive, string extractPath, ILogger? logger, CancellationToken cancellationToken = default)
+    {
+        var decompressor = new DecompressionStream(archive);
+        await using (decompressor.ConfigureAwait(false))
+        {
+            var tarReader = new TarReader(decompressor);
+            await using (tarReader.ConfigureAwait(false))
+            {
+                await ExtractTarAsync(tarReader, extractPath, logger, cancellationToken).ConfigureAwait(false);
+            }
+        }
+    }
+
+    private static async Task ExtractTarAsync(TarReader tarReader, string extractPath, ILogger? logger, CancellationToken cancellationToken)
+    {
+        List<(string, string)> symlinks = [];
+        List<Task> writes = [];
+        using var writeSlots = new SemaphoreSlim(MaxParallelWrites);
+
+        try
+        {
+            TarEntry? entry;
+            while ((entry = await tarReader.GetNextEntryAsync(cancellationToken: cancellationToken).ConfigureAwait(false)) is not null)
+            {
+                string entryPath = Path.Combine(extractPath, entry.Name);
+                if (entry.EntryType == TarEntryType.Directory)
+                {
+                    Directory.CreateDirectory(entryPath);
+                    logger?.LogDebug("Creating directory: {EntryPath}", entryPath);
+                }
+                else if (entry.EntryType == TarEntryType.RegularFile)
+                {
+                    Directory.CreateDirectory(Path.GetDirectoryName(entryPath)!);
+
+                    if (entry.DataStream is not { } data || entry.Length > MaxBufferedFileSize)
+                    {
+                        await entry.ExtractToFileAsync(entryPath, overwrite: true, cancellationToken).ConfigureAwait(false);
+                        continue;
+                    }
+
+                    // The entry's data must be read before moving on to the next entry, but
+                    // writing it out can happen in the background.
+
+                    await writeSlots.WaitAsync(cancellationToken).ConfigureAwait(false);
+                    var buffer = new byte[entry.Length];
+                    await data.ReadExactlyAsync(buffer, cancellationToken).ConfigureAwait(false);
+                    var mode = entry.Mode;
+                    writes.Add(Task.Run(async () =>
+                    {
+                        try
+                        {
+                            await WriteFileAsync(entryPath, buffer, mode, cancellationToken).ConfigureAwait(false);
+                        }
+                        finally
+                        {
+                            writeSlots.Release();
+                        }
+                    }, cancellationToken));
+                }
+                else if (entry.EntryType == TarEntryType.SymbolicLink)
+                {
+                    // Delay the creation of symlinks until after all files have been extracted
+                    symlinks.Add((entryPath, entry.LinkName));
+                }
+                else
+                {
+                    logger?.LogDebug("Skipping entry: {EntryPath} ({EntryType})", entryPath, entry.EntryType);
+                }
+            }
+        }
+        finally
+        {
+            // Wait for the writes in flight even if reading failed, so none of them writes to
+            // the directory after it has been cleaned up.
+            await Task.WhenAll(writes).ConfigureAwait(ConfigureAwaitOptions.SuppressThrowing);
+        }
+
+        await Task.WhenAll(writes).ConfigureAwait(false);
+
+        foreach (var (path, link) in symlinks)
+        {
+            logger?.LogDebug("Creating symlink: {Path} -> {Link}", path, link);
+            try
+            {
+                File.CreateSymbolicLink(path, link);
+            }
+            catch (DirectoryNotFoundException ex)
+            {
+                // This is common in the packages
+                logger?.LogWarning(ex, "Failed to create symlink: {Path} -> {Link}", path, link);
+            }
+        }
+    }
+
+    private static async Task WriteFileAsync(string path, byte[] data, UnixFileMode mode, CancellationToken cancellationToken)
+    {
+        var options = new FileStreamOptions
+        {
+            Mode = FileMode.Create,
+            Access = FileAccess.Write,
+            Options = FileOptions.Asynchronous,
+            PreallocationSize = data.Length,
+        };
+
+        if (!OperatingSystem.IsWindows())
+            options.UnixCreateMode = mode;
+
+        var stream = new FileStream(path, options);
+        await using (stream.ConfigureAwait(false))
+        {
+            await stream.WriteAsync(data, cancellationToken).ConfigureAwait(false);
+        }
+    }
+
+    private static void DeleteDirectory(string path)
+    {
+        try
+        {
+            Directory.Delete(path, recursive: true);
+        }
+        catch (DirectoryNotFoundException)
+        {
+            // Already moved into place or deleted.
+        }
+    }
+}
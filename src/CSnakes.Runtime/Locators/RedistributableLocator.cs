@@ -1,7 +1,6 @@
 using Microsoft.Extensions.Logging;
-using System.Formats.Tar;
+using System.Diagnostics;
 using System.Runtime.InteropServices;
-using ZstdSharp;
 
 namespace CSnakes.Runtime.Locators;
 
@@ -27,11 +26,18 @@ public sealed record RedistributablePythonVersion
 internal class RedistributableLocator(ILogger<RedistributableLocator>? logger, RedistributablePythonVersion version, int installerTimeout = 360, bool debug = false, bool freeThreaded = false) : PythonLocator
 {
     private const string standaloneRelease = "20250902";
-    private const string MutexName = @"Global\CSnakesPythonInstall-1"; // run-time name includes Python version
+    private const string MutexName = @"Global\CSnakesPythonInstall-1"; // run-time name includes the cache directory name
+
+    // How long an interrupted installation must have gone without being written to before it's
+    // presumed abandoned rather than still under way in another process.
+    private static readonly TimeSpan StalePartialInstallationAge = TimeSpan.FromHours(1);
 
     protected override Version Version => version.Version;
     protected bool SupportsFreeThreading => version.SupportsFreeThreading;
 
+    // Downloads Python when it isn't cached, which is wasted when an earlier locator finds it.
+    protected internal override bool CanLocateConcurrently => false;
+
     protected override string GetPythonExecutablePath(string folder, bool freeThreaded = false)
     {
         if (!SupportsFreeThreading && freeThreaded)
@@ -70,10 +76,20 @@ internal class RedistributableLocator(ILogger<RedistributableLocator>? logger, R
             throw new NotSupportedException($"Arm64 builds are not supported on Windows for version {Version}.");
         }
 
+        // TODO: Find a better way to determine the OS platform enum at runtime.
+        OSPlatform osPlatform = RuntimeInformation.IsOSPlatform(OSPlatform.Windows) ? OSPlatform.Windows :
+            RuntimeInformation.IsOSPlatform(OSPlatform.OSX) ? OSPlatform.OSX :
+            RuntimeInformation.IsOSPlatform(OSPlatform.Linux) ? OSPlatform.Linux :
+            throw new PlatformNotSupportedException($"Unsupported platform: '{RuntimeInformation.OSDescription}'.");
+
+        string downloadUrl = GetDownloadUrl(osPlatform, RuntimeInformation.ProcessArchitecture, freeThreaded, debug, version);
+
+        // The cache directory can be shared by several applications, which then share an
+        // installation when they use the same redistributable.
         var appDataPath = Environment.GetEnvironmentVariable("CSNAKES_REDIST_CACHE");
         if (string.IsNullOrWhiteSpace(appDataPath))
             appDataPath = Environment.GetFolderPath(Environment.SpecialFolder.ApplicationData, Environment.SpecialFolderOption.Create);
-        var downloadPath = Path.Join(appDataPath, "CSnakes", $"python{dottedVersion}");
+        var downloadPath = Path.Join(appDataPath, "CSnakes", RedistributableInstaller.GetCacheDirectoryName(dottedVersion, downloadUrl));
         var installPath = Path.Join(downloadPath, "python", "install");
 
         var installCompletionSource = new TaskCompletionSource<PythonLocationMetadata>();
@@ -90,12 +106,12 @@ internal class RedistributableLocator(ILogger<RedistributableLocator>? logger, R
         // installation process, the mutex is not released! This is by-design. The installation
         // occurs under a dedicated thread such that if the mutex is not released explicitly when it
         // ends, the next waiting thread will wake up, see the mutex was abandoned by the owning
-        // thread, clean up the presumably half-done installation and attempt the installation
-        // themselves.
+        // thread, clean up the presumably half-done installation if it has gone stale and attempt
+        // the installation themselves.
 
         var installerThread = new Thread(() =>
         {
-            using var mutex = new Mutex(initiallyOwned: false, $"{MutexName}-{dottedVersion}");
+            using var mutex = new Mutex(initiallyOwned: false, $"{MutexName}-{Path.GetFileName(downloadPath)}");
 
             try
             {
@@ -113,8 +129,11 @@ internal class RedistributableLocator(ILogger<RedistributableLocator>? logger, R
             Name = $"CSnakes Python {dottedVersion} Installer"
         };
 
+        var start = Stopwatch.GetTimestamp();
         installerThread.Start();
-        return installCompletionSource.Task.GetAwaiter().GetResult();
+        var location = installCompletionSource.Task.GetAwaiter().GetResult();
+        RuntimeMetrics.RedistributableLocateTime.Record(Stopwatch.GetElapsedTime(start).TotalSeconds);
+        return location;
 
         PythonLocationMetadata Install(Mutex mutex)
         {
@@ -129,53 +148,32 @@ internal class RedistributableLocator(ILogger<RedistributableLocator>? logger, R
             catch (AbandonedMutexException)
             {
                 // If the mutex was abandoned, it most probably means that the other process crashed
-                // and didn't even get the chance to run any clean-up. Since the state of the
-                // download and installation is now unreliable, start by clearing up directories and
-                // then proceed with the installation here.
-
-                try
-                {
-                    Directory.Delete(downloadPath, recursive: true);
-                }
-                catch (DirectoryNotFoundException)
-                {
-                    // If the directory didn't exist, ignore it and proceed.
-                }
+                // and didn't even get the chance to run any clean-up. An installation is only moved
+                // into place once complete, so one that exists can be used as is. What the other
+                // process left behind can't be told apart from an installation still under way in
+                // a process that doesn't share the mutex, so only what hasn't been written to for
+                // a while is cleared up before proceeding with the installation here.
+
+                if (Directory.Exists(installPath))
+                    return LocatePythonInternal(installPath, freeThreaded);
+
+                RedistributableInstaller.DeletePartialInstallations(downloadPath, StalePartialInstallationAge);
             }
 
-            // Create the folder; the install path is only created at the end.
-            Directory.CreateDirectory(downloadPath);
+            Directory.CreateDirectory(Path.GetDirectoryName(downloadPath)!);
 
             try
             {
-                // TODO: Find a better way to determine the OS platform enum at runtime.
-                OSPlatform osPlatform = RuntimeInformation.IsOSPlatform(OSPlatform.Windows) ? OSPlatform.Windows :
-                    RuntimeInformation.IsOSPlatform(OSPlatform.OSX) ? OSPlatform.OSX :
-                    RuntimeInformation.IsOSPlatform(OSPlatform.Linux) ? OSPlatform.Linux :
-                    throw new PlatformNotSupportedException($"Unsupported platform: '{RuntimeInformation.OSDescription}'.");
-
-                string downloadUrl = GetDownloadUrl(osPlatform, RuntimeInformation.ProcessArchitecture, freeThreaded, debug, version);
-
-                // Download and extract the Zstd tarball
-                logger?.LogDebug("Downloading Python from {DownloadUrl}", downloadUrl);
-                string tempFilePath = DownloadFileToTempDirectoryAsync(downloadUrl).GetAwaiter().GetResult();
-                string tarFilePath = DecompressZstFile(tempFilePath);
-                ExtractTar(tarFilePath, downloadPath, logger);
-                logger?.LogDebug("Extracted Python to {downloadPath}", downloadPath);
-
-                // Delete the tarball and temp file
-                File.Delete(tarFilePath);
-                File.Delete(tempFilePath);
+                // Stream the download through decompression and extraction, so the archive is
+                // never written to disk, and move the result into place once complete.
+                var installStart = Stopwatch.GetTimestamp();
+                using HttpClient client = new();
+                RedistributableInstaller.InstallAsync(client, downloadUrl, downloadPath, logger).GetAwaiter().GetResult();
+                logger?.LogInformation("Installed Python {Version} to {DownloadPath} in {Elapsed}", dottedVersion, downloadPath, Stopwatch.GetElapsedTime(installStart));
             }
             catch (Exception ex)
             {
                 logger?.LogError(ex, "Failed to download and extract Python");
-                // If the install failed somewhere, delete the folder incase it's half downloaded
-                if (Directory.Exists(installPath))
-                {
-                    Directory.Delete(installPath, true);
-                }
-
                 throw;
             }
 
@@ -258,75 +256,4 @@ internal class RedistributableLocator(ILogger<RedistributableLocator>? logger, R
 
         throw new PlatformNotSupportedException($"Unsupported platform: '{RuntimeInformation.OSDescription}'.");
     }
-
-    private static async Task<string> DownloadFileToTempDirectoryAsync(string fileUrl)
-    {
-        using HttpClient client = new();
-        var contentStream = await client.GetStreamAsync(fileUrl).ConfigureAwait(false);
-        await using (contentStream.ConfigureAwait(false))
-        {
-            string tempFilePath = Path.GetTempFileName();
-            var fileStream = new FileStream(tempFilePath, FileMode.Create, FileAccess.Write, FileShare.None);
-            await using (fileStream.ConfigureAwait(false))
-            {
-                await contentStream.CopyToAsync(fileStream).ConfigureAwait(false);
-            }
-
-            return tempFilePath;
-        }
-    }
-
-    private static string DecompressZstFile(string zstFilePath)
-    {
-        string tarFilePath = Path.ChangeExtension(zstFilePath, ".tar");
-        using var inputStream = new FileStream(zstFilePath, FileMode.Open, FileAccess.Read);
-        using var decompressor = new DecompressionStream(inputStream);
-        using var outputStream = new FileStream(tarFilePath, FileMode.Create, FileAccess.Write);
-        decompressor.CopyTo(outputStream);
-        return tarFilePath;
-    }
-
-    private static void ExtractTar(string tarFilePath, string extractPath, ILogger? logger)
-    {
-        using FileStream tarStream = File.OpenRead(tarFilePath);
-        using TarReader tarReader = new(tarStream);
-        TarEntry? entry;
-        List<(string, string)> symlinks = [];
-        while ((entry = tarReader.GetNextEntry()) is not null)
-        {
-            string entryPath = Path.Combine(extractPath, entry.Name);
-            if (entry.EntryType == TarEntryType.Directory)
-            {
-                Directory.CreateDirectory(entryPath);
-                logger?.LogDebug("Creating directory: {EntryPath}", entryPath);
-            }
-            else if (entry.EntryType == TarEntryType.RegularFile)
-            {
-                Directory.CreateDirectory(Path.GetDirectoryName(entryPath)!);
-                entry.ExtractToFile(entryPath, true);
-            }
-            else if (entry.EntryType == TarEntryType.SymbolicLink)
-            {
-                // Delay the creation of symlinks until after all files have been extracted
-                symlinks.Add((entryPath, entry.LinkName));
-            }
-            else
-            {
-                logger?.LogDebug("Skipping entry: {EntryPath} ({EntryType})", entryPath, entry.EntryType);
-            }
-        }
-        foreach (var (path, link) in symlinks)
-        {
-            logger?.LogDebug("Creating symlink: {Path} -> {Link}", path, link);
-            try
-            {
-                File.CreateSymbolicLink(path, link);
-            }
-            catch (DirectoryNotFoundException ex)
-            {
-                // This is common in the packages
-                logger?.LogWarning(ex, "Failed to create symlink: {Path} -> {Link}", path, link);
-            }
-        }
-    }
 }
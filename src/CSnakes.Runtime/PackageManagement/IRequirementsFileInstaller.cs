@@ -0,0 +1,13 @@
+namespace CSnakes.Runtime.PackageManagement;
+
+/// <summary>
+/// A package installer that installs from a requirements file, which allows the installation
+/// to be skipped when the requirements are already installed.
+/// </summary>
+internal interface IRequirementsFileInstaller
+{
+    /// <summary>
+    /// The name of the requirements file, relative to the home directory.
+    /// </summary>
+    string RequirementsFileName { get; }
+}
@@ -4,40 +4,37 @@ using System.Runtime.InteropServices;
 
 namespace CSnakes.Runtime.PackageManagement;
 
-internal class PipInstaller(ILogger<PipInstaller>? logger, IEnvironmentManagement? environmentManager, string requirementsFileName) : IPythonPackageInstaller
+internal class PipInstaller(ILogger<PipInstaller>? logger, IEnvironmentManagement? environmentManager, string requirementsFileName) : IPythonPackageInstaller, IRequirementsFileInstaller
 {
     static readonly string pipBinaryName = $"pip{(RuntimeInformation.IsOSPlatform(OSPlatform.Windows) ? ".exe" : "")}";
 
+    public string RequirementsFileName => requirementsFileName;
+
     public Task InstallPackagesFromRequirements(string home) => InstallPackagesFromRequirements(home, requirementsFileName);
 
-    public Task InstallPackagesFromRequirements(string home, string fileName)
+    public async Task InstallPackagesFromRequirements(string home, string fileName)
     {
         string requirementsPath = Path.GetFullPath(Path.Combine(home, fileName));
         if (File.Exists(requirementsPath))
         {
             logger?.LogDebug("File {Requirements} was found.", requirementsPath);
-            RunPipInstall(home, environmentManager, ["-r", fileName], logger);
+            await RunPipInstallAsync(home, environmentManager, ["-r", fileName], logger).ConfigureAwait(false);
         }
         else
         {
             logger?.LogWarning("File {Requirements} was not found.", requirementsPath);
         }
-
-        return Task.CompletedTask;
     }
 
     public Task InstallPackage(string package) => InstallPackages([package]);
 
-    public Task InstallPackages(string[] packages)
-    {
-        RunPipInstall(Directory.GetCurrentDirectory(), environmentManager, packages, logger);
-        return Task.CompletedTask;
-    }
+    public Task InstallPackages(string[] packages) =>
+        RunPipInstallAsync(Directory.GetCurrentDirectory(), environmentManager, packages, logger);
 
-    internal static void InstallPackageWithPip(string home, IEnvironmentManagement? environmentManager, string requirement, ILogger? logger)
-        => RunPipInstall(home, environmentManager, [requirement], logger);
+    internal static Task InstallPackageWithPipAsync(string home, IEnvironmentManagement? environmentManager, string requirement, ILogger? logger)
+        => RunPipInstallAsync(home, environmentManager, [requirement], logger);
 
-    private static void RunPipInstall(string home, IEnvironmentManagement? environmentManager, string[] requirements, ILogger? logger)
+    private static Task RunPipInstallAsync(string home, IEnvironmentManagement? environmentManager, string[] requirements, ILogger? logger)
     {
         string fileName = pipBinaryName;
         string workingDirectory = home;
@@ -56,11 +53,11 @@ internal class PipInstaller(ILogger<PipInstaller>? logger, IEnvironmentManagemen
             {
                 { "VIRTUAL_ENV", virtualEnvironmentLocation }
             };
-            ProcessUtils.ExecuteProcess(fileName, arguments, workingDirectory, path, logger, extraEnv);
+            return ProcessUtils.ExecuteProcessAsync(fileName, arguments, workingDirectory, path, logger, extraEnv);
         }
         else
         {
-            ProcessUtils.ExecuteProcess(fileName, arguments, workingDirectory, path, logger);
+            return ProcessUtils.ExecuteProcessAsync(fileName, arguments, workingDirectory, path, logger);
         }
     }
 }
@@ -0,0 +1,27 @@
+namespace CSnakes.Runtime.PackageManagement;
+
+/// <summary>
+/// Determines how the pip and uv installers decide whether the packages of a requirements file
+/// need to be installed when the Python environment starts.
+/// </summary>
+public enum RequirementsCheck
+{
+    /// <summary>
+    /// Always run the installer.
+    /// </summary>
+    None,
+
+    /// <summary>
+    /// Skip the installer when the requirements file, the Python interpreter and the
+    /// distributions installed in the virtual environment are unchanged since the installer last
+    /// ran successfully. The installer always runs when there is no virtual environment.
+    /// </summary>
+    Hash,
+
+    /// <summary>
+    /// Like <see cref="Hash"/>, but when the installer is skipped, also check in-process with
+    /// <c>importlib.metadata</c> that the requirements are installed, and run the installer if
+    /// any are missing.
+    /// </summary>
+    Verify,
+}
@@ -0,0 +1,127 @@
+using CSnakes.Runtime.Locators;
+using System.Security.Cryptography;
+using System.Text;
+
+namespace CSnakes.Runtime.PackageManagement;
+
+/// <summary>
+/// A file in a virtual environment that records a hash of what went into the last successful
+/// installation of a requirements file, so the installation can be skipped when nothing changed.
+/// </summary>
+/// <remarks>
+/// The hash covers the contents of the requirements file and of the files it includes with
+/// <c>-r</c> or <c>-c</c>, the Python interpreter, and the names of the distributions installed
+/// in the environment's <c>site-packages</c>, which include their versions. The hash is computed
+/// again after each installation, so distributions that are added, removed, upgraded or
+/// downgraded by other means invalidate it as well.
+/// </remarks>
+internal sealed class RequirementsMarker
+{
+    private static readonly string[] IncludeOptions = ["-r", "--requirement", "-c", "--constraint"];
+
+    private readonly string markerPath;
+    private readonly string sitePackagesPath;
+    private readonly PythonLocationMetadata location;
+
+    public RequirementsMarker(string environmentPath, string sitePackagesPath, PythonLocationMetadata location, string requirementsPath)
+    {
+        RequirementsPath = Path.GetFullPath(requirementsPath);
+        var pathHash = SHA256.HashData(Encoding.UTF8.GetBytes(RequirementsPath));
+        markerPath = Path.Join(environmentPath, $".csnakes-requirements-{Convert.ToHexString(pathHash, 0, 6).ToLowerInvariant()}");
+        this.sitePackagesPath = sitePackagesPath;
+        this.location = location;
+    }
+
+    public string RequirementsPath { get; }
+
+    /// <summary>
+    /// Determines whether the requirements were installed with the same requirements files,
+    /// interpreter and installed distributions as there are now.
+    /// </summary>
+    public bool IsCurrent()
+    {
+        try
+        {
+            return File.ReadAllText(markerPath) == ComputeHash();
+        }
+        catch (Exception ex) when (ex is FileNotFoundException or DirectoryNotFoundException)
+        {
+            return false;
+        }
+    }
+
+    /// <summary>
+    /// Records that the requirements have been installed successfully.
+    /// </summary>
+    public void Write() => File.WriteAllText(markerPath, ComputeHash());
+
+    internal string ComputeHash()
+    {
+        using var hash = IncrementalHash.CreateHash(HashAlgorithmName.SHA256);
+
+        Append(hash, $"python={location.Version};debug={location.Debug};freethreaded={location.FreeThreaded};binary={location.PythonBinaryPath}");
+        AppendRequirementsFile(hash, RequirementsPath, []);
+
+        if (Directory.Exists(sitePackagesPath))
+        {
+            var distributions = Directory.EnumerateDirectories(sitePackagesPath, "*-info")
+                                         .Select(Path.GetFileName)
+                                         .Where(name => name!.EndsWith(".dist-info", StringComparison.OrdinalIgnoreCase)
+                                                     || name!.EndsWith(".egg-info", StringComparison.OrdinalIgnoreCase))
+                                         .Order(StringComparer.Ordinal);
+            foreach (var name in distributions)
+                Append(hash, $"distribution={name}");
+        }
+
+        return Convert.ToHexString(hash.GetHashAndReset()).ToLowerInvariant();
+    }
+
+    private static void AppendRequirementsFile(IncrementalHash hash, string path, HashSet<string> seen)
+    {
+        if (!seen.Add(path))
+            return;
+
+        Append(hash, $"file={path}");
+
+        if (!File.Exists(path))
+        {
+            Append(hash, "missing");
+            return;
+        }
+
+        var contents = File.ReadAllText(path);
+        Append(hash, contents);
+
+        using var reader = new StringReader(contents);
+        while (reader.ReadLine() is { } line)
+        {
+            if (GetIncludedFile(line.Trim()) is { } included)
+                AppendRequirementsFile(hash, Path.GetFullPath(Path.Combine(Path.GetDirectoryName(path)!, included)), seen);
+        }
+    }
+
+    private static string? GetIncludedFile(string line)
+    {
+        foreach (var option in IncludeOptions)
+        {
+            if (!line.StartsWith(option, StringComparison.Ordinal))
+                continue;
+
+            var rest = line.AsSpan(option.Length);
+            if (rest.Length > 0 && (rest[0] == '=' || char.IsWhiteSpace(rest[0])))
+            {
+                var file = rest[1..].Trim();
+                var comment = file.IndexOf(" #", StringComparison.Ordinal);
+                return (comment >= 0 ? file[..comment].TrimEnd() : file).ToString();
+            }
+        }
+
+        return null;
+    }
+
+    private static void Append(IncrementalHash hash, string value)
+    {
+        hash.AppendData(Encoding.UTF8.GetBytes(value));
+        hash.AppendData("\n"u8);
+    }
+}
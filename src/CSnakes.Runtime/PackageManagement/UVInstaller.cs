@@ -4,37 +4,34 @@ using System.Runtime.InteropServices;
 
 namespace CSnakes.Runtime.PackageManagement;
 
-internal class UVInstaller(ILogger<UVInstaller>? logger, IEnvironmentManagement? environmentManager, string requirementsFileName) : IPythonPackageInstaller
+internal class UVInstaller(ILogger<UVInstaller>? logger, IEnvironmentManagement? environmentManager, string requirementsFileName) : IPythonPackageInstaller, IRequirementsFileInstaller
 {
     static readonly string binaryName = $"uv{(RuntimeInformation.IsOSPlatform(OSPlatform.Windows) ? ".exe" : "")}";
 
+    public string RequirementsFileName => requirementsFileName;
+
     public Task InstallPackagesFromRequirements(string home) => InstallPackagesFromRequirements(home, requirementsFileName);
 
-    public Task InstallPackagesFromRequirements(string home, string fileName)
+    public async Task InstallPackagesFromRequirements(string home, string fileName)
     {
         string requirementsPath = Path.GetFullPath(Path.Combine(home, fileName));
         if (File.Exists(requirementsPath))
         {
             logger?.LogDebug("File {Requirements} was found.", fileName);
-            RunUvPipInstall(home, environmentManager, ["-r", requirementsFileName], logger);
+            await RunUvPipInstallAsync(home, environmentManager, ["-r", requirementsFileName], logger).ConfigureAwait(false);
         }
         else
         {
             logger?.LogWarning("File {Requirements} was not found.", fileName);
         }
-
-        return Task.CompletedTask;
     }
 
     public Task InstallPackage(string package) => InstallPackages([package]);
 
-    public Task InstallPackages(string[] packages)
-    {
-        RunUvPipInstall(Directory.GetCurrentDirectory(), environmentManager, packages, logger);
-        return Task.CompletedTask;
-    }
+    public Task InstallPackages(string[] packages) =>
+        RunUvPipInstallAsync(Directory.GetCurrentDirectory(), environmentManager, packages, logger);
 
-    static private void RunUvPipInstall(string home, IEnvironmentManagement? environmentManager, string[] requirements, ILogger? logger)
+    static private async Task RunUvPipInstallAsync(string home, IEnvironmentManagement? environmentManager, string[] requirements, ILogger? logger)
     {
         string fileName = binaryName;
         string workingDirectory = home;
@@ -52,7 +49,7 @@ internal class UVInstaller(ILogger<UVInstaller>? logger, IEnvironmentManagement?
             if (!File.Exists(uvPath))
             {
                 // Install it with pip
-                PipInstaller.InstallPackageWithPip(home, environmentManager, "uv", logger);
+                await PipInstaller.InstallPackageWithPipAsync(home, environmentManager, "uv", logger).ConfigureAwait(false);
             }
 
             fileName = uvPath;
@@ -64,11 +61,11 @@ internal class UVInstaller(ILogger<UVInstaller>? logger, IEnvironmentManagement?
                 { "UV_NO_CACHE", Environment.GetEnvironmentVariable("UV_NO_CACHE") }
             };
 
-            ProcessUtils.ExecuteProcess(fileName, arguments, workingDirectory, path, logger, extraEnv);
+            await ProcessUtils.ExecuteProcessAsync(fileName, arguments, workingDirectory, path, logger, extraEnv).ConfigureAwait(false);
         }
         else
         {
-            ProcessUtils.ExecuteProcess(fileName, arguments, workingDirectory, path, logger);
+            await ProcessUtils.ExecuteProcessAsync(fileName, arguments, workingDirectory, path, logger).ConfigureAwait(false);
         }
 
     }
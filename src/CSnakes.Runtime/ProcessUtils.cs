@@ -7,7 +7,7 @@ namespace CSnakes.Runtime;
 
 internal static class ProcessUtils
 {
-    internal static (int exitCode, string? result, string? errors) ExecutePythonCommand(ILogger? logger, PythonLocationMetadata pythonLocation, params string[] arguments)
+    internal static Task<(int exitCode, string? result, string? errors)> ExecutePythonCommandAsync(ILogger? logger, PythonLocationMetadata pythonLocation, CancellationToken cancellationToken, params string[] arguments)
     {
 
         ProcessStartInfo startInfo = new(pythonLocation.PythonBinaryPath, arguments)
@@ -17,7 +17,7 @@ internal static class ProcessUtils
             RedirectStandardOutput = true,
             CreateNoWindow = true,
         };
-        return ExecuteCommand(logger, startInfo);
+        return ExecuteCommandAsync(logger, startInfo, cancellationToken);
     }
 
     internal static (int exitCode, string? result, string? errors) ExecuteCommand(ILogger? logger, string fileName, params string[] arguments)
@@ -28,7 +28,7 @@ internal static class ProcessUtils
             RedirectStandardOutput = true,
             CreateNoWindow = true,
         };
-        return ExecuteCommand(logger, startInfo);
+        return ExecuteCommandAsync(logger, startInfo, CancellationToken.None).GetAwaiter().GetResult();
     }
 
     internal static bool ExecuteShellCommand(ILogger? logger, string fileName, params string[] arguments)
@@ -47,7 +47,7 @@ internal static class ProcessUtils
     }
 
 
-    private static (int exitCode, string? result, string? errors) ExecuteCommand(ILogger? logger, ProcessStartInfo startInfo)
+    private static async Task<(int exitCode, string? result, string? errors)> ExecuteCommandAsync(ILogger? logger, ProcessStartInfo startInfo, CancellationToken cancellationToken)
     {
         using Process process = new() { StartInfo = startInfo };
         string? result = null;
@@ -73,11 +73,11 @@ internal static class ProcessUtils
         process.Start();
         process.BeginErrorReadLine();
         process.BeginOutputReadLine();
-        process.WaitForExit();
+        await process.WaitForExitAsync(cancellationToken).ConfigureAwait(false);
         return (process.ExitCode, result, errors);
     }
 
-    internal static void ExecuteProcess(string fileName, IEnumerable<string> arguments, string workingDirectory, string path, ILogger? logger, IReadOnlyDictionary<string, string?>? extraEnv = null)
+    internal static async Task ExecuteProcessAsync(string fileName, IEnumerable<string> arguments, string workingDirectory, string path, ILogger? logger, IReadOnlyDictionary<string, string?>? extraEnv = null, CancellationToken cancellationToken = default)
     {
         ProcessStartInfo startInfo = new(fileName, arguments)
         {
@@ -120,7 +120,7 @@ internal static class ProcessUtils
         process.Start();
         process.BeginErrorReadLine();
         process.BeginOutputReadLine();
-        process.WaitForExit();
+        await process.WaitForExitAsync(cancellationToken).ConfigureAwait(false);
 
         if (process.ExitCode != 0)
         {
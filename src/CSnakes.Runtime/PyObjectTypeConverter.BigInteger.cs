@@ -6,12 +6,11 @@ namespace CSnakes.Runtime;
 internal partial class PyObjectTypeConverter
 {
     internal static BigInteger ConvertToBigInteger(PyObject pyObject, Type destinationType) =>
-        // There is no practical API for this in CPython. Use str() instead.
-        BigInteger.Parse(pyObject.ToString());
+        CPythonAPI.IsPyLong(pyObject)
+            ? CPythonAPI.PyLong_AsBigInteger(pyObject)
+            // Not an int, so fall back to parsing whatever str() gives.
+            : BigInteger.Parse(pyObject.ToString());
 
-    internal static PyObject ConvertFromBigInteger(BigInteger integer)
-    {
-        using PyObject pyUnicode = PyObject.Create(CPythonAPI.AsPyUnicodeObject(integer.ToString()));
-        return PyObject.Create(CPythonAPI.PyLong_FromUnicodeObject(pyUnicode, 10));
-    }
+    internal static PyObject ConvertFromBigInteger(BigInteger integer) =>
+        PyObject.Create(CPythonAPI.PyLong_FromBigInteger(integer));
 }
@@ -0,0 +1,128 @@
+using CSnakes.Runtime.CPython;
+
+namespace CSnakes.Runtime.Python;
+
+/// <summary>
+/// Exposes a Python <see
+/// href="https://docs.python.org/3/library/collections.abc.html#collections.abc.AsyncIterator"><c>collections.abc.AsyncIterator</c></see>
+/// (such as an asynchronous generator) as an <see cref="IAsyncEnumerable{T}"/>.
+/// </summary>
+/// <remarks>
+/// Each call to <see cref="IAsyncEnumerator{T}.MoveNextAsync"/> awaits exactly one
+/// <c>__anext__</c> on the shared event loop, so the Python side never runs ahead of the
+/// consumer. Cancelling the token passed to <see cref="GetAsyncEnumerator"/> cancels the
+/// pending <c>__anext__</c> on the event loop. All steps of one enumeration run on the same
+/// event loop, since the generator may hold on to objects bound to that loop. The Python
+/// iterator is released when the first enumeration ends, which leaves it exhausted or closed, so
+/// later enumerations yield no items.
+/// </remarks>
+internal sealed class AsyncIterator<T, TImporter>(PyObject asyncIterator) :
+    IAsyncEnumerable<T>
+    where TImporter : IPyObjectImporter<T>
+{
+    private PyObject? asyncIterator = asyncIterator;
+
+    public async IAsyncEnumerator<T> GetAsyncEnumerator(CancellationToken cancellationToken = default)
+    {
+        if (Interlocked.Exchange(ref this.asyncIterator, null) is not { } iterator)
+            yield break;
+
+        PyObject anext;
+        EventLoop eventLoop;
+        using (GIL.Acquire())
+        {
+            anext = iterator.GetAttr("__anext__");
+            eventLoop = CPythonAPI.GetEventLoop();
+        }
+
+        var exhausted = false;
+        try
+        {
+            while (true)
+            {
+                cancellationToken.ThrowIfCancellationRequested();
+
+                var result = await NextAsync(anext, eventLoop, cancellationToken).ConfigureAwait(false);
+                if (result is null)
+                {
+                    exhausted = true;
+                    yield break;
+                }
+
+                T item;
+                using (GIL.Acquire())
+                using (result)
+                    item = TImporter.BareImport(result);
+
+                yield return item;
+            }
+        }
+        finally
+        {
+            using (GIL.Acquire())
+                anext.Dispose();
+
+            // If iteration stopped early (break, exception or cancellation), close the
+            // asynchronous generator so that its "finally" blocks run on the event loop.
+
+            try
+            {
+                if (!exhausted)
+                    await CloseAsync(iterator, eventLoop).ConfigureAwait(false);
+            }
+            finally
+            {
+                using (GIL.Acquire())
+                    iterator.Dispose();
+            }
+        }
+    }
+
+    /// <summary>
+    /// Awaits the next item, returning <see langword="null"/> when the iterator raises
+    /// <c>StopAsyncIteration</c>.
+    /// </summary>
+    private static async Task<PyObject?> NextAsync(PyObject anext, EventLoop eventLoop, CancellationToken cancellationToken)
+    {
+        PyObject awaitable;
+        using (GIL.Acquire())
+            awaitable = anext.Call();
+
+        try
+        {
+            return await Awaitable.InternalWaitAsync(awaitable, eventLoop, cancellationToken).ConfigureAwait(false);
+        }
+        catch (PythonInvocationException ex) when (ex.PythonExceptionType == "StopAsyncIteration")
+        {
+            return null;
+        }
+        finally
+        {
+            using (GIL.Acquire())
+                awaitable.Dispose();
+        }
+    }
+
+    private static async Task CloseAsync(PyObject iterator, EventLoop eventLoop)
+    {
+        PyObject awaitable;
+        using (GIL.Acquire())
+        {
+            if (!iterator.HasAttr("aclose"))
+                return;
+
+            using var aclose = iterator.GetAttr("aclose");
+            awaitable = aclose.Call();
+        }
+
+        try
+        {
+            using var _ = await Awaitable.InternalWaitAsync(awaitable, eventLoop, CancellationToken.None).ConfigureAwait(false);
+        }
+        finally
+        {
+            using (GIL.Acquire())
+                awaitable.Dispose();
+        }
+    }
+}
@@ -63,7 +63,21 @@ public static class Awaitable
         Task<PyObject> task;
 
         using (GIL.Acquire())
-            task = CPythonAPI.GetDefaultEventLoop().RunAsync(awaitable, cancellationToken);
+            task = CPythonAPI.GetEventLoop().RunAsync(awaitable, cancellationToken);
+
+        return await task.ConfigureAwait(false);
+    }
+
+    /// <summary>
+    /// Same as <see cref="InternalWaitAsync(PyObject, CancellationToken)"/> except the awaitable
+    /// is run on the given event loop.
+    /// </summary>
+    internal static async Task<PyObject> InternalWaitAsync(PyObject awaitable, EventLoop eventLoop, CancellationToken cancellationToken)
+    {
+        Task<PyObject> task;
+
+        using (GIL.Acquire())
+            task = eventLoop.RunAsync(awaitable, cancellationToken);
 
         return await task.ConfigureAwait(false);
     }
@@ -21,6 +21,10 @@ namespace CSnakes.Runtime.Python;
  * Some potential improvements -
  *   - Consider saving the Python Thread State pointer in TLS and use the PyEval_SaveThread and PyEval_RestoreThread functions to save and restore the thread state.
  *   - Consider queuing the Dispose of PyObject/SafeHandles so they can be processed in collections, rather than switching the GIL in the finalizer thread. I don't know if the GC Finalizer spawns a thread per object or a thread pool?
+ *
+ * Handles and buffers released without the GIL, e.g. by the GC finalizer thread, are queued. Every thread that releases the GIL
+ * drains at most a small slice of the queue, so that a request thread never inherits a large backlog, and a background reaper
+ * thread drains the rest in slices, releasing the GIL in between, either periodically or as soon as the queue grows past a threshold.
  */
 
 public static class GIL
@@ -29,6 +33,38 @@ public static class GIL
     [ThreadStatic] internal static nint pythonThreadState;
     private static ConcurrentQueue<nint> handlesToDispose = new();
     private static ConcurrentQueue<CPythonAPI.Py_buffer> buffersToDispose = new();
+    private static int pendingDisposals;
+
+    /// <summary>
+    /// Maximum number of queued handles and buffers released by a thread as it releases the GIL.
+    /// </summary>
+    internal const int MaxDisposalsPerRelease = 256;
+
+    /// <summary>
+    /// Maximum number of queued handles and buffers released by the reaper per GIL acquisition.
+    /// </summary>
+    internal const int MaxDisposalsPerReaperSlice = 1024;
+
+    /// <summary>
+    /// Number of queued handles and buffers at which the reaper is woken up without waiting for
+    /// <see cref="ReaperInterval"/> to elapse.
+    /// </summary>
+    internal const int ReaperThreshold = 4096;
+
+    private static readonly TimeSpan ReaperInterval = TimeSpan.FromMilliseconds(100);
+    private static readonly AutoResetEvent reaperSignal = new(false);
+    // The nested Lock struct hides the global Lock alias, so it is spelled out here.
+#if NET9_0_OR_GREATER
+    private static readonly System.Threading.Lock reaperLock = new();
+#else
+    private static readonly object reaperLock = new();
+#endif
+    private static Thread? reaperThread;
+    private static bool reaperEnabled;
+    private static int reaperGeneration;
+
+    private static readonly KeyValuePair<string, object?> ReleaseDrainerTag = new("csnakes.gil.drainer", "release");
+    private static readonly KeyValuePair<string, object?> ReaperDrainerTag = new("csnakes.gil.drainer", "reaper");
 
     static GIL()
     {
@@ -74,14 +110,7 @@ public static class GIL
             }
             // Before we release, take a few handles from the queue and dispose them
             GC.SuppressFinalize(this);
-            while (handlesToDispose.TryDequeue(out nint handle))
-            {
-                CPythonAPI.Py_DecRefRaw(handle);
-            }
-            while (buffersToDispose.TryDequeue(out var buffer))
-            {
-                CPythonAPI.ReleaseBuffer(ref buffer);
-            }
+            _ = DrainDisposalQueues(MaxDisposalsPerRelease, ReleaseDrainerTag);
             pythonThreadState = CPythonAPI.PyEval_SaveThread();
         }
 
@@ -116,6 +145,7 @@ public static class GIL
     {
         // Put the handle in a queue
         handlesToDispose.Enqueue(handle);
+        OnQueuedForDisposal();
     }
 
     /// <remarks>
@@ -126,6 +156,120 @@ public static class GIL
         // Put the buffer in a queue
         buffersToDispose.Enqueue(buffer);
         buffer = default;
+        OnQueuedForDisposal();
+    }
+
+    /// <summary>
+    /// Number of handles and buffers queued for disposal that haven't been released yet.
+    /// </summary>
+    internal static int PendingDisposals => Volatile.Read(ref pendingDisposals);
+
+    private static void OnQueuedForDisposal()
+    {
+        RuntimeMetrics.DisposalQueueDepth.Add(1);
+        if (Interlocked.Increment(ref pendingDisposals) >= ReaperThreshold)
+            reaperSignal.Set();
+    }
+
+    /// <summary>
+    /// Releases up to <paramref name="maxCount"/> queued handles and buffers. The GIL must be held.
+    /// </summary>
+    /// <returns>The number of handles and buffers released.</returns>
+    private static int DrainDisposalQueues(int maxCount, KeyValuePair<string, object?> drainerTag)
+    {
+        if (Volatile.Read(ref pendingDisposals) == 0)
+            return 0;
+
+        var start = Stopwatch.GetTimestamp();
+        var count = 0;
+        while (count < maxCount && handlesToDispose.TryDequeue(out nint handle))
+        {
+            CPythonAPI.Py_DecRefRaw(handle);
+            count++;
+        }
+        while (count < maxCount && buffersToDispose.TryDequeue(out var buffer))
+        {
+            CPythonAPI.ReleaseBuffer(ref buffer);
+            count++;
+        }
+
+        if (count > 0)
+        {
+            _ = Interlocked.Add(ref pendingDisposals, -count);
+            RuntimeMetrics.DisposalQueueDepth.Add(-count);
+            RuntimeMetrics.Disposals.Add(count, drainerTag);
+            RuntimeMetrics.DisposalDrainTime.Record(Stopwatch.GetElapsedTime(start).TotalSeconds, drainerTag);
+        }
+
+        return count;
+    }
+
+    /// <summary>
+    /// Releases every queued handle and buffer. The GIL must be held.
+    /// </summary>
+    internal static void DrainDisposalQueues() =>
+        _ = DrainDisposalQueues(int.MaxValue, ReleaseDrainerTag);
+
+    /// <summary>
+    /// Lets the reaper release queued handles and buffers, starting its thread on first use. Called
+    /// once Python has been initialized.
+    /// </summary>
+    internal static void EnableReaper()
+    {
+        lock (reaperLock)
+        {
+            reaperEnabled = true;
+            reaperGeneration++;
+            if (reaperThread is null)
+            {
+                reaperThread = new Thread(RunReaper) { IsBackground = true, Name = "CSnakes disposal reaper" };
+                reaperThread.Start();
+            }
+        }
+        reaperSignal.Set();
+    }
+
+    /// <summary>
+    /// Stops the reaper from acquiring the GIL, waiting for a slice in progress to complete. Called
+    /// before Python is finalized.
+    /// </summary>
+    internal static void DisableReaper()
+    {
+        lock (reaperLock)
+            reaperEnabled = false;
+    }
+
+    private static void RunReaper()
+    {
+        var generation = 0;
+        while (true)
+        {
+            _ = reaperSignal.WaitOne(ReaperInterval);
+
+            // Release the GIL between slices so that threads waiting for it aren't held up for the
+            // whole backlog.
+
+            while (PendingDisposals > 0)
+            {
+                lock (reaperLock)
+                {
+                    if (!reaperEnabled)
+                        break;
+
+                    if (generation != reaperGeneration)
+                    {
+                        // Python was finalized and initialized again since this thread last held
+                        // the GIL, so its thread state is gone.
+                        generation = reaperGeneration;
+                        currentState = null;
+                        pythonThreadState = 0;
+                    }
+
+                    using (Acquire())
+                        _ = DrainDisposalQueues(MaxDisposalsPerReaperSlice, ReaperDrainerTag);
+                }
+            }
+        }
     }
 
     public static bool IsAcquired => currentState is { RecursionCount: > 0 };
@@ -1,3 +1,4 @@
+using CSnakes.Runtime.CPython;
 using System.Collections;
 using System.Diagnostics.CodeAnalysis;
 
@@ -9,8 +10,44 @@ internal sealed class GeneratorIterator<TYield, TSend, TReturn>(PyObject corouti
                       PyObjectImporters.Runtime<TYield>,
                       PyObjectImporters.Runtime<TReturn>>(coroutine);
 
+public static class GeneratorIterator
+{
+    /// <summary>
+    /// Advances the generator up to as many times as there are elements in
+    /// <paramref name="destination"/>, storing each yielded value, while holding the GIL for the
+    /// whole batch.
+    /// </summary>
+    /// <returns>
+    /// The number of values stored in <paramref name="destination"/>. A number smaller than the
+    /// length of <paramref name="destination"/> means the generator has finished and that
+    /// <see cref="IGeneratorIterator{TYield, TSend, TReturn}.Return"/> is available.
+    /// </returns>
+    public static int MoveNextBatch<TYield, TSend, TReturn>(this IGeneratorIterator<TYield, TSend, TReturn> generator,
+                                                            Span<TYield> destination)
+    {
+        ArgumentNullException.ThrowIfNull(generator);
+
+        if (generator is IBatchedGeneratorIterator<TYield> batched)
+            return batched.MoveNextBatch(destination);
+
+        var count = 0;
+        using (GIL.Acquire())
+        {
+            while (count < destination.Length && generator.MoveNext())
+                destination[count++] = generator.Current;
+        }
+        return count;
+    }
+}
+
+internal interface IBatchedGeneratorIterator<TYield>
+{
+    int MoveNextBatch(Span<TYield> destination);
+}
+
 internal class GeneratorIterator<TYield, TSend, TReturn, TYieldImporter, TReturnImporter>(PyObject generator) :
-    IGeneratorIterator<TYield, TSend, TReturn>
+    IGeneratorIterator<TYield, TSend, TReturn>,
+    IBatchedGeneratorIterator<TYield>
     where TYieldImporter : IPyObjectImporter<TYield>
     where TReturnImporter : IPyObjectImporter<TReturn>
 {
@@ -59,6 +96,53 @@ internal class GeneratorIterator<TYield, TSend, TReturn, TYieldImporter, TReturn
     }
 
     private bool Send(PyObject value)
+    {
+        if (!CPythonAPI.IsPyIterSendSupported)
+            return SendWithStopIteration(value);
+
+        using (GIL.Acquire())
+            return BareSend(value);
+    }
+
+    public int MoveNextBatch(Span<TYield> destination)
+    {
+        var count = 0;
+        using (GIL.Acquire())
+        {
+            while (count < destination.Length
+                   && (CPythonAPI.IsPyIterSendSupported ? BareSend(PyObject.None) : SendWithStopIteration(PyObject.None)))
+            {
+                destination[count++] = current;
+            }
+        }
+        return count;
+    }
+
+    /// <remarks>
+    /// It is the responsibility of the caller to ensure that the GIL is acquired.
+    /// </remarks>
+    private bool BareSend(PyObject value)
+    {
+        switch (CPythonAPI.PyIter_Send(generator, value, out var result))
+        {
+            case CPythonAPI.PySendResult.Next:
+            {
+                using var yielded = PyObject.Create(result);
+                current = yielded.BareImportAs<TYield, TYieldImporter>();
+                return true;
+            }
+            case CPythonAPI.PySendResult.Return:
+            {
+                using var @return = PyObject.Create(result);
+                this.@return = @return.BareImportAs<TReturn, TReturnImporter>();
+                return false;
+            }
+            default:
+                throw PyObject.ThrowPythonExceptionAsClrException();
+        }
+    }
+
+    private bool SendWithStopIteration(PyObject value)
     {
         try
         {
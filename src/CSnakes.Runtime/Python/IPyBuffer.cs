@@ -21,6 +21,14 @@ public interface IPyBuffer : IDisposable
     /// </summary>
     bool IsScalar { get; }
 
+    /// <summary>
+    /// Indicates if the items are laid out in row-major (C) order without gaps. Views such as
+    /// <c>AsSpan</c> require a contiguous buffer, whereas strided buffers, e.g. from a sliced or
+    /// transposed NumPy array, can be read through <c>AsSpan2D</c> when only their rows are spaced
+    /// apart, through <c>AsTensorSpan</c>, or copied with <see cref="CopyTo{T}"/>.
+    /// </summary>
+    bool IsContiguous { get; }
+
     /// <summary>
     /// Gets the item type of the values in the buffer.
     /// </summary>
@@ -33,6 +41,18 @@ public interface IPyBuffer : IDisposable
     Span2D<T> AsSpan2D<T>() where T : unmanaged;
     ReadOnlySpan2D<T> AsReadOnlySpan2D<T>() where T : unmanaged;
 
+    /// <summary>
+    /// Copies the items of the buffer into <paramref name="destination"/> in row-major (C) order,
+    /// whatever the strides of the buffer.
+    /// </summary>
+    void CopyTo<T>(Span<T> destination) where T : unmanaged;
+
+    /// <summary>
+    /// Copies the items of the buffer into a new array in row-major (C) order, whatever the
+    /// strides of the buffer.
+    /// </summary>
+    T[] ToArray<T>() where T : unmanaged;
+
 
 #if NET9_0_OR_GREATER
     TensorSpan<T> AsTensorSpan<T>() where T : unmanaged;
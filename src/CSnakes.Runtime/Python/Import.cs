@@ -33,6 +33,45 @@ public static class Import
         }
     }
 
+    /// <summary>
+    /// Imports a module from its bytecode, falling back to compiling its source when there is no
+    /// bytecode or it was compiled for another version of Python.
+    /// </summary>
+    /// <param name="bytecode">
+    /// The magic number of the Python that compiled the module, as given by
+    /// <c>importlib.util.MAGIC_NUMBER</c>, followed by its code object marshalled with
+    /// <c>marshal.dumps</c>; or <see langword="null"/> to compile the source.
+    /// </param>
+    public static PyObject ImportModule(string module, ReadOnlySpan<byte> u8Source, string path, Stream? bytecode)
+    {
+        ArgumentException.ThrowIfNullOrEmpty(module);
+        if (u8Source.Length == 0)
+            throw new ArgumentException("Source code cannot be empty.", nameof(u8Source));
+        ArgumentException.ThrowIfNullOrEmpty(path);
+
+        if (bytecode is null)
+            return ImportModule(module, u8Source, path);
+
+        var u8Bytecode = ReadBytecode(bytecode);
+
+        using (GIL.Acquire())
+        {
+            return CPythonAPI.ImportBytecode(module, u8Bytecode, path)
+                ?? CPythonAPI.Import(module, u8Source, path);
+        }
+    }
+
+    private static unsafe ReadOnlySpan<byte> ReadBytecode(Stream stream)
+    {
+        // Unmanaged memory, such as that of a resource embedded in an assembly, is read in place.
+        if (stream is UnmanagedMemoryStream memory)
+            return new ReadOnlySpan<byte>(memory.PositionPointer, checked((int)(memory.Length - memory.Position)));
+
+        using var buffer = new MemoryStream();
+        stream.CopyTo(buffer);
+        return buffer.ToArray();
+    }
+
     public static void ReloadModule(ref PyObject module)
     {
         using (GIL.Acquire())
@@ -0,0 +1,70 @@
+using CSnakes.Runtime.CPython;
+using System.Diagnostics.CodeAnalysis;
+
+namespace CSnakes.Runtime.Python.Interns;
+
+/// <summary>
+/// A table of Python <c>int</c> objects for a range of small integers, mirroring the cache CPython
+/// keeps for -5 to 256, so that converting one of them from .NET allocates neither a Python object
+/// nor a .NET wrapper.
+/// </summary>
+/// <remarks>
+/// Entries are created on first use and kept for the lifetime of the Python runtime.
+/// </remarks>
+internal sealed class SmallIntegerTable
+{
+    /// <summary>
+    /// The largest difference between the bounds of the range, which bounds the size of the table.
+    /// </summary>
+    internal const long MaxRange = 1 << 20;
+
+    private readonly PyObject?[] entries;
+
+    public SmallIntegerTable(int min, int max)
+    {
+        ArgumentOutOfRangeException.ThrowIfGreaterThan(min, max);
+        ArgumentOutOfRangeException.ThrowIfGreaterThan((long)max - min, MaxRange);
+        Min = min;
+        Max = max;
+        entries = new PyObject?[(long)max - min + 1];
+    }
+
+    public int Min { get; }
+    public int Max { get; }
+
+    public bool TryGet(long value, [NotNullWhen(true)] out PyObject? obj)
+    {
+        if (value < Min || value > Max)
+        {
+            obj = null;
+            return false;
+        }
+
+        ref var entry = ref entries[value - Min];
+        if (entry is null)
+        {
+            var created = new ImmortalSmallInteger((int)value);
+            if (Interlocked.CompareExchange(ref entry, created, null) is not null)
+            {
+                // Another thread won the race, so release the reference taken for this one.
+                using (GIL.Acquire())
+                    CPythonAPI.Py_DecRefRaw(created.DangerousGetHandle());
+            }
+        }
+
+        obj = entry;
+        return true;
+    }
+
+    /// <summary>
+    /// Releases the references held by the table. The GIL must be held.
+    /// </summary>
+    public void Clear()
+    {
+        for (var i = 0; i < entries.Length; i++)
+        {
+            if (Interlocked.Exchange(ref entries[i], null) is { } entry)
+                CPythonAPI.Py_DecRefRaw(entry.DangerousGetHandle());
+        }
+    }
+}
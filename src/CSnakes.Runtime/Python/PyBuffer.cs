@@ -56,6 +56,7 @@ internal sealed class PyBuffer : IPyBuffer
             CPythonAPI.GetBuffer(exporter, out _buffer);
         }
         IsScalar = _buffer.ndim is 0 or 1;
+        IsContiguous = IsCContiguous(in _buffer);
         _format = Utf8StringMarshaller.ConvertToManaged(_buffer.format) ?? string.Empty;
         _byteOrder = GetByteOrder();
     }
@@ -118,6 +119,8 @@ internal sealed class PyBuffer : IPyBuffer
 
     public int Dimensions => Buffer.ndim switch { 0 => 1, var n => n };
 
+    public bool IsContiguous { get; }
+
     private unsafe ReadOnlySpan<nint> Shape
     {
         get
@@ -166,6 +169,37 @@ internal sealed class PyBuffer : IPyBuffer
     public ReadOnlySpan<T> AsReadOnlySpan<T>() where T : unmanaged => AsReadOnlySpanInternal<T>();
     public Span2D<T> AsSpan2D<T>() where T : unmanaged => AsSpan2DInternal<T>();
     public ReadOnlySpan2D<T> AsReadOnlySpan2D<T>() where T : unmanaged => AsReadOnlySpan2DInternal<T>();
+    public void CopyTo<T>(Span<T> destination) where T : unmanaged => CopyToInternal(destination);
+
+    public T[] ToArray<T>() where T : unmanaged
+    {
+        ValidateBufferCommon<T>();
+        var array = new T[Length / Unsafe.SizeOf<T>()];
+        CopyToInternal<T>(array);
+        return array;
+    }
+
+    /// <summary>
+    /// Determines whether the buffer is laid out in row-major (C) order without gaps, the same way
+    /// <c>PyBuffer_IsContiguous</c> does.
+    /// </summary>
+    private static unsafe bool IsCContiguous(in CPythonAPI.Py_buffer buffer)
+    {
+        if (buffer.ndim == 0 || buffer.strides is null)
+            return true;
+
+        nint expected = buffer.itemsize;
+        for (int i = buffer.ndim - 1; i >= 0; i--)
+        {
+            var length = buffer.shape[i];
+            if (length == 0)
+                return true;
+            if (length != 1 && buffer.strides[i] != expected)
+                return false;
+            expected *= length;
+        }
+        return true;
+    }
 
     private ByteOrder GetByteOrder()
     {
@@ -204,6 +238,14 @@ internal sealed class PyBuffer : IPyBuffer
         }
     }
 
+    private void EnsureContiguous()
+    {
+        if (!IsContiguous)
+        {
+            throw new InvalidOperationException("Buffer is not C-contiguous, use CopyTo or ToArray to copy it into contiguous memory.");
+        }
+    }
+
     private unsafe void EnsureShapeAndStrides()
     {
         if (Buffer.shape is null || Buffer.strides is null)
@@ -240,8 +282,19 @@ internal sealed class PyBuffer : IPyBuffer
         {
             throw new InvalidOperationException("Buffer length is not equal to shape");
         }
+        // Rows may be spaced apart, which the pitch accounts for, but the items within a row
+        // must be adjacent.
+        var strides = new ReadOnlySpan<nint>(Buffer.strides, 2);
+        if ((Shape[1] > 1 && strides[1] != sizeof(T))
+            || (Shape[0] > 1 && (strides[0] < Shape[1] * sizeof(T) || strides[0] % sizeof(T) != 0)))
+        {
+            throw new InvalidOperationException("Buffer rows are not contiguous, use CopyTo or ToArray to copy it into contiguous memory.");
+        }
     }
 
+    private unsafe int GetPitch2D<T>() where T : unmanaged =>
+        Shape[0] > 1 ? (int)(Buffer.strides[0] / sizeof(T) - Shape[1]) : 0; // pitch = row stride - width, in items
+
     private unsafe Span<T> AsSpanInternal<T>() where T : unmanaged
     {
         if (IsReadOnly)
@@ -250,6 +303,7 @@ internal sealed class PyBuffer : IPyBuffer
         }
         ValidateBufferCommon<T>();
         EnsureScalar();
+        EnsureContiguous();
         return new Span<T>((void*)Buffer.buf, (int)(Length / sizeof(T)));
     }
 
@@ -257,6 +311,7 @@ internal sealed class PyBuffer : IPyBuffer
     {
         ValidateBufferCommon<T>();
         EnsureScalar();
+        EnsureContiguous();
         return new ReadOnlySpan<T>((void*)Buffer.buf, (int)(Length / sizeof(T)));
     }
 
@@ -273,7 +328,7 @@ internal sealed class PyBuffer : IPyBuffer
             (void*)buffer.buf,
             (int)buffer.shape[0],
             (int)buffer.shape[1],
-            (int)((int)buffer.strides[0] - (buffer.shape[1] * buffer.itemsize)) // pitch = stride - (width * itemsize)
+            GetPitch2D<T>()
         );
     }
 
@@ -286,10 +341,51 @@ internal sealed class PyBuffer : IPyBuffer
             (void*)buffer.buf,
             (int)buffer.shape[0],
             (int)buffer.shape[1],
-            (int)((int)buffer.strides[0] - (buffer.shape[1] * buffer.itemsize)) // pitch = stride - (width * itemsize)
+            GetPitch2D<T>()
         );
     }
 
+    private unsafe void CopyToInternal<T>(Span<T> destination) where T : unmanaged
+    {
+        ValidateBufferCommon<T>();
+        var buffer = Buffer;
+        var count = (int)(buffer.len / sizeof(T));
+        if (destination.Length < count)
+        {
+            throw new ArgumentException("Destination is shorter than the buffer.", nameof(destination));
+        }
+
+        if (IsContiguous)
+        {
+            new ReadOnlySpan<T>(buffer.buf, count).CopyTo(destination);
+            return;
+        }
+
+        // Visit the items in row-major order, stepping through the innermost dimension in a tight
+        // loop and carrying into the outer dimensions like an odometer.
+
+        var ndim = buffer.ndim;
+        Span<nint> index = stackalloc nint[ndim];
+        var innerLength = buffer.shape[ndim - 1];
+        var innerStride = buffer.strides[ndim - 1];
+        var row = (byte*)buffer.buf;
+        for (int i = 0; i < count;)
+        {
+            var item = row;
+            for (nint j = 0; j < innerLength; j++, item += innerStride)
+                destination[i++] = Unsafe.ReadUnaligned<T>(item);
+
+            for (int d = ndim - 2; d >= 0; d--)
+            {
+                row += buffer.strides[d];
+                if (++index[d] < buffer.shape[d])
+                    break;
+                row -= buffer.strides[d] * buffer.shape[d];
+                index[d] = 0;
+            }
+        }
+    }
+
     #region Tensors
 #if NET9_0_OR_GREATER
     private unsafe TensorSpan<T> AsTensorSpanInternal<T>() where T : unmanaged
@@ -301,14 +397,10 @@ internal sealed class PyBuffer : IPyBuffer
         ValidateBufferCommon<T>();
         EnsureShapeAndStrides();
         var buffer = Buffer;
-        nint[] strides = new nint[buffer.ndim];
-        for (int i = 0; i < buffer.ndim; i++)
-        {
-            strides[i] = buffer.strides[i] / sizeof(T);
-        }
+        var strides = GetTensorStrides<T>(out var dataLength);
         return new TensorSpan<T>(
             (T*)buffer.buf,
-            buffer.len / sizeof(T),
+            dataLength,
             Shape,
             strides
         );
@@ -319,19 +411,44 @@ internal sealed class PyBuffer : IPyBuffer
         ValidateBufferCommon<T>();
         EnsureShapeAndStrides();
         var buffer = Buffer;
-        nint[] strides = new nint[buffer.ndim];
-        for (int i = 0; i < buffer.ndim; i++)
-        {
-            strides[i] = buffer.strides[i] / sizeof(T);
-        }
+        var strides = GetTensorStrides<T>(out var dataLength);
         return new ReadOnlyTensorSpan<T>(
             (T*)buffer.buf,
-            buffer.len / sizeof(T),
+            dataLength,
             Shape,
             strides
         );
     }
 
+    /// <summary>
+    /// Gets the strides of the buffer in items rather than bytes, along with the number of items
+    /// spanned from the first to the last one, which is larger than the number of items when the
+    /// buffer is strided.
+    /// </summary>
+    private unsafe nint[] GetTensorStrides<T>(out nint dataLength) where T : unmanaged
+    {
+        var buffer = Buffer;
+        var strides = new nint[buffer.ndim];
+        var isEmpty = false;
+        dataLength = 1;
+        for (int i = 0; i < buffer.ndim; i++)
+        {
+            var stride = buffer.strides[i];
+            if (stride < 0 || stride % sizeof(T) != 0)
+            {
+                throw new InvalidOperationException("Buffer strides are negative or not a multiple of the item size, use CopyTo or ToArray to copy it into contiguous memory.");
+            }
+            strides[i] = stride / sizeof(T);
+            isEmpty |= buffer.shape[i] == 0;
+            dataLength += (buffer.shape[i] - 1) * strides[i];
+        }
+        if (isEmpty)
+        {
+            dataLength = 0;
+        }
+        return strides;
+    }
+
     public TensorSpan<T> AsTensorSpan<T>() where T : unmanaged => AsTensorSpanInternal<T>();
     public ReadOnlyTensorSpan<T> AsReadOnlyTensorSpan<T>() where T : unmanaged => AsReadOnlyTensorSpanInternal<T>();
 
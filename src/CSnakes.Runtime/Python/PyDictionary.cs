@@ -1,5 +1,6 @@
 using CSnakes.Runtime.CPython;
 using System.Collections;
+using System.Collections.Concurrent;
 using System.Diagnostics.CodeAnalysis;
 
 namespace CSnakes.Runtime.Python;
@@ -15,8 +16,11 @@ internal class PyDictionary<TKey, TValue, TKeyImporter, TValueImporter>(PyObject
     where TKeyImporter : IPyObjectImporter<TKey>
     where TValueImporter : IPyObjectImporter<TValue>
 {
-    private readonly Dictionary<TKey, TValue> _dictionary = [];
+    // Values converted so far. The cache is read without the GIL, and may be written by several
+    // threads at once on free-threaded builds.
+    private readonly ConcurrentDictionary<TKey, TValue> _dictionary = new();
     private readonly PyObject _dictionaryObject = dictionary;
+    private readonly bool _isDict = CPythonAPI.IsPyDict(dictionary);
 
     public TValue this[TKey key]
     {
@@ -110,14 +114,40 @@ internal class PyDictionary<TKey, TValue, TKeyImporter, TValueImporter>(PyObject
 
     public bool TryGetValue(TKey key, [MaybeNullWhen(false)] out TValue value)
     {
-        if (ContainsKey(key))
+        if (_dictionary.TryGetValue(key, out value))
         {
-            value = this[key];
             return true;
         }
 
-        value = default;
-        return false;
+        using (GIL.Acquire())
+        {
+            using PyObject keyPyObject = PyObject.From(key);
+            nint item;
+
+            if (_isDict)
+            {
+                // A dict can be probed and read with a single lookup.
+                if (!CPythonAPI.PyDict_TryGetItem(_dictionaryObject, keyPyObject, out item))
+                {
+                    value = default;
+                    return false;
+                }
+            }
+            else if (CPythonAPI.PyMapping_HasKey(_dictionaryObject, keyPyObject) == 1)
+            {
+                item = CPythonAPI.PyMapping_GetItem(_dictionaryObject, keyPyObject);
+            }
+            else
+            {
+                value = default;
+                return false;
+            }
+
+            using PyObject pyObjValue = PyObject.Create(item);
+            value = TValueImporter.BareImport(pyObjValue);
+            _dictionary[key] = value;
+            return true;
+        }
     }
 
     PyObject ICloneable.Clone() => _dictionaryObject.Clone();
@@ -1,5 +1,6 @@
 using CSnakes.Runtime.CPython;
 using System.Collections;
+using System.Collections.Concurrent;
 using System.Diagnostics.CodeAnalysis;
 
 namespace CSnakes.Runtime.Python;
@@ -12,8 +13,9 @@ internal class PyList<T, TImporter>(PyObject listObject) :
     IReadOnlyList<T>, IDisposable, ICloneable
     where TImporter : IPyObjectImporter<T>
 {
-    // If someone fetches the same index multiple times, we cache the result to avoid multiple round trips to Python
-    private readonly Dictionary<long, T> _convertedItems = [];
+    // If someone fetches the same index multiple times, we cache the result to avoid multiple round trips to Python.
+    // The cache is read without the GIL, and may be written by several threads at once on free-threaded builds.
+    private readonly ConcurrentDictionary<long, T> _convertedItems = new();
 
     public T this[int index]
     {
@@ -9,4 +9,10 @@ public partial class PyObject
     public static PyObject One { get; } = new PyOneObject();
     public static PyObject Zero { get; } = new PyZeroObject();
     public static PyObject NegativeOne { get; } = new PyNegativeOneObject();
+
+    /// <summary>
+    /// The table of small integers that <see cref="From(long)"/> returns without allocating, or
+    /// <see langword="null"/> when disabled.
+    /// </summary>
+    internal static SmallIntegerTable? SmallIntegers { get; set; }
 }
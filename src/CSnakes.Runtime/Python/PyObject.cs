@@ -57,6 +57,12 @@ public partial class PyObject : SafeHandle, ICloneable
         return true;
     }
 
+    /// <summary>
+    /// When set, Python exceptions are translated into CLR exceptions that only record the type
+    /// name and message, without a stack trace, frame data or cause.
+    /// </summary>
+    internal static bool LightweightExceptions { get; set; }
+
     /// <summary>
     /// Throws a Python exception as a CLR exception.
     /// </summary>
@@ -82,9 +88,20 @@ public partial class PyObject : SafeHandle, ICloneable
             PyObject? pyException = excValue == IntPtr.Zero ? null : Create(excValue);
 
             // TODO: Consider adding __qualname__ as well for module exceptions that aren't builtins
-            var pyExceptionTypeStr = pyExceptionType.GetAttr("__name__").ToString();
+            using var pyExceptionTypeName = pyExceptionType.GetAttr("__name__");
+            var pyExceptionTypeStr = pyExceptionTypeName.ToString();
             CPythonAPI.PyErr_Clear();
 
+            // StopIteration keeps the exception object since its value is the generator's result.
+            if (LightweightExceptions && pyExceptionTypeStr != "StopIteration")
+            {
+                var exceptionMessage = pyException?.ToString();
+                pyException?.Dispose();
+                pyExceptionTraceback?.Dispose();
+                return new PythonInvocationException(pyExceptionTypeStr, new PythonRuntimeException(exceptionMessage),
+                                                     string.IsNullOrEmpty(message) ? null : message);
+            }
+
             if (string.IsNullOrEmpty(message))
             {
                 return new PythonInvocationException(pyExceptionTypeStr, pyException, pyExceptionTraceback);
@@ -101,6 +118,11 @@ public partial class PyObject : SafeHandle, ICloneable
     /// <exception cref="InvalidOperationException"></exception>
     private static void RaiseOnPythonNotInitialized()
     {
+        // The GIL can only be held by a thread while Python is running so, when
+        // called within an acquired scope, skip querying the interpreter.
+        if (GIL.IsAcquired)
+            return;
+
         if (!CPythonAPI.IsInitialized)
         {
             throw new InvalidOperationException("Python is not initialized. You cannot call this method outside of a Python Environment context.");
@@ -656,6 +678,138 @@ public partial class PyObject : SafeHandle, ICloneable
         }
     }
 
+    /// <summary>
+    /// Creates a tuple of interned keyword names that can be reused across calls made with
+    /// <see cref="Call(ReadOnlySpan{PyObject}, ReadOnlySpan{PyObject}, PyObject, ReadOnlySpan{PyObject}, ReadOnlySpan{KeywordArg})"/>.
+    /// </summary>
+    /// <param name="names">The keyword names.</param>
+    /// <returns>A tuple of the keyword names.</returns>
+    public static PyObject CreateKeywordNames(params ReadOnlySpan<string> names)
+    {
+        using (GIL.Acquire())
+        {
+            return Create(CPythonAPI.PackKeywordNames(names));
+        }
+    }
+
+    /// <summary>
+    /// Calls the object with the given arguments, where the names of the keyword arguments are
+    /// supplied as a tuple, and returns the result.
+    /// </summary>
+    /// <param name="args">The positional arguments.</param>
+    /// <param name="argv">
+    /// The variadic positional arguments, otherwise known as the <c>*args</c>
+    /// argument in Python.</param>
+    /// <param name="kwnames">
+    /// A tuple of keyword names, usually created once with <see cref="CreateKeywordNames"/> and
+    /// then reused for every call.</param>
+    /// <param name="kwvalues">
+    /// The keyword argument values, in the same order as the names in <paramref name="kwnames"/>.</param>
+    /// <param name="kwargv">
+    /// The variadic keyword arguments, otherwise known as the <c>**kwargs</c>
+    /// argument.</param>
+    /// <returns>
+    /// The result of the call.
+    /// </returns>
+    /// <remarks>
+    /// On Python 3.11 and later, the names tuple is passed as-is to the vectorcall protocol so
+    /// that no tuple or dictionary needs to be created for the call.
+    /// </remarks>
+    public PyObject Call(ReadOnlySpan<PyObject> args, ReadOnlySpan<PyObject> argv,
+                         PyObject kwnames, ReadOnlySpan<PyObject> kwvalues, ReadOnlySpan<KeywordArg> kwargv)
+    {
+        ArgumentNullException.ThrowIfNull(kwnames);
+
+        if (!kwargv.IsEmpty)
+            return CallWithKeywordNamesAndKwargv(args, argv, kwnames, kwvalues, kwargv);
+
+        switch (args.Length, argv.Length)
+        {
+            case (_, 0): return CallWithKeywordNames(args, kwnames, kwvalues);
+            case (0, _): return CallWithKeywordNames(argv, kwnames, kwvalues);
+            case var (a, b) when a + b is <= 16 and var length:
+            {
+                InlineArray16<PyObject> all = default;
+                var j = 0;
+                foreach (var arg in args)
+                    all[j++] = arg;
+                foreach (var arg in argv)
+                    all[j++] = arg;
+                return CallWithKeywordNames(all[..length], kwnames, kwvalues);
+            }
+            default:
+                return CallWithKeywordNames([..args, ..argv], kwnames, kwvalues);
+        }
+    }
+
+    private PyObject CallWithKeywordNames(ReadOnlySpan<PyObject> args, PyObject kwnames, ReadOnlySpan<PyObject> kwvalues)
+    {
+        if (kwvalues.IsEmpty)
+            return Call(args);
+
+        RaiseOnPythonNotInitialized();
+
+        var length = args.Length + kwvalues.Length;
+        var argRange = ..args.Length;
+        var kwvalueRange = args.Length..;
+
+        var marshallers = CallArrayPool<SafeHandleMarshaller<PyObject>.ManagedToUnmanagedIn>.Get(length);
+        var handles = CallArrayPool<nint>.Get(length);
+
+        for (int i = 0; i < args.Length; i++)
+        {
+            ref var m = ref marshallers[i];
+            m.FromManaged(args[i]);
+            handles[i] = m.ToUnmanaged();
+        }
+        for (int i = 0; i < kwvalues.Length; i++)
+        {
+            ref var m = ref marshallers[args.Length + i];
+            m.FromManaged(kwvalues[i]);
+            handles[args.Length + i] = m.ToUnmanaged();
+        }
+
+        try
+        {
+            using (GIL.Acquire())
+            {
+                return Create(CPythonAPI.Call(this, handles[argRange], kwnames, handles[kwvalueRange]));
+            }
+        }
+        finally
+        {
+            foreach (var m in marshallers)
+            {
+                m.Free();
+            }
+        }
+    }
+
+    private PyObject CallWithKeywordNamesAndKwargv(ReadOnlySpan<PyObject> args, ReadOnlySpan<PyObject> argv,
+                                                   PyObject kwnames, ReadOnlySpan<PyObject> kwvalues,
+                                                   ReadOnlySpan<KeywordArg> kwargv)
+    {
+        // "**kwargs" cannot be expressed with a fixed names tuple so unpack the names and fall
+        // back to the general path.
+
+        var kwargs = new KeywordArg[kwvalues.Length];
+        using (GIL.Acquire())
+        {
+            for (int i = 0; i < kwargs.Length; i++)
+                kwargs[i] = new(Create(CPythonAPI.PyTuple_GetItemWithNewRef(kwnames, i)), kwvalues[i]);
+        }
+
+        try
+        {
+            return Call(args, argv, kwargs, kwargv);
+        }
+        finally
+        {
+            foreach (var kwarg in kwargs)
+                kwarg.Name.Dispose();
+        }
+    }
+
     [Obsolete($"Use {nameof(Call)} overload that takes read-only spans of arguments and keyword arguments.")]
     public PyObject CallWithKeywordArguments(PyObject[]? args = null, string[]? kwnames = null, PyObject[]? kwvalues = null, IReadOnlyDictionary<string, PyObject>? kwargs = null)
     {
@@ -701,7 +855,7 @@ public partial class PyObject : SafeHandle, ICloneable
                 var t when t == typeof(long) => CPythonAPI.PyLong_AsLongLong(this),
                 var t when t == typeof(double) => CPythonAPI.PyFloat_AsDouble(this),
                 var t when t == typeof(float) => (float)CPythonAPI.PyFloat_AsDouble(this),
-                var t when t == typeof(string) => CPythonAPI.PyUnicode_AsUTF8(this),
+                var t when t == typeof(string) => CPythonAPI.PyUnicode_AsCachedUTF8(this),
                 var t when t == typeof(BigInteger) => PyObjectTypeConverter.ConvertToBigInteger(this, t),
                 var t when t == typeof(byte[]) => CPythonAPI.PyBytes_AsByteArray(this),
                 var t when t.IsAssignableTo(typeof(ITuple)) => PyObjectTypeConverter.ConvertToTuple(this, t),
@@ -746,6 +900,8 @@ public partial class PyObject : SafeHandle, ICloneable
             case 0: return Zero;
             case 1: return One;
             case -1: return NegativeOne;
+            case var n when SmallIntegers is { } table && table.TryGet(n, out var cached):
+                return cached;
             case var n:
                 using (GIL.Acquire())
                     return Create(CPythonAPI.PyLong_FromLongLong(n));
@@ -791,7 +947,7 @@ public partial class PyObject : SafeHandle, ICloneable
             case null: return None;
             case var some:
                 using (GIL.Acquire())
-                    return Create(CPythonAPI.AsPyUnicodeObject(some));
+                    return Create(CPythonAPI.AsCachedPyUnicodeObject(some));
         }
     }
 
@@ -854,6 +1010,33 @@ public partial class PyObject : SafeHandle, ICloneable
             return Create(CPythonAPI.PyBytes_FromByteSpan(value));
     }
 
+    /// <summary>
+    /// Creates a read-only Python <c>memoryview</c> over <paramref name="value"/> without copying
+    /// it, e.g. for use with <c>numpy.frombuffer</c>.
+    /// </summary>
+    /// <remarks>
+    /// The memory stays pinned until the <c>memoryview</c> and every object using its buffer have
+    /// been destroyed by Python. Well-known element types, such as <see cref="float"/> or <see
+    /// cref="long"/>, are exposed with their <c>struct</c> module format; other types are exposed
+    /// as bytes.
+    /// </remarks>
+    public static PyObject From<T>(ReadOnlyMemory<T> value) where T : unmanaged
+    {
+        using (GIL.Acquire())
+            return Create(CPythonAPI.ExportMemory(value, writable: false));
+    }
+
+    /// <summary>
+    /// Creates a writable Python <c>memoryview</c> over <paramref name="value"/> without copying
+    /// it, so that writes made by Python are visible in .NET.
+    /// </summary>
+    /// <inheritdoc cref="From{T}(ReadOnlyMemory{T})" path="/remarks"/>
+    public static PyObject From<T>(Memory<T> value) where T : unmanaged
+    {
+        using (GIL.Acquire())
+            return Create(CPythonAPI.ExportMemory<T>(value, writable: true));
+    }
+
     public static PyObject From(IEnumerable? value)
     {
         switch (value)
@@ -93,7 +93,7 @@ public static partial class PyObjectImporters
         static string IPyObjectImporter<string>.BareImport(PyObject obj)
         {
             GIL.Require();
-            return CPythonAPI.PyUnicode_AsUTF8(obj);
+            return CPythonAPI.PyUnicode_AsCachedUTF8(obj);
         }
     }
 
@@ -163,6 +163,8 @@ public static partial class PyObjectImporters
         static IReadOnlyList<T> IPyObjectImporter<IReadOnlyList<T>>.BareImport(PyObject obj)
         {
             GIL.Require();
+            if (TryImportNumericItems<T, TImporter>(obj, out var items))
+                return items;
             return CPythonAPI.IsPySequence(obj)
                 ? new PyList<T, TImporter>(obj.Clone())
                 : throw InvalidCastException("sequence", obj);
@@ -177,15 +179,51 @@ public static partial class PyObjectImporters
         internal static IReadOnlyList<T> BareImport(PyObject obj)
         {
             GIL.Require();
-            return CPythonAPI.IsPyList(obj)
-                ? new PyList<T, TImporter>(obj.Clone())
-                : throw InvalidCastException("list", obj);
+            if (!CPythonAPI.IsPyList(obj))
+                throw InvalidCastException("list", obj);
+            return TryImportNumericItems<T, TImporter>(obj, out var items)
+                ? items
+                : new PyList<T, TImporter>(obj.Clone());
         }
 
         static IReadOnlyList<T> IPyObjectImporter<IReadOnlyList<T>>.BareImport(PyObject obj) =>
             BareImport(obj);
     }
 
+    /// <summary>
+    /// Imports a sequence of integers into an array in one pass. An exact <c>list</c> or
+    /// <c>tuple</c> is read directly; any other sequence is read item by item.
+    /// </summary>
+    public sealed class Int64Array : IPyObjectImporter<long[]>
+    {
+        private Int64Array() { }
+
+        static long[] IPyObjectImporter<long[]>.BareImport(PyObject obj)
+        {
+            GIL.Require();
+            return CPythonAPI.TryCopyInt64Items(obj, out var items)
+                ? items
+                : ImportSequenceItems<long, Int64>(obj);
+        }
+    }
+
+    /// <summary>
+    /// Imports a sequence of floats into an array in one pass. An exact <c>list</c> or
+    /// <c>tuple</c> is read directly; any other sequence is read item by item.
+    /// </summary>
+    public sealed class DoubleArray : IPyObjectImporter<double[]>
+    {
+        private DoubleArray() { }
+
+        static double[] IPyObjectImporter<double[]>.BareImport(PyObject obj)
+        {
+            GIL.Require();
+            return CPythonAPI.TryCopyDoubleItems(obj, out var items)
+                ? items
+                : ImportSequenceItems<double, Double>(obj);
+        }
+    }
+
     public sealed class Dictionary<TKey, TValue, TKeyImporter, TValueImporter> :
         IPyObjectImporter<IReadOnlyDictionary<TKey, TValue>>
         where TKey : notnull
@@ -203,6 +241,45 @@ public static partial class PyObjectImporters
         }
     }
 
+    /// <summary>
+    /// Imports a whole <c>dict</c> into a .NET dictionary in a single pass, rather than wrapping
+    /// it for lazy conversion, for dictionaries that are going to be read in full.
+    /// </summary>
+    public sealed class EagerDictionary<TKey, TValue, TKeyImporter, TValueImporter> :
+        IPyObjectImporter<IReadOnlyDictionary<TKey, TValue>>
+        where TKey : notnull
+        where TKeyImporter : IPyObjectImporter<TKey>
+        where TValueImporter : IPyObjectImporter<TValue>
+    {
+        private EagerDictionary() { }
+
+        static IReadOnlyDictionary<TKey, TValue> IPyObjectImporter<IReadOnlyDictionary<TKey, TValue>>.BareImport(PyObject obj)
+        {
+            GIL.Require();
+
+            if (!CPythonAPI.IsPyDict(obj))
+                throw InvalidCastException("dict", obj);
+
+            // Iterating isn't safe without the GIL while another thread may modify the dictionary,
+            // so iterate over a copy, which is taken atomically.
+            using var copy = CPythonAPI.IsGilDisabled ? PyObject.Create(CPythonAPI.PyDict_Copy(obj)) : null;
+            var dict = copy ?? obj;
+
+            var result = new Dictionary<TKey, TValue>((int)CPythonAPI.PyDict_Size(dict));
+            nint pos = 0;
+            while (CPythonAPI.PyDict_Next(dict, ref pos, out var key, out var value))
+            {
+                CPythonAPI.Py_IncRefRaw(key);
+                using var keyObject = PyObject.Create(key);
+                CPythonAPI.Py_IncRefRaw(value);
+                using var valueObject = PyObject.Create(value);
+                result[TKeyImporter.BareImport(keyObject)] = TValueImporter.BareImport(valueObject);
+            }
+
+            return result;
+        }
+    }
+
     public sealed class Mapping<TKey, TValue, TKeyImporter, TValueImporter> :
         IPyObjectImporter<IReadOnlyDictionary<TKey, TValue>>
         where TKey : notnull
@@ -254,6 +331,21 @@ public static partial class PyObjectImporters
         }
     }
 
+    public sealed class AsyncIterator<T, TImporter> :
+        IPyObjectImporter<IAsyncEnumerable<T>>
+        where TImporter : IPyObjectImporter<T>
+    {
+        private AsyncIterator() { }
+
+        static IAsyncEnumerable<T> IPyObjectImporter<IAsyncEnumerable<T>>.BareImport(PyObject obj)
+        {
+            GIL.Require();
+            return CPythonAPI.IsPyAsyncIterator(obj)
+                ? new Python.AsyncIterator<T, TImporter>(obj.Clone())
+                : throw InvalidCastException("async iterator", obj);
+        }
+    }
+
     public sealed class Optional<T, TImporter> : IPyObjectImporter<T?>
         where T : class
         where TImporter : IPyObjectImporter<T>
@@ -285,6 +377,45 @@ public static partial class PyObjectImporters
         throw InvalidCastException("tuple", obj);
     }
 
+    /// <summary>
+    /// Eagerly imports an exact <c>list</c> or <c>tuple</c> of numbers into an array when the items
+    /// are imported as <see cref="long"/> or <see cref="double"/> by the default importers, which
+    /// avoids the per-item round trips of the lazy <see cref="PyList{T, TImporter}"/>.
+    /// </summary>
+    private static bool TryImportNumericItems<T, TImporter>(PyObject obj, [NotNullWhen(true)] out IReadOnlyList<T>? items)
+        where TImporter : IPyObjectImporter<T>
+    {
+        if (typeof(TImporter) == typeof(Int64) && CPythonAPI.TryCopyInt64Items(obj, out var longs))
+        {
+            items = (IReadOnlyList<T>)(object)longs;
+            return true;
+        }
+
+        if (typeof(TImporter) == typeof(Double) && CPythonAPI.TryCopyDoubleItems(obj, out var doubles))
+        {
+            items = (IReadOnlyList<T>)(object)doubles;
+            return true;
+        }
+
+        items = null;
+        return false;
+    }
+
+    private static T[] ImportSequenceItems<T, TImporter>(PyObject obj)
+        where TImporter : IPyObjectImporter<T>
+    {
+        if (!CPythonAPI.IsPySequence(obj))
+            throw InvalidCastException("sequence", obj);
+
+        var items = new T[CPythonAPI.PySequence_Size(obj)];
+        for (var i = 0; i < items.Length; i++)
+        {
+            using var item = PyObject.Create(CPythonAPI.PySequence_GetItem(obj, i));
+            items[i] = TImporter.BareImport(item);
+        }
+        return items;
+    }
+
     private static InvalidCastException InvalidCastException(string expected, PyObject actual) =>
         new($"Expected a {expected}, but got {actual.GetPythonType()}");
 }
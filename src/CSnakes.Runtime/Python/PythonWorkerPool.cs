@@ -0,0 +1,130 @@
+using System.Diagnostics;
+using System.Threading.Channels;
+
+namespace CSnakes.Runtime.Python;
+
+/// <summary>
+/// A fixed set of dedicated threads onto which Python work is marshalled.
+/// </summary>
+/// <remarks>
+/// Rather than having any number of thread-pool threads compete for the GIL, callers queue work
+/// to a channel that is served by a small number of threads, each owning a single Python thread
+/// state. Contention therefore turns into queueing. A worker drains up to
+/// <see cref="MaxItemsPerAcquire"/> items per acquisition of the GIL before giving other
+/// threads a chance to run Python code.
+/// </remarks>
+internal sealed class PythonWorkerPool : IDisposable
+{
+    private const int MaxItemsPerAcquire = 32;
+
+    private readonly Channel<WorkItem> channel;
+    private readonly Thread[] threads;
+
+    public PythonWorkerPool(int threadCount)
+    {
+        ArgumentOutOfRangeException.ThrowIfNegativeOrZero(threadCount);
+
+        channel = Channel.CreateUnbounded<WorkItem>(new UnboundedChannelOptions
+        {
+            SingleReader = threadCount == 1,
+            SingleWriter = false,
+        });
+
+        threads = new Thread[threadCount];
+        for (var i = 0; i < threads.Length; i++)
+        {
+            var thread = new Thread(Run)
+            {
+                IsBackground = true,
+                Name = $"CSnakes Python Worker #{i + 1}",
+            };
+            threads[i] = thread;
+            thread.Start();
+        }
+    }
+
+    public int ThreadCount => threads.Length;
+
+    public Task<T> Enqueue<T>(Func<T> func, CancellationToken cancellationToken = default)
+    {
+        ArgumentNullException.ThrowIfNull(func);
+
+        if (cancellationToken.IsCancellationRequested)
+            return Task.FromCanceled<T>(cancellationToken);
+
+        var item = new WorkItem<T>(func, cancellationToken);
+        if (!channel.Writer.TryWrite(item))
+            throw new ObjectDisposedException(nameof(PythonWorkerPool));
+
+        RuntimeMetrics.WorkerQueueDepth.Add(1);
+        return item.Task;
+    }
+
+    private void Run()
+    {
+        var reader = channel.Reader;
+
+        while (reader.WaitToReadAsync().AsTask().GetAwaiter().GetResult())
+        {
+            using (GIL.Acquire())
+            {
+                for (var i = 0; i < MaxItemsPerAcquire && reader.TryRead(out var item); i++)
+                {
+                    RuntimeMetrics.WorkerQueueDepth.Add(-1);
+                    RuntimeMetrics.WorkerQueueWaitTime.Record(Stopwatch.GetElapsedTime(item.EnqueuedTimestamp).TotalSeconds);
+                    item.Execute();
+                }
+            }
+        }
+    }
+
+    public void Dispose()
+    {
+        if (!channel.Writer.TryComplete())
+            return;
+
+        // Workers finish what has already been queued before exiting. They may be waiting for a
+        // GIL held by this thread, such as when disposing from a work item, so they are only
+        // waited for when it isn't.
+        if (GIL.IsAcquired)
+            return;
+
+        foreach (var thread in threads)
+        {
+            if (thread != Thread.CurrentThread)
+                thread.Join();
+        }
+    }
+
+    private abstract class WorkItem
+    {
+        public long EnqueuedTimestamp { get; } = Stopwatch.GetTimestamp();
+
+        public abstract void Execute();
+    }
+
+    private sealed class WorkItem<T>(Func<T> func, CancellationToken cancellationToken) : WorkItem
+    {
+        private readonly TaskCompletionSource<T> completionSource = new(TaskCreationOptions.RunContinuationsAsynchronously);
+
+        public Task<T> Task => completionSource.Task;
+
+        public override void Execute()
+        {
+            if (cancellationToken.IsCancellationRequested)
+            {
+                completionSource.TrySetCanceled(cancellationToken);
+                return;
+            }
+
+            try
+            {
+                completionSource.TrySetResult(func());
+            }
+            catch (Exception ex)
+            {
+                completionSource.TrySetException(ex);
+            }
+        }
+    }
+}
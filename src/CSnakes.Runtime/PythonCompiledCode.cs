@@ -0,0 +1,89 @@
+using CSnakes.Runtime.CPython;
+using CSnakes.Runtime.Python;
+
+namespace CSnakes.Runtime;
+
+/// <summary>
+/// Python source code that has been compiled once and can be evaluated repeatedly without
+/// being parsed and compiled again.
+/// </summary>
+/// <remarks>
+/// Instances are obtained from <see cref="PythonRunString.CompileExpression"/> or <see
+/// cref="PythonRunString.Compile"/>, which share instances through a least-recently-used cache
+/// keyed on the source text.
+/// </remarks>
+public sealed class PythonCompiledCode
+{
+    internal PythonCompiledCode(PyObject code, string source, CPythonAPI.InputType start)
+    {
+        Code = code;
+        Source = source;
+        Start = start;
+    }
+
+    internal PyObject Code { get; }
+    internal CPythonAPI.InputType Start { get; }
+
+    /// <summary>
+    /// The Python source code that was compiled.
+    /// </summary>
+    public string Source { get; }
+
+    /// <summary>
+    /// Evaluate the code with empty globals and locals.
+    /// </summary>
+    /// <returns>The resulting Python object</returns>
+    public PyObject Evaluate()
+    {
+        using (GIL.Acquire())
+        {
+            using var globals = PyObject.Create(CPythonAPI.PyDict_New());
+            return CPythonAPI.PyEval_EvalCode(Code, globals, globals);
+        }
+    }
+
+    /// <summary>
+    /// Evaluate the code with the given local variables bound, e.g. `a + 1` with `a` bound.
+    /// </summary>
+    /// <param name="locals">
+    /// The local variables, where each <see cref="KeywordArg.Name"/> must be a Python string. The
+    /// names can be created once and reused across evaluations.
+    /// </param>
+    /// <returns>The resulting Python object</returns>
+    public PyObject Evaluate(params ReadOnlySpan<KeywordArg> locals)
+    {
+        using (GIL.Acquire())
+        {
+            using var globals = PyObject.Create(CPythonAPI.PyDict_New());
+            using var localsDict = PyObject.Create(CPythonAPI.PyDict_New());
+            foreach (var (name, value) in locals)
+            {
+                if (CPythonAPI.PyDict_SetItem(localsDict, name, value) == -1)
+                    throw PyObject.ThrowPythonExceptionAsClrException();
+            }
+            return CPythonAPI.PyEval_EvalCode(Code, globals, localsDict);
+        }
+    }
+
+    /// <summary>
+    /// Evaluate the code with a caller-owned Python mapping of local variables and, optionally,
+    /// a Python dictionary of global variables. Assignments made by the code are visible in
+    /// those objects afterwards, so they can be kept and updated across evaluations.
+    /// </summary>
+    /// <param name="locals">A Python mapping of local variables</param>
+    /// <param name="globals">A Python dictionary of global variables, or <see langword="null"/> to use an empty one</param>
+    /// <returns>The resulting Python object</returns>
+    public PyObject Evaluate(PyObject locals, PyObject? globals = null)
+    {
+        ArgumentNullException.ThrowIfNull(locals);
+
+        using (GIL.Acquire())
+        {
+            if (globals is not null)
+                return CPythonAPI.PyEval_EvalCode(Code, globals, locals);
+
+            using var emptyGlobals = PyObject.Create(CPythonAPI.PyDict_New());
+            return CPythonAPI.PyEval_EvalCode(Code, emptyGlobals, locals);
+        }
+    }
+}
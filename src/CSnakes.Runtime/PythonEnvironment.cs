@@ -9,7 +9,9 @@ using CSnakes.Runtime.CPython;
 using CSnakes.Runtime.EnvironmentManagement;
 using CSnakes.Runtime.Locators;
 using CSnakes.Runtime.PackageManagement;
+using CSnakes.Runtime.Python;
 using Microsoft.Extensions.Logging;
+using System.Diagnostics;
 
 namespace CSnakes.Runtime;
 
@@ -20,35 +22,82 @@ internal class PythonEnvironment : IPythonEnvironment
     private readonly CPythonAPI api;
     private bool disposedValue;
     private IAsyncDisposable? pythonCaptureLogger;
+    private readonly PythonWorkerPool? workerPool;
 
     private static IPythonEnvironment? pythonEnvironment;
+    private static Task<IPythonEnvironment>? pythonEnvironmentStartup;
     private readonly static Lock locker = new();
 
     public static IPythonEnvironment GetPythonEnvironment(IEnumerable<PythonLocator> locators, IEnumerable<IPythonPackageInstaller> packageInstallers, PythonEnvironmentOptions options, ILogger<IPythonEnvironment>? logger, IEnvironmentManagement? environmentManager = null)
     {
-        if (pythonEnvironment is null)
+        if (pythonEnvironment is { } environment)
+            return environment;
+
+        return GetPythonEnvironmentAsync(locators, packageInstallers, options, logger, environmentManager).GetAwaiter().GetResult();
+    }
+
+    /// <summary>
+    /// Gets the Python environment, starting it if it hasn't been started yet. Concurrent callers
+    /// share a single startup, and a startup that fails is tried again by the next caller.
+    /// </summary>
+    /// <param name="cancellationToken">
+    /// Cancels waiting for the environment. The startup itself carries on for other callers.
+    /// </param>
+    public static Task<IPythonEnvironment> GetPythonEnvironmentAsync(IEnumerable<PythonLocator> locators, IEnumerable<IPythonPackageInstaller> packageInstallers, PythonEnvironmentOptions options, ILogger<IPythonEnvironment>? logger, IEnvironmentManagement? environmentManager = null, CancellationToken cancellationToken = default)
+    {
+        Task<IPythonEnvironment> startup;
+        lock (locker)
+        {
+            if (pythonEnvironment is { } environment)
+                return Task.FromResult(environment);
+
+            // Started on the thread pool, so the lock is released before the startup ends.
+            startup = pythonEnvironmentStartup ??= Task.Run(() => StartAsync(locators, packageInstallers, options, logger, environmentManager));
+        }
+        return startup.WaitAsync(cancellationToken);
+    }
+
+    private static async Task<IPythonEnvironment> StartAsync(
+        IEnumerable<PythonLocator> locators,
+        IEnumerable<IPythonPackageInstaller> packageInstallers,
+        PythonEnvironmentOptions options,
+        ILogger<IPythonEnvironment>? logger,
+        IEnvironmentManagement? environmentManager)
+    {
+        try
         {
+            var environment = await CreateAsync(locators, packageInstallers, options, logger, environmentManager).ConfigureAwait(false);
             lock (locker)
-            {
-                pythonEnvironment ??= new PythonEnvironment(locators, packageInstallers, options, logger, environmentManager);
-            }
+                pythonEnvironment = environment;
+            return environment;
+        }
+        finally
+        {
+            lock (locker)
+                pythonEnvironmentStartup = null;
         }
-        return pythonEnvironment;
     }
 
-    private PythonEnvironment(
+    private static async Task<PythonEnvironment> CreateAsync(
         IEnumerable<PythonLocator> locators,
         IEnumerable<IPythonPackageInstaller> packageInstallers,
         PythonEnvironmentOptions options,
         ILogger<IPythonEnvironment>? logger,
-        IEnvironmentManagement? environmentManager = null)
+        IEnvironmentManagement? environmentManager)
     {
-        Logger = logger;
+        var startTimestamp = Stopwatch.GetTimestamp();
+        var phaseTimestamp = startTimestamp;
 
-        var location = locators
-            .Where(locator => locator.IsSupported())
-            .Select(locator => locator.LocatePython())
-            .FirstOrDefault(loc => loc is not null);
+        void EndPhase(string phase)
+        {
+            var now = Stopwatch.GetTimestamp();
+            var elapsed = Stopwatch.GetElapsedTime(phaseTimestamp, now);
+            phaseTimestamp = now;
+            RuntimeMetrics.EnvironmentStartupPhaseTime.Record(elapsed.TotalSeconds, new KeyValuePair<string, object?>("csnakes.startup.phase", phase));
+            logger?.LogDebug("Python environment startup phase {StartupPhase} took {Elapsed}", phase, elapsed);
+        }
+
+        var location = await LocatePythonAsync(locators).ConfigureAwait(false);
 
         if (location is null)
         {
@@ -56,6 +105,8 @@ internal class PythonEnvironment : IPythonEnvironment
             throw new InvalidOperationException("Python installation not found.");
         }
 
+        EndPhase("locate");
+
         string home = options.Home;
         string[] extraPaths = options.ExtraPaths;
 
@@ -66,21 +117,112 @@ internal class PythonEnvironment : IPythonEnvironment
             throw new DirectoryNotFoundException("Python home directory does not exist.");
         }
 
+        string? sitePackagesPath = null;
+
         if (environmentManager is not null)
         {
+            sitePackagesPath = environmentManager.GetExtraPackagePath(location!);
+            extraPaths = [.. options.ExtraPaths, sitePackagesPath];
 
-            extraPaths = [.. options.ExtraPaths, environmentManager.GetExtraPackagePath(location!)];
-
-            environmentManager.EnsureEnvironment(location);
+            await environmentManager.EnsureEnvironmentAsync(location).ConfigureAwait(false);
+            EndPhase("environment");
         }
 
         logger?.LogDebug("Setting up Python environment from {PythonLocation} using home of {Home}", location.Folder, home);
 
+        List<(IPythonPackageInstaller, RequirementsMarker)> unverifiedRequirements = [];
+
         foreach (var installer in packageInstallers)
         {
-            installer.InstallPackagesFromRequirements(home);
+            // Installation can only be skipped for requirements files installed into an environment.
+            if (options.RequirementsCheck is RequirementsCheck.None
+                || environmentManager is null
+                || installer is not IRequirementsFileInstaller fileInstaller
+                || !File.Exists(Path.Combine(home, fileInstaller.RequirementsFileName)))
+            {
+                await installer.InstallPackagesFromRequirements(home).ConfigureAwait(false);
+                continue;
+            }
+
+            var marker = new RequirementsMarker(Path.GetFullPath(environmentManager.GetPath()), sitePackagesPath!, location,
+                                                Path.Combine(home, fileInstaller.RequirementsFileName));
+            if (marker.IsCurrent())
+            {
+                logger?.LogDebug("Requirements in {Requirements} are unchanged since they were installed, skipping installation.", marker.RequirementsPath);
+                if (options.RequirementsCheck is RequirementsCheck.Verify)
+                    unverifiedRequirements.Add((installer, marker));
+                continue;
+            }
+
+            await installer.InstallPackagesFromRequirements(home).ConfigureAwait(false);
+            marker.Write();
+        }
+
+        EndPhase("install");
+
+        var environment = new PythonEnvironment(location, home, extraPaths, options, logger);
+
+        EndPhase("initialize");
+
+        try
+        {
+            foreach (var (installer, marker) in unverifiedRequirements)
+            {
+                var missing = environment.CsnakesRequirements().MissingRequirements(marker.RequirementsPath);
+                if (missing.Count == 0)
+                    continue;
+
+                logger?.LogWarning("Requirements {MissingRequirements} in {Requirements} are not installed, installing them.", missing, marker.RequirementsPath);
+                await installer.InstallPackagesFromRequirements(home).ConfigureAwait(false);
+                marker.Write();
+            }
+        }
+        catch
+        {
+            environment.Dispose();
+            throw;
         }
 
+        if (unverifiedRequirements.Count > 0)
+            EndPhase("verify");
+
+        var startupTime = Stopwatch.GetElapsedTime(startTimestamp);
+        RuntimeMetrics.EnvironmentStartupTime.Record(startupTime.TotalSeconds);
+        logger?.LogInformation("Started Python {PythonVersion} environment in {Elapsed}", location.Version, startupTime);
+
+        return environment;
+    }
+
+    /// <summary>
+    /// Locates Python with the first supported locator, in registration order, that finds it.
+    /// Locators that only probe for an existing installation all run at the same time, while the
+    /// others only run once every locator before them has found nothing.
+    /// </summary>
+    internal static async Task<PythonLocationMetadata?> LocatePythonAsync(IEnumerable<PythonLocator> locators)
+    {
+        var supported = locators.Where(locator => locator.IsSupported()).ToList();
+        var probes = supported.Select(locator => locator.CanLocateConcurrently ? Task.Run(() => locator.LocatePython()) : null).ToList();
+
+        for (var i = 0; i < supported.Count; i++)
+        {
+            var locator = supported[i];
+            var location = await (probes[i] ?? Task.Run(() => locator.LocatePython())).ConfigureAwait(false);
+            if (location is not null)
+                return location;
+        }
+
+        return null;
+    }
+
+    private PythonEnvironment(
+        PythonLocationMetadata location,
+        string home,
+        string[] extraPaths,
+        PythonEnvironmentOptions options,
+        ILogger<IPythonEnvironment>? logger)
+    {
+        Logger = logger;
+
         char sep = Path.PathSeparator;
 
         api = SetupCPythonAPI(location, options);
@@ -97,11 +239,17 @@ internal class PythonEnvironment : IPythonEnvironment
         }
         api.Initialize();
 
+        if (options.DedicatedPythonThreads > 0)
+        {
+            logger?.LogDebug("Starting {ThreadCount} dedicated Python threads", options.DedicatedPythonThreads);
+            workerPool = new PythonWorkerPool(options.DedicatedPythonThreads);
+        }
+
         if (options.CaptureLogs)
         {
             if (logger is null)
                 throw new ArgumentNullException(nameof(logger), "Argument cannot be null when capturing Python logs.");
-            pythonCaptureLogger = PythonLogger.EnableGlobalLogging(this, logger);
+            pythonCaptureLogger = PythonLogger.EnableGlobalLogging(this, logger, options.LoggingOptions ?? new());
         }
     }
 
@@ -113,7 +261,7 @@ internal class PythonEnvironment : IPythonEnvironment
         Logger?.LogDebug("Python DLL: {PythonDLL}", pythonDll);
         Logger?.LogDebug("Python path: {PythonPath}", pythonPath);
 
-        var api = new CPythonAPI(pythonDll, pythonLocationMetadata.Version, pythonLocationMetadata.PythonBinaryPath, options.InstallSignalHandlers)
+        var api = new CPythonAPI(pythonDll, pythonLocationMetadata.Version, pythonLocationMetadata.PythonBinaryPath, options.InstallSignalHandlers, options.EventLoopCount, options.StringCacheSize, options.SmallIntegerCache, options.LightweightExceptions)
         {
             PythonPath = pythonPath
         };
@@ -128,6 +276,7 @@ internal class PythonEnvironment : IPythonEnvironment
             {
                 pythonCaptureLogger?.DisposeAsync().GetAwaiter().GetResult();
                 this.Disposing?.Invoke(this, EventArgs.Empty);
+                workerPool?.Dispose();
                 api.Dispose();
                 if (pythonEnvironment is not null)
                 {
@@ -156,5 +305,19 @@ internal class PythonEnvironment : IPythonEnvironment
         return disposedValue;
     }
 
+    public Task RunAsync(Action action, CancellationToken cancellationToken = default)
+    {
+        ArgumentNullException.ThrowIfNull(action);
+        return RunAsync<object?>(() => { action(); return null; }, cancellationToken);
+    }
+
+    public Task<T> RunAsync<T>(Func<T> func, CancellationToken cancellationToken = default)
+    {
+        ArgumentNullException.ThrowIfNull(func);
+        return workerPool is { } pool
+             ? pool.Enqueue(func, cancellationToken)
+             : Task.Run(() => ((IPythonEnvironment)this).RunBatch(func), cancellationToken);
+    }
+
     public event EventHandler? Disposing;
 }
@@ -1,5 +1,7 @@
 using CSnakes.Runtime.EnvironmentManagement;
 using CSnakes.Runtime.Locators;
+using CSnakes.Runtime.PackageManagement;
+using CSnakes.Runtime.Python.Interns;
 using Microsoft.Extensions.DependencyInjection;
 using Microsoft.Extensions.Logging;
 
@@ -11,6 +13,13 @@ internal partial class PythonEnvironmentBuilder(IServiceCollection services) : I
     private string home = Environment.CurrentDirectory;
     private bool installSignalHandlers = true;
     private bool capturePythonLogs = false;
+    private PythonLoggingOptions? loggingOptions;
+    private int dedicatedPythonThreads = 0;
+    private int eventLoopCount = 1;
+    private int stringCacheSize = 0;
+    private (int Min, int Max)? smallIntegerCache = (-5, 1024);
+    private bool lightweightExceptions = false;
+    private RequirementsCheck requirementsCheck = RequirementsCheck.Hash;
 
     public IServiceCollection Services { get; } = services;
 
@@ -52,7 +61,16 @@ internal partial class PythonEnvironmentBuilder(IServiceCollection services) : I
     }
 
     public PythonEnvironmentOptions GetOptions() =>
-        new(home, extraPaths, installSignalHandlers, capturePythonLogs);
+        new(home, extraPaths, installSignalHandlers, capturePythonLogs)
+        {
+            DedicatedPythonThreads = dedicatedPythonThreads,
+            EventLoopCount = eventLoopCount,
+            StringCacheSize = stringCacheSize,
+            SmallIntegerCache = smallIntegerCache,
+            LightweightExceptions = lightweightExceptions,
+            RequirementsCheck = requirementsCheck,
+            LoggingOptions = loggingOptions,
+        };
 
     public IPythonEnvironmentBuilder DisableSignalHandlers()
     {
@@ -65,4 +83,61 @@ internal partial class PythonEnvironmentBuilder(IServiceCollection services) : I
         capturePythonLogs = true;
         return this;
     }
+
+    public IPythonEnvironmentBuilder CapturePythonLogs(PythonLoggingOptions options)
+    {
+        ArgumentNullException.ThrowIfNull(options);
+        capturePythonLogs = true;
+        loggingOptions = options;
+        return this;
+    }
+
+    public IPythonEnvironmentBuilder WithDedicatedPythonThreads(int threadCount = 1)
+    {
+        ArgumentOutOfRangeException.ThrowIfNegativeOrZero(threadCount);
+        dedicatedPythonThreads = threadCount;
+        return this;
+    }
+
+    public IPythonEnvironmentBuilder WithEventLoops(int count)
+    {
+        ArgumentOutOfRangeException.ThrowIfNegativeOrZero(count);
+        eventLoopCount = count;
+        return this;
+    }
+
+    public IPythonEnvironmentBuilder WithStringCache(int capacity = 4096)
+    {
+        ArgumentOutOfRangeException.ThrowIfNegativeOrZero(capacity);
+        stringCacheSize = capacity;
+        return this;
+    }
+
+    public IPythonEnvironmentBuilder WithSmallIntegerCache(int min = -5, int max = 1024)
+    {
+        ArgumentOutOfRangeException.ThrowIfGreaterThan(min, max);
+        ArgumentOutOfRangeException.ThrowIfGreaterThan((long)max - min, SmallIntegerTable.MaxRange);
+        smallIntegerCache = (min, max);
+        return this;
+    }
+
+    public IPythonEnvironmentBuilder DisableSmallIntegerCache()
+    {
+        smallIntegerCache = null;
+        return this;
+    }
+
+    public IPythonEnvironmentBuilder WithLightweightExceptions()
+    {
+        lightweightExceptions = true;
+        return this;
+    }
+
+    public IPythonEnvironmentBuilder WithRequirementsCheck(RequirementsCheck check)
+    {
+        if (!Enum.IsDefined(check))
+            throw new ArgumentOutOfRangeException(nameof(check), check, null);
+        requirementsCheck = check;
+        return this;
+    }
 }
@@ -1,2 +1,51 @@
+using CSnakes.Runtime.PackageManagement;
+
 namespace CSnakes.Runtime;
-public record PythonEnvironmentOptions(string Home, string[] ExtraPaths, bool InstallSignalHandlers = true, bool CaptureLogs = false);
+public record PythonEnvironmentOptions(string Home, string[] ExtraPaths, bool InstallSignalHandlers = true, bool CaptureLogs = false)
+{
+    /// <summary>
+    /// The number of dedicated threads that Python work submitted through
+    /// <see cref="IPythonEnvironment.RunAsync{T}(Func{T}, CancellationToken)"/> is marshalled onto.
+    /// When zero (the default), work runs on the .NET thread pool.
+    /// </summary>
+    public int DedicatedPythonThreads { get; init; }
+
+    /// <summary>
+    /// The number of asyncio event loops, each serviced by its own thread, that coroutines and
+    /// other awaitables are distributed across. Defaults to one.
+    /// </summary>
+    public int EventLoopCount { get; init; } = 1;
+
+    /// <summary>
+    /// The maximum number of short strings kept in a cache shared by conversions in both
+    /// directions between .NET strings and Python <c>str</c> objects. When zero (the default),
+    /// strings are not cached.
+    /// </summary>
+    public int StringCacheSize { get; init; }
+
+    /// <summary>
+    /// The inclusive range of integers for which Python <c>int</c> objects are created once and
+    /// reused by every conversion from .NET. Defaults to -5 through 1024. When <see
+    /// langword="null"/>, integers other than -1, 0 and 1 are always converted anew.
+    /// </summary>
+    public (int Min, int Max)? SmallIntegerCache { get; init; } = (-5, 1024);
+
+    /// <summary>
+    /// When <see langword="true"/>, a Python exception raised to .NET only records its type name
+    /// and message, and not its stack trace, frame locals and globals or cause. This makes raising
+    /// cheaper where exceptions are frequent and expected. Defaults to <see langword="false"/>.
+    /// </summary>
+    public bool LightweightExceptions { get; init; }
+
+    /// <summary>
+    /// How the pip and uv installers decide whether a requirements file needs to be installed
+    /// when the environment starts. Defaults to <see cref="RequirementsCheck.Hash"/>.
+    /// </summary>
+    public RequirementsCheck RequirementsCheck { get; init; } = RequirementsCheck.Hash;
+
+    /// <summary>
+    /// How Python log records are buffered when <see cref="CaptureLogs"/> is enabled. When
+    /// <see langword="null"/> (the default), the defaults of <see cref="PythonLoggingOptions"/> apply.
+    /// </summary>
+    public PythonLoggingOptions? LoggingOptions { get; init; }
+}
@@ -0,0 +1,69 @@
+using Microsoft.Extensions.DependencyInjection;
+using Microsoft.Extensions.Hosting;
+using Microsoft.Extensions.Logging;
+
+namespace CSnakes.Runtime;
+
+/// <summary>
+/// A hosted service that starts the Python environment in the background when the host starts,
+/// so that locating Python, creating the virtual environment and installing requirements don't
+/// hold up the rest of the host. Added with <see cref="ServiceCollectionExtensions.WithHostedStartup(IPythonEnvironmentBuilder)"/>.
+/// </summary>
+/// <remarks>
+/// Resolving <see cref="IPythonEnvironment"/> before the startup has completed waits for it.
+/// Use <see cref="WhenReady"/> to wait without blocking a thread, or <see cref="IsReady"/> for
+/// a readiness check.
+/// </remarks>
+public sealed class PythonEnvironmentStartup : IHostedService
+{
+    private readonly IServiceProvider services;
+    private readonly ILogger<PythonEnvironmentStartup>? logger;
+    private readonly TaskCompletionSource<IPythonEnvironment> ready = new(TaskCreationOptions.RunContinuationsAsynchronously);
+
+    internal PythonEnvironmentStartup(IServiceProvider services, ILogger<PythonEnvironmentStartup>? logger)
+    {
+        this.services = services;
+        this.logger = logger;
+    }
+
+    /// <summary>
+    /// Gets a task that completes with the Python environment once it has started, or faults if
+    /// it failed to start.
+    /// </summary>
+    public Task<IPythonEnvironment> WhenReady => ready.Task;
+
+    /// <summary>
+    /// Gets whether the Python environment has started.
+    /// </summary>
+    public bool IsReady => ready.Task.IsCompletedSuccessfully;
+
+    /// <summary>
+    /// Starts the Python environment in the background and returns without waiting for it.
+    /// </summary>
+    public Task StartAsync(CancellationToken cancellationToken)
+    {
+        _ = StartEnvironmentAsync();
+        return Task.CompletedTask;
+    }
+
+    /// <summary>
+    /// Does nothing. The environment is disposed with the service provider.
+    /// </summary>
+    public Task StopAsync(CancellationToken cancellationToken) => Task.CompletedTask;
+
+    private async Task StartEnvironmentAsync()
+    {
+        try
+        {
+            await ServiceCollectionExtensions.GetPythonEnvironmentAsync(services).ConfigureAwait(false);
+
+            // Resolved through the container as well, so it disposes the environment with the host.
+            ready.TrySetResult(services.GetRequiredService<IPythonEnvironment>());
+        }
+        catch (Exception ex)
+        {
+            logger?.LogError(ex, "Failed to start the Python environment.");
+            ready.TrySetException(ex);
+        }
+    }
+}
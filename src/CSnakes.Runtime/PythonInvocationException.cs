@@ -4,17 +4,27 @@ using System.Diagnostics;
 namespace CSnakes.Runtime;
 
 [DebuggerDisplay("Exception Type={PythonExceptionType,nq}, Message={Message,nq}")]
-public class PythonInvocationException(string exceptionType,
-                                       PyObject? exception,
-                                       PyObject? pythonStackTrace,
-                                       string customMessage) :
-    Exception(customMessage, exceptionType == "StopIteration"
-                ? new PythonStopIterationException(exception, pythonStackTrace)
-                : new PythonRuntimeException(exception, pythonStackTrace))
+public class PythonInvocationException : Exception
 {
+    public PythonInvocationException(string exceptionType, PyObject? exception, PyObject? pythonStackTrace, string customMessage) :
+        this(exceptionType, exceptionType == "StopIteration"
+                              ? new PythonStopIterationException(exception, pythonStackTrace)
+                              : new PythonRuntimeException(exception, pythonStackTrace),
+             customMessage)
+    { }
+
     public PythonInvocationException(string exceptionType, PyObject? exception, PyObject? pythonStackTrace) :
-        this(exceptionType, exception, pythonStackTrace, $"The Python runtime raised a {exceptionType} exception, see InnerException for details.")
+        this(exceptionType, exception, pythonStackTrace, DefaultMessage(exceptionType))
     { }
 
-    public string PythonExceptionType { get; } = exceptionType;
+    internal PythonInvocationException(string exceptionType, PythonRuntimeException innerException, string? customMessage = null) :
+        base(customMessage ?? DefaultMessage(exceptionType), innerException)
+    {
+        PythonExceptionType = exceptionType;
+    }
+
+    private static string DefaultMessage(string exceptionType) =>
+        $"The Python runtime raised a {exceptionType} exception, see InnerException for details.";
+
+    public string PythonExceptionType { get; }
 }
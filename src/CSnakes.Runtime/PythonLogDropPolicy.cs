@@ -0,0 +1,18 @@
+namespace CSnakes.Runtime;
+
+/// <summary>
+/// Determines which log record is discarded when the buffer of Python log records waiting to be
+/// forwarded to .NET is full.
+/// </summary>
+public enum PythonLogDropPolicy
+{
+    /// <summary>
+    /// Discard the oldest buffered record to make room for the new one.
+    /// </summary>
+    DropOldest,
+
+    /// <summary>
+    /// Discard the new record and keep the buffered ones.
+    /// </summary>
+    DropNewest,
+}
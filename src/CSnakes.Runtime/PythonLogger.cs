@@ -15,10 +15,16 @@ public static class PythonLogger
     static ICsnakesLogging? module;
 
     public static IAsyncDisposable WithPythonLogging(this IPythonEnvironment env, ILogger logger, string? loggerName = null) =>
-        Bridge.Create(GetModule(env), logger, loggerName);
+        Bridge.Create(GetModule(env), logger, new PythonLoggingOptions(), loggerName);
 
-    internal static IAsyncDisposable EnableGlobalLogging(IPythonEnvironment env, ILogger logger) =>
-        Bridge.Create(GetModule(env), logger);
+    public static IAsyncDisposable WithPythonLogging(this IPythonEnvironment env, ILogger logger, PythonLoggingOptions options, string? loggerName = null)
+    {
+        ArgumentNullException.ThrowIfNull(options);
+        return Bridge.Create(GetModule(env), logger, options, loggerName);
+    }
+
+    internal static IAsyncDisposable EnableGlobalLogging(IPythonEnvironment env, ILogger logger, PythonLoggingOptions options) =>
+        Bridge.Create(GetModule(env), logger, options);
 
     private static ICsnakesLogging GetModule(IPythonEnvironment env) =>
         GetModule((PythonEnvironment)env);
@@ -62,7 +68,7 @@ file sealed class Bridge(PyObject closeCallable, Task listenerTask) : IAsyncDisp
 {
     private bool disposed;
 
-    internal static Bridge Create(ICsnakesLogging module, ILogger logger, string? loggerName = null)
+    internal static Bridge Create(ICsnakesLogging module, ILogger logger, PythonLoggingOptions options, string? loggerName = null)
     {
         PyObject? closeCallable = null;
         Task listenerTask;
@@ -71,24 +77,22 @@ file sealed class Bridge(PyObject closeCallable, Task listenerTask) : IAsyncDisp
         {
             using (GIL.Acquire())
             {
-                var result = module.Monitor(loggerName);
+                var result = module.Monitor(loggerName,
+                                            level: GetMinimumPythonLevel(logger),
+                                            capacity: options.QueueCapacity,
+                                            dropOldest: options.DropPolicy == PythonLogDropPolicy.DropOldest,
+                                            maxBatchSize: options.MaxBatchSize);
                 closeCallable = result.Close;
                 listenerTask = StartRecordListener(result.Generator,
                                                    static r =>
-                                                       (checked((int)r.DropCount),
-                                                        // https://docs.python.org/3/library/logging.html#levels
-                                                        (r.Level / 10) switch
-                                                        {
-                                                            1 => LogLevel.Debug,
-                                                            2 => LogLevel.Information,
-                                                            3 => LogLevel.Warning,
-                                                            4 => LogLevel.Error,
-                                                            >= 5 => LogLevel.Critical,
-                                                            _ => LogLevel.None,
-                                                        },
-                                                        r.Message,
-                                                        r.ExceptionInfo),
-                                                   logger);
+                                                   {
+                                                       using var records = r.Records as IDisposable;
+                                                       return (checked((int)r.DropCount),
+                                                               [.. from record in r.Records
+                                                                   select (ToLogLevel(record.Level), record.Message, record.ExceptionInfo)]);
+                                                   },
+                                                   logger,
+                                                   new("csnakes.logger.name", loggerName ?? "root"));
             }
         }
         catch
@@ -104,38 +108,68 @@ file sealed class Bridge(PyObject closeCallable, Task listenerTask) : IAsyncDisp
         return new(closeCallable, listenerTask);
     }
 
+    /// <summary>
+    /// Gets the lowest Python logging level that maps to a <see cref="LogLevel"/> enabled on
+    /// <paramref name="logger"/>, so that the Python handler can discard everything below it
+    /// before records are formatted or queued.
+    /// </summary>
+    private static int GetMinimumPythonLevel(ILogger logger) =>
+        // https://docs.python.org/3/library/logging.html#levels
+        logger.IsEnabled(LogLevel.Debug) ? 10
+        : logger.IsEnabled(LogLevel.Information) ? 20
+        : logger.IsEnabled(LogLevel.Warning) ? 30
+        : logger.IsEnabled(LogLevel.Error) ? 40
+        : logger.IsEnabled(LogLevel.Critical) ? 50
+        : 51; // above CRITICAL, so nothing gets through
+
+    private static LogLevel ToLogLevel(long level) =>
+        // https://docs.python.org/3/library/logging.html#levels
+        (level / 10) switch
+        {
+            1 => LogLevel.Debug,
+            2 => LogLevel.Information,
+            3 => LogLevel.Warning,
+            4 => LogLevel.Error,
+            >= 5 => LogLevel.Critical,
+            _ => LogLevel.None,
+        };
+
     private static Task
         StartRecordListener<T>(
             IEnumerator<T> enumerator,
-            Func<T, (int DropCount, LogLevel Level, string Message, ExceptionInfo? ExceptionInfo)> selector,
-            ILogger logger)
+            Func<T, (int DropCount, (LogLevel Level, string Message, ExceptionInfo? ExceptionInfo)[] Records)> selector,
+            ILogger logger,
+            KeyValuePair<string, object?> metricTag)
     {
         return Task.Run(() =>
         {
             while (enumerator.MoveNext()) // TODO Restart log records reading loop on failure
             {
-                var record = selector(enumerator.Current);
+                // Convert the whole batch while holding the GIL once rather than once per record.
 
-                if (record is { DropCount: > 0 and var dropCount })
-                {
-                    // One could log a warning here:
-                    //
-                    //   logger.LogWarning("Dropped {DropCount} log messages due to buffer overflow.", dropCount);
-                    //
-                    // but the reason the messages are getting dropped in the first place is because
-                    // this loop isn't keeping up due to the logger being slow or blocking. Adding
-                    // to the misery wouldn't be helpful so issue a debug message instead.
-
-                    Debug.WriteLine($"Dropped {dropCount} log messages due to log buffer overflow.");
-                }
+                (int DropCount, (LogLevel Level, string Message, ExceptionInfo? ExceptionInfo)[] Records) batch;
+                using (GIL.Acquire())
+                    batch = selector(enumerator.Current);
 
-                try
+                if (batch is { DropCount: > 0 and var dropCount })
                 {
-                    LogRecord(logger, record.Level, record.Message, record.ExceptionInfo);
+                    // Logging a warning here would only add to the misery since records get
+                    // dropped because this loop isn't keeping up due to the logger being slow or
+                    // blocking, so count the drops in a metric instead.
+
+                    RuntimeMetrics.LogRecordsDropped.Add(dropCount, metricTag);
                 }
-                catch (Exception ex)
+
+                foreach (var record in batch.Records)
                 {
-                    Debug.WriteLine($"Error logging Python log record: {ex}");
+                    try
+                    {
+                        LogRecord(logger, record.Level, record.Message, record.ExceptionInfo);
+                    }
+                    catch (Exception ex)
+                    {
+                        Debug.WriteLine($"Error logging Python log record: {ex}");
+                    }
                 }
             }
         });
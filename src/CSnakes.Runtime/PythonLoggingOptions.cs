@@ -0,0 +1,46 @@
+namespace CSnakes.Runtime;
+
+/// <summary>
+/// Controls how Python log records are buffered before they are forwarded to an <see
+/// cref="Microsoft.Extensions.Logging.ILogger"/>.
+/// </summary>
+public sealed class PythonLoggingOptions
+{
+    private readonly int queueCapacity = 200;
+    private readonly int maxBatchSize = 64;
+
+    /// <summary>
+    /// The number of records that can wait to be forwarded before records start getting dropped.
+    /// Defaults to 200.
+    /// </summary>
+    /// <exception cref="ArgumentOutOfRangeException">The value is zero or negative.</exception>
+    public int QueueCapacity
+    {
+        get => this.queueCapacity;
+        init
+        {
+            ArgumentOutOfRangeException.ThrowIfNegativeOrZero(value);
+            this.queueCapacity = value;
+        }
+    }
+
+    /// <summary>
+    /// Which record is dropped when the queue is full. Defaults to <see
+    /// cref="PythonLogDropPolicy.DropOldest"/>.
+    /// </summary>
+    public PythonLogDropPolicy DropPolicy { get; init; } = PythonLogDropPolicy.DropOldest;
+
+    /// <summary>
+    /// The maximum number of records forwarded to .NET in one step. Defaults to 64.
+    /// </summary>
+    /// <exception cref="ArgumentOutOfRangeException">The value is zero or negative.</exception>
+    public int MaxBatchSize
+    {
+        get => this.maxBatchSize;
+        init
+        {
+            ArgumentOutOfRangeException.ThrowIfNegativeOrZero(value);
+            this.maxBatchSize = value;
+        }
+    }
+}
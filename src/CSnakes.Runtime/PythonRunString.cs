@@ -16,6 +16,32 @@ public static class PythonRunString
         }
     }
 
+    private static PyObject CompileCached(string code, CPythonAPI.InputType start) =>
+        CPythonAPI.CompiledCode.GetOrCompile(code, start).Code;
+
+    /// <summary>
+    /// Compile a single expression in Python for repeated evaluation,
+    /// e.g. `a + 1` or `len(items) > 3`
+    /// </summary>
+    /// <param name="code">The Python code</param>
+    /// <returns>The compiled code, which may be shared with other callers compiling the same code</returns>
+    public static PythonCompiledCode CompileExpression(this IPythonEnvironment env, string code)
+    {
+        using (GIL.Acquire())
+            return CPythonAPI.CompiledCode.GetOrCompile(code, CPythonAPI.InputType.Py_eval_input);
+    }
+
+    /// <summary>
+    /// Compile a Python program from a string, typically multiple lines of code, for repeated execution
+    /// </summary>
+    /// <param name="code">The Python code</param>
+    /// <returns>The compiled code, which may be shared with other callers compiling the same code</returns>
+    public static PythonCompiledCode Compile(this IPythonEnvironment env, string code)
+    {
+        using (GIL.Acquire())
+            return CPythonAPI.CompiledCode.GetOrCompile(code, CPythonAPI.InputType.Py_file_input);
+    }
+
     /// <summary>
     /// Execute a single expression in Python and return the result,
     /// e.g. `1 + 1` or `len([1, 2, 3])`
@@ -28,7 +54,7 @@ public static class PythonRunString
         {
             using var globals = PyObject.Create(CPythonAPI.PyDict_New());
             using var locals = PyObject.Create(CPythonAPI.PyDict_New());
-            return CPythonAPI.PyRun_String(code, CPythonAPI.InputType.Py_eval_input, globals, locals);
+            return CPythonAPI.PyEval_EvalCode(CompileCached(code, CPythonAPI.InputType.Py_eval_input), globals, locals);
         }
     }
 
@@ -45,7 +71,7 @@ public static class PythonRunString
         {
             using var localsPyDict = PyObject.From(locals);
             using var globalsPyDict = PyObject.Create(CPythonAPI.PyDict_New());
-            var result = CPythonAPI.PyRun_String(code, CPythonAPI.InputType.Py_eval_input, globalsPyDict, localsPyDict);
+            var result = CPythonAPI.PyEval_EvalCode(CompileCached(code, CPythonAPI.InputType.Py_eval_input), globalsPyDict, localsPyDict);
             locals.Merge(localsPyDict);
             return result;
         }
@@ -65,7 +91,7 @@ public static class PythonRunString
         {
             using var localsPyDict = PyObject.From(locals);
             using var globalsPyDict = PyObject.From(globals);
-            var result = CPythonAPI.PyRun_String(code, CPythonAPI.InputType.Py_eval_input, globalsPyDict, localsPyDict);
+            var result = CPythonAPI.PyEval_EvalCode(CompileCached(code, CPythonAPI.InputType.Py_eval_input), globalsPyDict, localsPyDict);
             locals.Merge(localsPyDict);
             globals.Merge(globalsPyDict);
             return result;
@@ -85,7 +111,7 @@ public static class PythonRunString
         {
             using var localsPyDict = PyObject.From(locals);
             using var globalsPyDict = PyObject.From(globals);
-            var result = CPythonAPI.PyRun_String(code, CPythonAPI.InputType.Py_file_input, globalsPyDict, localsPyDict);
+            var result = CPythonAPI.PyEval_EvalCode(CompileCached(code, CPythonAPI.InputType.Py_file_input), globalsPyDict, localsPyDict);
             locals.Merge(localsPyDict);
             globals.Merge(globalsPyDict);
             return result;
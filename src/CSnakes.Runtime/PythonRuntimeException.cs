@@ -1,25 +1,27 @@
 using CSnakes.Runtime.CPython;
 using CSnakes.Runtime.Python;
+using System.Collections;
 
 namespace CSnakes.Runtime;
 public class PythonRuntimeException : Exception
 {
     private readonly PyObject? pythonTracebackObject;
     private string[]? formattedStackTrace = null;
+    private volatile bool frameCaptured;
 
     public PythonRuntimeException(PyObject? exception, PyObject? traceback) : base(exception?.ToString(), GetPythonInnerException(exception))
     {
         pythonTracebackObject = traceback;
-        if (traceback is null)
-        {
-            return;
-        }
+        frameCaptured = traceback is null;
+    }
 
-        using (GIL.Acquire())
-        {
-            Data["locals"] = PyObjectImporters.Mapping<string, PyObject, PyObjectImporters.String, PyObjectImporters.Clone>.BareImport(traceback.GetAttr("tb_frame").GetAttr("f_locals"));
-            Data["globals"] = PyObjectImporters.Mapping<string, PyObject, PyObjectImporters.String, PyObjectImporters.Clone>.BareImport(traceback.GetAttr("tb_frame").GetAttr("f_globals"));
-        }
+    /// <summary>
+    /// Creates an exception that only records the message of the Python exception, without its
+    /// stack trace or frame, as raised when lightweight exceptions are enabled.
+    /// </summary>
+    internal PythonRuntimeException(string? message) : base(message)
+    {
+        frameCaptured = true;
     }
 
     private static PythonRuntimeException? GetPythonInnerException(PyObject? exception) =>
@@ -30,6 +32,48 @@ public class PythonRuntimeException : Exception
             ? new PythonRuntimeException(cause, null)
             : null;
 
+    /// <summary>
+    /// Gets the data of the exception, including the <c>locals</c> and <c>globals</c> of the frame
+    /// that raised it. These are captured from the frame on first access rather than when the
+    /// exception is raised, since few callers look at them.
+    /// </summary>
+    public override IDictionary Data
+    {
+        get
+        {
+            var data = base.Data;
+            if (!frameCaptured)
+            {
+                lock (data)
+                {
+                    if (!frameCaptured)
+                    {
+                        CaptureFrame(data, pythonTracebackObject!);
+                        frameCaptured = true;
+                    }
+                }
+            }
+            return data;
+        }
+    }
+
+    private static void CaptureFrame(IDictionary data, PyObject traceback)
+    {
+        if (!CPythonAPI.IsInitialized)
+        {
+            return;
+        }
+
+        using (GIL.Acquire())
+        {
+            using var frame = traceback.GetAttr("tb_frame");
+            using var locals = frame.GetAttr("f_locals");
+            using var globals = frame.GetAttr("f_globals");
+            data["locals"] = PyObjectImporters.Mapping<string, PyObject, PyObjectImporters.String, PyObjectImporters.Clone>.BareImport(locals);
+            data["globals"] = PyObjectImporters.Mapping<string, PyObject, PyObjectImporters.String, PyObjectImporters.Clone>.BareImport(globals);
+        }
+    }
+
     public string[] PythonStackTrace
     {
         get
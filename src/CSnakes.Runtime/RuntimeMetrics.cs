@@ -0,0 +1,65 @@
+using System.Diagnostics.Metrics;
+
+namespace CSnakes.Runtime;
+
+/// <summary>
+/// Instruments published by the runtime under the <c>CSnakes.Runtime</c> meter.
+/// </summary>
+internal static class RuntimeMetrics
+{
+    public const string MeterName = "CSnakes.Runtime";
+
+    private static readonly Meter Meter = new(MeterName);
+
+    public static readonly UpDownCounter<long> WorkerQueueDepth =
+        Meter.CreateUpDownCounter<long>("csnakes.worker.queue.depth", unit: "{item}",
+                                        description: "Number of work items waiting for a dedicated Python thread.");
+
+    public static readonly Histogram<double> WorkerQueueWaitTime =
+        Meter.CreateHistogram<double>("csnakes.worker.queue.wait_time", unit: "s",
+                                      description: "Time a work item spent queued before a dedicated Python thread started it.");
+
+    public static readonly Counter<long> LogRecordsDropped =
+        Meter.CreateCounter<long>("csnakes.logging.dropped", unit: "{record}",
+                                  description: "Number of Python log records dropped because the buffer was full.");
+
+    public static readonly Counter<long> StringCacheHits =
+        Meter.CreateCounter<long>("csnakes.string_cache.hits", unit: "{string}",
+                                  description: "Number of string conversions served from the string cache.");
+
+    public static readonly Counter<long> StringCacheMisses =
+        Meter.CreateCounter<long>("csnakes.string_cache.misses", unit: "{string}",
+                                  description: "Number of string conversions that missed the string cache.");
+
+    public static readonly UpDownCounter<long> EventLoopPendingFutures =
+        Meter.CreateUpDownCounter<long>("csnakes.event_loop.pending_futures", unit: "{future}",
+                                        description: "Number of futures scheduled on an event loop that have not concluded yet.");
+
+    public static readonly Histogram<double> EventLoopIterationTime =
+        Meter.CreateHistogram<double>("csnakes.event_loop.iteration.duration", unit: "s",
+                                      description: "Time an event loop driver spent servicing requests and completed futures after a wakeup.");
+
+    public static readonly UpDownCounter<long> DisposalQueueDepth =
+        Meter.CreateUpDownCounter<long>("csnakes.gil.disposal_queue.depth", unit: "{object}",
+                                        description: "Number of Python objects and buffers released without the GIL that are waiting to be disposed.");
+
+    public static readonly Counter<long> Disposals =
+        Meter.CreateCounter<long>("csnakes.gil.disposals", unit: "{object}",
+                                  description: "Number of queued Python objects and buffers disposed.");
+
+    public static readonly Histogram<double> DisposalDrainTime =
+        Meter.CreateHistogram<double>("csnakes.gil.disposal.duration", unit: "s",
+                                      description: "Time spent disposing a slice of queued Python objects and buffers while holding the GIL.");
+
+    public static readonly Histogram<double> RedistributableLocateTime =
+        Meter.CreateHistogram<double>("csnakes.redistributable.locate.duration", unit: "s",
+                                      description: "Time taken to locate the redistributable Python, including downloading and extracting it when it isn't cached yet.");
+
+    public static readonly Histogram<double> EnvironmentStartupTime =
+        Meter.CreateHistogram<double>("csnakes.environment.startup.duration", unit: "s",
+                                      description: "Time taken to start the Python environment.");
+
+    public static readonly Histogram<double> EnvironmentStartupPhaseTime =
+        Meter.CreateHistogram<double>("csnakes.environment.startup.phase.duration", unit: "s",
+                                      description: "Time taken by a phase of starting the Python environment, identified by the csnakes.startup.phase tag.");
+}
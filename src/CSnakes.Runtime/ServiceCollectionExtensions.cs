@@ -22,20 +22,36 @@ public static partial class ServiceCollectionExtensions
         var pythonBuilder = new PythonEnvironmentBuilder(services);
 
         services.AddSingleton<IPythonEnvironmentBuilder>(pythonBuilder);
-        services.AddSingleton<IPythonEnvironment>(sp =>
-        {
-            var envBuilder = sp.GetRequiredService<IPythonEnvironmentBuilder>();
-            var locators = sp.GetServices<PythonLocator>();
-            var installers = sp.GetServices<IPythonPackageInstaller>();
-            var logger = sp.GetService<ILogger<IPythonEnvironment>>();
-            var environmentManager = sp.GetService<IEnvironmentManagement>();
+        services.AddSingleton<IPythonEnvironment>(sp => GetPythonEnvironmentAsync(sp).GetAwaiter().GetResult());
 
-            var options = envBuilder.GetOptions();
+        return pythonBuilder;
+    }
 
-            return PythonEnvironment.GetPythonEnvironment(locators, installers, options, logger, environmentManager);
-        });
+    internal static Task<IPythonEnvironment> GetPythonEnvironmentAsync(IServiceProvider sp)
+    {
+        var envBuilder = sp.GetRequiredService<IPythonEnvironmentBuilder>();
+        var locators = sp.GetServices<PythonLocator>();
+        var installers = sp.GetServices<IPythonPackageInstaller>();
+        var logger = sp.GetService<ILogger<IPythonEnvironment>>();
+        var environmentManager = sp.GetService<IEnvironmentManagement>();
 
-        return pythonBuilder;
+        var options = envBuilder.GetOptions();
+
+        return PythonEnvironment.GetPythonEnvironmentAsync(locators, installers, options, logger, environmentManager);
+    }
+
+    /// <summary>
+    /// Starts the Python environment in the background when the host starts, instead of when
+    /// <see cref="IPythonEnvironment"/> is first resolved. Inject <see cref="PythonEnvironmentStartup"/>
+    /// to wait for the environment or check whether it is ready.
+    /// </summary>
+    /// <param name="builder">The <see cref="IPythonEnvironmentBuilder"/> to configure.</param>
+    /// <returns>The modified <see cref="IPythonEnvironmentBuilder"/>.</returns>
+    public static IPythonEnvironmentBuilder WithHostedStartup(this IPythonEnvironmentBuilder builder)
+    {
+        builder.Services.AddSingleton(sp => new PythonEnvironmentStartup(sp, sp.GetService<ILogger<PythonEnvironmentStartup>>()));
+        builder.Services.AddHostedService(sp => sp.GetRequiredService<PythonEnvironmentStartup>());
+        return builder;
     }
 
     public static Version ParsePythonVersion(string version)
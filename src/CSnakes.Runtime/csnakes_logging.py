@@ -8,9 +8,10 @@ from typing import Annotated, Any, Union
 
 
 class _Handler(logging.Handler):
-    def __init__(self) -> None:
+    def __init__(self, capacity: int = 200, drop_oldest: bool = True) -> None:
         logging.Handler.__init__(self)
-        self.queue = queue.Queue[Union[LogRecord, None]](200)
+        self.queue = queue.Queue[Union[LogRecord, None]](capacity)
+        self.drop_oldest = drop_oldest
         self.stats_lock = threading.Lock()
         self.drop_count = 0
 
@@ -23,6 +24,12 @@ class _Handler(logging.Handler):
                 self.queue.put_nowait(record)
                 return True  # successfully enqueued
             except queue.Full:
+                # The closing sentinel (None) must always get through, so only
+                # records are subject to dropping the newest.
+                if not self.drop_oldest and record is not None:
+                    with self.stats_lock:
+                        self.drop_count += 1
+                    return False
                 try:
                     _ = self.queue.get_nowait()  # drop the oldest record
                     self.queue.task_done()
@@ -32,16 +39,32 @@ class _Handler(logging.Handler):
                     pass
         return False  # all attempts to put failed
 
-    def get_records(self) -> Generator[tuple[int, int, str, Union[tuple[Any, Any, Any], None]]]:
-        while True:
+    def get_records(
+        self, max_batch_size: int
+    ) -> Generator[tuple[int, list[tuple[int, str, Union[tuple[Any, Any, Any], None]]]]]:
+        closed = False
+        while not closed:
+            # Block for the first record, then take whatever else is already
+            # queued so that records cross over to .NET in batches.
+            batch: list[tuple[int, str, Union[tuple[Any, Any, Any], None]]] = []
             record = self.queue.get()
-            self.queue.task_done()
-            if record is None:
-                break
+            while True:
+                self.queue.task_done()
+                if record is None:
+                    closed = True
+                    break
+                batch.append((record.levelno, record.getMessage(), record.exc_info))
+                if len(batch) >= max_batch_size:
+                    break
+                try:
+                    record = self.queue.get_nowait()
+                except queue.Empty:
+                    break
             with self.stats_lock:
                 drop_count = self.drop_count
                 self.drop_count = 0
-            yield (drop_count, record.levelno, record.getMessage(), record.exc_info)
+            if batch or drop_count:
+                yield (drop_count, batch)
 
     def close(self) -> None:
         _ = self._put(None)
@@ -50,23 +73,34 @@ class _Handler(logging.Handler):
 
 def monitor(
     name: Union[str, None] = None,
+    level: int = 0,
+    capacity: int = 200,
+    drop_oldest: bool = True,
+    max_batch_size: int = 64,
 ) -> tuple[
     Annotated[
         Generator[
             tuple[
                 Annotated[int, "@DropCount"],
-                Annotated[int, "@Level"],
-                Annotated[str, "@Message"],
                 Annotated[
-                    Union[
+                    list[
                         tuple[
-                            Annotated[Any, "@ExceptionType"],
-                            Annotated[Any, "@Exception"],
-                            Annotated[Any, "@Traceback"],
-                        ],
-                        None,
+                            Annotated[int, "@Level"],
+                            Annotated[str, "@Message"],
+                            Annotated[
+                                Union[
+                                    tuple[
+                                        Annotated[Any, "@ExceptionType"],
+                                        Annotated[Any, "@Exception"],
+                                        Annotated[Any, "@Traceback"],
+                                    ],
+                                    None,
+                                ],
+                                "@ExceptionInfo",
+                            ],
+                        ]
                     ],
-                    "@ExceptionInfo",
+                    "@Records",
                 ],
             ],
             None,
@@ -76,7 +110,10 @@ def monitor(
     ],
     Annotated[Callable[[], None], "@Close"],
 ]:
-    handler = _Handler()
+    handler = _Handler(capacity, drop_oldest)
+    # Records below the level are discarded by the logger before the handler
+    # formats or queues them.
+    handler.setLevel(level)
     logger = logging.getLogger(name)
     logger.addHandler(handler)
 
@@ -84,4 +121,4 @@ def monitor(
         logger.removeHandler(handler)
         handler.close()
 
-    return (handler.get_records(), close)
+    return (handler.get_records(max_batch_size), close)
@@ -0,0 +1,102 @@
+import importlib
+import importlib.metadata
+import os
+import re
+
+# A requirement's project name, optional extras, an optional exact version pin and optional
+# environment markers; anything else (URLs, other specifiers) only requires the project to be
+# installed.
+_REQUIREMENT = re.compile(
+    r"^(?P<name>[A-Za-z0-9](?:[A-Za-z0-9._-]*[A-Za-z0-9])?)\s*"
+    r"(?:\[[^\]]*\])?\s*"
+    r"(?:===?\s*(?P<version>[^\s,;]+)\s*(?=;|$))?"
+    r"[^;]*"
+    r"(?:;(?P<marker>.*))?$"
+)
+
+_INCLUDE_OPTIONS = ("-r", "--requirement")
+
+
+def _requirement_lines(path: str, seen: set[str]):
+    path = os.path.abspath(path)
+    if path in seen:
+        return
+    seen.add(path)
+
+    with open(path, encoding="utf-8") as f:
+        lines = f.read().replace("\\\n", "").splitlines()
+
+    for line in lines:
+        line = line.split(" #", 1)[0].strip()
+        if not line or line.startswith("#"):
+            continue
+        option, _, value = line.partition(" ")
+        if option.startswith("--requirement="):
+            option, value = "--requirement", option.split("=", 1)[1]
+        if option in _INCLUDE_OPTIONS:
+            yield from _requirement_lines(os.path.join(os.path.dirname(path), value.strip()), seen)
+        elif line.startswith("-"):
+            continue  # other options, including editable installs, can't be verified
+        else:
+            yield line
+
+
+def _marker_applies(marker: str) -> bool:
+    try:
+        from packaging.markers import Marker
+    except ImportError:
+        return True  # can't evaluate the marker, so assume the requirement applies
+    try:
+        return Marker(marker).evaluate()
+    except Exception:
+        return True
+
+
+def _normalize_version(version: str) -> str:
+    # Approximates PEP 440 normalization: trailing zero release parts and the separators
+    # before pre-, post- and development release segments aren't significant.
+    version = version.strip().lower()
+    match = re.match(r"^v?(\d+(?:\.\d+)*)(.*)$", version)
+    if match is None:
+        return version
+    release, rest = match.groups()
+    release = re.sub(r"(?:\.0+)+$", "", release)
+    rest = re.sub(r"[-_.]+(?=[a-z])|(?<=[a-z])[-_.]+(?=\d)", "", rest)
+    return release + rest
+
+
+def _versions_equal(installed: str, pinned: str) -> bool:
+    try:
+        from packaging.version import InvalidVersion, Version
+    except ImportError:
+        return _normalize_version(installed) == _normalize_version(pinned)
+    try:
+        return Version(installed) == Version(pinned)
+    except InvalidVersion:
+        return _normalize_version(installed) == _normalize_version(pinned)
+
+
+def missing_requirements(path: str) -> list[str]:
+    """
+    Returns the requirements of the requirements file at path, including files it
+    includes, that aren't satisfied by the distributions installed in the environment.
+    Only the presence of a project and exact version pins are checked.
+    """
+    importlib.invalidate_caches()
+    missing = []
+    for line in _requirement_lines(path, set()):
+        match = _REQUIREMENT.match(line)
+        if match is None:
+            continue
+        marker = match.group("marker")
+        if marker and not _marker_applies(marker):
+            continue
+        try:
+            version = importlib.metadata.version(match.group("name"))
+        except importlib.metadata.PackageNotFoundError:
+            missing.append(line)
+            continue
+        pinned = match.group("version")
+        if pinned and not pinned.endswith("*") and not _versions_equal(version, pinned):
+            missing.append(line)
+    return missing
@@ -0,0 +1,47 @@
+"""
+Compiles Python source files to bytecode for embedding in an assembly alongside their source,
+when the EmbedPythonBytecode property is enabled.
+
+Usage: python csnakes_compile_bytecode.py OUTPUT_DIRECTORY SOURCES_FILE
+
+SOURCES_FILE lists the paths of the source files to compile, one per line.
+
+Each file is written to OUTPUT_DIRECTORY as the magic number of the running Python followed by
+its marshalled code object, and is named after the SHA-256 of its source with line endings
+normalized to '\\n', which is how the source generator finds it.
+"""
+import hashlib
+import importlib.util
+import marshal
+import os
+import sys
+
+_EXTENSION = ".bin"
+
+
+def _source_hash(source: str) -> str:
+    normalized = source.replace("\r\n", "\n").replace("\r", "\n")
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def main(output_directory: str, sources_file: str) -> None:
+    with open(sources_file, encoding="utf-8") as f:
+        paths = [line.strip() for line in f if line.strip()]
+
+    os.makedirs(output_directory, exist_ok=True)
+    for name in os.listdir(output_directory):
+        if name.endswith(_EXTENSION):
+            os.remove(os.path.join(output_directory, name))
+
+    for path in paths:
+        with open(path, encoding="utf-8-sig", newline="") as f:
+            source = f.read()
+        # The file name of the code objects is replaced with the module's path when it is imported.
+        code = compile(source, os.path.basename(path), "exec", dont_inherit=True)
+        with open(os.path.join(output_directory, _source_hash(source) + _EXTENSION), "wb") as f:
+            f.write(importlib.util.MAGIC_NUMBER)
+            marshal.dump(code, f)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1], sys.argv[2])
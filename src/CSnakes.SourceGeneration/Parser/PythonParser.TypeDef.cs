@@ -45,6 +45,8 @@ public static partial class PythonParser
         public static readonly PythonTypeSpecParser Mapping = TypeDefinitionParser.Subscript(PythonTypeSpec (k, v) => new MappingType(k, v));
         public static readonly PythonTypeSpecParser Generator = TypeDefinitionParser.Subscript(PythonTypeSpec (y, s, r) => new GeneratorType(y, s, r));
         public static readonly PythonTypeSpecParser Coroutine = TypeDefinitionParser.Subscript(PythonTypeSpec (y, s, r) => new CoroutineType(y, s, r));
+        public static readonly PythonTypeSpecParser AsyncIterator = TypeDefinitionParser.Subscript(PythonTypeSpec (of) => new AsyncIteratorType(of));
+        public static readonly PythonTypeSpecParser AsyncGenerator = TypeDefinitionParser.Subscript(PythonTypeSpec (y, s) => new AsyncGeneratorType(y, s));
 
         public static readonly PythonTypeSpecParser Callable =
             //
@@ -126,6 +128,8 @@ public static partial class PythonParser
                 "Mapping" or "collections.abc.Mapping" or "typing.Mapping"       => TypeDefinitionSubParsers.Mapping,
                 "Generator" or "collections.abc.Generator" or "typing.Generator" => TypeDefinitionSubParsers.Generator,
                 "Coroutine" or "collections.abc.Coroutine" or "typing.Coroutine" => TypeDefinitionSubParsers.Coroutine,
+                "AsyncIterator" or "collections.abc.AsyncIterator" or "typing.AsyncIterator"    => TypeDefinitionSubParsers.AsyncIterator,
+                "AsyncGenerator" or "collections.abc.AsyncGenerator" or "typing.AsyncGenerator" => TypeDefinitionSubParsers.AsyncGenerator,
                 "Callable" or "typing.Callable" or "collections.abc.Callable"    => TypeDefinitionSubParsers.Callable,
                 "Literal" or "typing.Literal"                                    => TypeDefinitionSubParsers.Literal,
                 "Union" or "typing.Union"                                        => TypeDefinitionSubParsers.Union,
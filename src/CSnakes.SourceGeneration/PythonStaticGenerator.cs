@@ -6,6 +6,7 @@ using Microsoft.CodeAnalysis;
 using Microsoft.CodeAnalysis.CSharp;
 using Microsoft.CodeAnalysis.Text;
 using System.Collections.Immutable;
+using System.Security.Cryptography;
 using System.Text;
 using System.Text.RegularExpressions;
 
@@ -24,6 +25,10 @@ public class PythonStaticGenerator : IIncrementalGenerator
             options.GlobalOptions.TryGetValue("build_property.EmbedPythonSources", out var embedSourceSwitch)
             && embedSourceSwitch.Equals("true", StringComparison.InvariantCultureIgnoreCase));
 
+        var embedPythonBytecode = context.AnalyzerConfigOptionsProvider.Select(static (options, cancellationToken) =>
+            options.GlobalOptions.TryGetValue("build_property.EmbedPythonBytecode", out var embedBytecodeSwitch)
+            && embedBytecodeSwitch.Equals("true", StringComparison.InvariantCultureIgnoreCase));
+
         var pythonFilesPipeline =
             context.AdditionalTextsProvider
                    .Combine(context.AnalyzerConfigOptionsProvider)
@@ -45,9 +50,9 @@ public class PythonStaticGenerator : IIncrementalGenerator
             context.CompilationProvider.Select(static (compilation, _) =>
                 compilation is CSharpCompilation { LanguageVersion: var v } ? v : (LanguageVersion?)null);
 
-        context.RegisterSourceOutput(pythonFilesPipeline.Combine(embedPythonSource).Combine(rootDirectory).Combine(languageVersion), static (sourceContext, opts) =>
+        context.RegisterSourceOutput(pythonFilesPipeline.Combine(embedPythonSource).Combine(embedPythonBytecode).Combine(rootDirectory).Combine(languageVersion), static (sourceContext, opts) =>
         {
-            var ((((file, _), embedSourceSwitch), rootDir), languageVersion) = opts;
+            var (((((file, _), embedSourceSwitch), embedBytecodeSwitch), rootDir), languageVersion) = opts;
 
             if (Path.GetExtension(file.Path) == ".pyi")
             {
@@ -107,7 +112,7 @@ public class PythonStaticGenerator : IIncrementalGenerator
                 if (result)
                 {
                     var methods = ModuleReflection.MethodsFromFunctionDefinitions(functions, languageVersion?.Features ?? LanguageFeatures.None).ToImmutableArray();
-                    string source = FormatClassFromMethods(@namespace, pascalFileName, methods, moduleAbsoluteName, functions, code, embedSourceSwitch);
+                    string source = FormatClassFromMethods(@namespace, pascalFileName, methods, moduleAbsoluteName, functions, code, embedSourceSwitch, embedSourceSwitch && embedBytecodeSwitch);
                     sourceContext.AddSource(generatedFileName, source);
                     sourceContext.ReportDiagnostic(Diagnostic.Create(new DiagnosticDescriptor("PSG002", "PythonStaticGenerator", $"Generated {generatedFileName} from {file.Path}", "PythonStaticGenerator", DiagnosticSeverity.Info, true), Location.None));
                 }
@@ -193,14 +198,16 @@ public class PythonStaticGenerator : IIncrementalGenerator
         };
     }
 
-    public static string FormatClassFromMethods(string @namespace, string pascalFileName, ImmutableArray<MethodDefinition> methods, string moduleAbsoluteName, PythonFunctionDefinition[] functions, SourceText sourceText, bool embedSourceText = false)
+    public static string FormatClassFromMethods(string @namespace, string pascalFileName, ImmutableArray<MethodDefinition> methods, string moduleAbsoluteName, PythonFunctionDefinition[] functions, SourceText sourceText, bool embedSourceText = false, bool embedBytecode = false)
     {
         var functionNames = functions.Select(f => (Attr: f.Name, Field: $"__func_{f.Name}")).Distinct().ToImmutableArray();
-        var allKeywords =
+        var allKeywordNames =
             from f in functions
-            from k in f.Parameters.Keyword
-            select (Attr: k.Name, Field: $"__kwfld_{k.Name}", Property: $"__kw_{k.Name}");
-        var keywords = allKeywords.Distinct().ToImmutableArray();
+            where !f.Parameters.Keyword.IsEmpty
+            let names = f.Parameters.Keyword.Select(k => k.Name).ToImmutableArray()
+            let members = MethodReflection.KeywordNames(names)
+            select (Names: string.Join(", ", from n in names select $"\"{n}\""), members.Field, members.Property);
+        var keywordNames = allKeywordNames.Distinct().ToImmutableArray();
 
 #pragma warning disable format
 
@@ -259,10 +266,10 @@ public class PythonStaticGenerator : IIncrementalGenerator
                           Sections(
                               from f in functionNames
                               select $"private PyObject {f.Field};",
-                              from k in keywords
+                              from k in keywordNames
                               select $"private PyObject? {k.Field};",
-                              from k in keywords
-                              select $"private PyObject {k.Property} => this.{k.Field} ??= PyObject.From(\"{k.Attr}\");")) }}
+                              from k in keywordNames
+                              select $"private PyObject {k.Property} => this.{k.Field} ??= PyObject.CreateKeywordNames([{k.Names}]);")) }}
 
                     internal {{pascalFileName}}Internal(ILogger<IPythonEnvironment>? logger)
                     {
@@ -297,7 +304,7 @@ public class PythonStaticGenerator : IIncrementalGenerator
                     public void Dispose()
                     {{{
                         Lines(IndentationLevel.Three,
-                              Sections(from k in keywords
+                              Sections(from k in keywordNames
                                        select $"this.{k.Field}?.Dispose();")) }}
                         logger?.LogDebug("Disposing module {ModuleName}", "{{moduleAbsoluteName}}");
             {{          Lines(IndentationLevel.Three,
@@ -355,7 +362,29 @@ public class PythonStaticGenerator : IIncrementalGenerator
 
             """);
 
-        if (embedSourceText)
+        if (embedSourceText && embedBytecode)
+        {
+            // The bytecode is compiled at build time and embedded as a resource named after a
+            // hash of the source, so it is only found when it was compiled from the same source.
+            // The runtime falls back to compiling the source when the resource is missing or was
+            // compiled for another version of Python.
+
+            sb.AppendLine($$"""""
+                file static class ThisModule
+                {
+                    private static ReadOnlySpan<byte> source => """"
+                {{      Lines(IndentationLevel.Two, sourceText)}}
+                        """"u8;
+
+                    public static PyObject Import()
+                    {
+                        using var bytecode = typeof(ThisModule).Assembly.GetManifestResourceStream("{{GetBytecodeResourceName(sourceText)}}");
+                        return CSnakes.Runtime.Python.Import.ImportModule("{{moduleAbsoluteName}}", source, "{{moduleAbsoluteName}}.py", bytecode);
+                    }
+                }
+                """"");
+        }
+        else if (embedSourceText)
         {
             // Note the use of quintuple-quoted raw string literal here so that the generated
             // "source" field below can be quadruple-quoted, and which in turn allows safe embedding
@@ -389,6 +418,18 @@ public class PythonStaticGenerator : IIncrementalGenerator
         return sb.ToString();
     }
 
+    /// <summary>
+    /// Gets the name of the resource holding the bytecode compiled from <paramref name="sourceText"/>
+    /// by <c>csnakes_compile_bytecode.py</c>, which must hash the source in the same way: the
+    /// SHA-256 of its UTF-8 encoding with line endings normalized to <c>\n</c>.
+    /// </summary>
+    public static string GetBytecodeResourceName(SourceText sourceText)
+    {
+        var normalized = sourceText.ToString().Replace("\r\n", "\n").Replace('\r', '\n');
+        using var sha256 = SHA256.Create();
+        return $"CSnakes.Bytecode.{HexString(sha256.ComputeHash(Encoding.UTF8.GetBytes(normalized)))}";
+    }
+
     private static string HexString(ReadOnlySpan<byte> bytes)
     {
         const string hexChars = "0123456789abcdef";
@@ -26,7 +26,12 @@ public static class MethodReflection
             ? TypeReflection.AsPredefinedType(returnPythonType, TypeReflection.ConversionDirection.FromPython).First()
             : PredefinedType(Token(SyntaxKind.VoidKeyword));
 
-        if (function.IsAsync || returnPythonType is CoroutineType { Yield: NoneType, Send: NoneType })
+        // An "async def" annotated to return an AsyncIterator or AsyncGenerator is an asynchronous
+        // generator function. Calling it returns the async iterator directly rather than a
+        // coroutine, so it is not awaited.
+        var isAsyncGeneratorFunction = returnPythonType is AsyncIteratorType or AsyncGeneratorType;
+
+        if ((function.IsAsync && !isAsyncGeneratorFunction) || returnPythonType is CoroutineType { Yield: NoneType, Send: NoneType })
         {
             cancellationTokenParameterSyntax =
                 Parameter(Identifier(cancellationTokenName))
@@ -284,25 +289,52 @@ public static class MethodReflection
             return ArgumentList(SeparatedList([args, argv]));
         }
 
+        var kwargv = reflectedParameters.VariadicKeyword is { } vkp
+                   ? Argument(IdentifierName(vkp.Identifier)) // TODO: The internal name might be mutated
+                   : Argument(LiteralExpression(SyntaxKind.DefaultLiteralExpression));
+
+        if (parameters.Keyword.IsEmpty)
+        {
+            // Call(ReadOnlySpan<PyObject> args, ReadOnlySpan<PyObject> argv,
+            //      ReadOnlySpan<KeywordArg> kwargs, ReadOnlySpan<KeywordArg> kwargv)
+            return ArgumentList(SeparatedList([
+                       args,
+                       argv,
+                       Argument(CollectionExpression()),
+                       kwargv
+                   ]));
+        }
+
         // Call(ReadOnlySpan<PyObject> args, ReadOnlySpan<PyObject> argv,
-        //      ReadOnlySpan<KeywordArg> kwargs, ReadOnlySpan<KeywordArg> kwargv)
+        //      PyObject kwnames, ReadOnlySpan<PyObject> kwvalues, ReadOnlySpan<KeywordArg> kwargv)
 
-        IEnumerable<CollectionElementSyntax> kwargs =
-            from a in parameters.Keyword.Zip(reflectedParameters.Keyword, (pp, rp) => (pp.Name, rp.Identifier))
-            select ArgumentList(SeparatedList([Argument(MemberAccessExpression(SyntaxKind.SimpleMemberAccessExpression,
-                                                                               ThisExpression(),
-                                                                               IdentifierName($"__kw_{a.Name}"))),
-                                               Argument(IdentifierName($"{a.Identifier}_pyObject"))]))
-            into a
-            select ExpressionElement(ImplicitObjectCreationExpression(a, null));
+        var kwnames = MemberAccessExpression(SyntaxKind.SimpleMemberAccessExpression,
+                                             ThisExpression(),
+                                             IdentifierName(KeywordNames(from p in parameters.Keyword select p.Name).Property));
+
+        IEnumerable<CollectionElementSyntax> kwvalues =
+            from a in reflectedParameters.Keyword
+            select ExpressionElement(IdentifierName($"{a.Identifier}_pyObject"));
 
         return ArgumentList(SeparatedList([
                    args,
                    argv,
-                   Argument(CollectionExpression(SeparatedList(kwargs))),
-                   reflectedParameters.VariadicKeyword is { } vkp
-                       ? Argument(IdentifierName(vkp.Identifier)) // TODO: The internal name might be mutated
-                       : Argument(LiteralExpression(SyntaxKind.DefaultLiteralExpression))
+                   Argument(kwnames),
+                   Argument(CollectionExpression(SeparatedList(kwvalues))),
+                   kwargv
                ]));
     }
+
+    /// <summary>
+    /// Gets the names of the backing field and lazily-initialized property that hold the tuple
+    /// of keyword names passed when calling a function with the given keyword-only parameters.
+    /// </summary>
+    /// <remarks>
+    /// Each name is prefixed with its length, since names can themselves contain underscores.
+    /// </remarks>
+    internal static (string Field, string Property) KeywordNames(IEnumerable<string> names)
+    {
+        var suffix = string.Join("_", from n in names select $"{n.Length}{n}");
+        return ($"__kwnamesfld_{suffix}", $"__kwnames_{suffix}");
+    }
 }
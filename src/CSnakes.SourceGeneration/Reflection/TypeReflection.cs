@@ -38,6 +38,8 @@ public static class TypeReflection
             (GeneratorType     { Yield: var yt, Send: var st, Return: var rt }, _, _) => CreateGeneratorType(yt, st, rt, direction),
             (AwaitableType     { Of: var t }, _, _) => CreateAwaitableType(t, direction),
             (CoroutineType     { Yield: NoneType, Send: NoneType, Return: var rt }, _, _) => CreateAwaitableType(rt, direction),
+            (AsyncIteratorType { Of: var t }, _, _) => CreateAsyncEnumerableType(t, direction),
+            (AsyncGeneratorType { Yield: var yt }, _, _) => CreateAsyncEnumerableType(yt, direction),
             (UnionType         { Choices: var ts }, ConversionDirection.ToPython, _) => [.. ts.SelectMany(t => AsPredefinedType(t, direction))],
             (VariadicTupleType { Of: var t }, ConversionDirection.FromPython, _) => from listType in AsPredefinedType(t, direction)
                                                                                     select CreateGenericType("ImmutableArray", [listType]),
@@ -49,9 +51,26 @@ public static class TypeReflection
             (BytesType         , ConversionDirection.ToPython, RefSafetyContext.RefSafe) => [SyntaxFactory.ParseTypeName("ReadOnlySpan<byte>")],
             (BytesType         , _, _) => [SyntaxFactory.ParseTypeName("byte[]")],
             (BufferType        , ConversionDirection.FromPython, _) => [SyntaxFactory.ParseTypeName("IPyBuffer")],
+            (BufferType        , ConversionDirection.ToPython, _) => [SyntaxFactory.ParseTypeName("PyObject"), .. BufferElementTypes.Select(CreateReadOnlyMemoryType)],
             _ => [SyntaxFactory.ParseTypeName("PyObject")],
         };
 
+    /// <summary>
+    /// Element types of the <c>ReadOnlyMemory&lt;T&gt;</c> overloads generated for <c>Buffer</c>
+    /// parameters, whose memory is exported to Python without being copied.
+    /// </summary>
+    private static readonly SyntaxKind[] BufferElementTypes =
+    [
+        SyntaxKind.ByteKeyword,
+        SyntaxKind.IntKeyword,
+        SyntaxKind.LongKeyword,
+        SyntaxKind.FloatKeyword,
+        SyntaxKind.DoubleKeyword,
+    ];
+
+    private static TypeSyntax CreateReadOnlyMemoryType(SyntaxKind elementType) =>
+        CreateGenericType("ReadOnlyMemory", [SyntaxFactory.PredefinedType(SyntaxFactory.Token(elementType))]);
+
     private static IEnumerable<TypeSyntax> CreateDictionaryType(PythonTypeSpec keyType, PythonTypeSpec valueType, ConversionDirection direction)
     {
         return from type in AsPredefinedType(keyType, direction)
@@ -72,6 +91,12 @@ public static class TypeReflection
                select CreateGenericType("IAwaitable", [returnTypeI]);
     }
 
+    private static IEnumerable<TypeSyntax> CreateAsyncEnumerableType(PythonTypeSpec itemType, ConversionDirection direction)
+    {
+        return from itemTypeI in AsPredefinedType(itemType, direction)
+               select CreateGenericType("IAsyncEnumerable", [itemTypeI]);
+    }
+
     private static IEnumerable<TypeSyntax> CreateTupleType(ImmutableArray<PythonTypeSpec> tupleTypes, ConversionDirection direction)
     {
         if (tupleTypes.Length == 1)
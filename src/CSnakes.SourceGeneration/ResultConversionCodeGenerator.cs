@@ -83,6 +83,10 @@ internal static class ResultConversionCodeGenerator
                 return new ConversionGenerator(TypeReflection.CreateGenericType(nameof(ImmutableArray<object>), [generator.TypeSyntax]),
                                                TypeReflection.CreateGenericType("VarTuple", [generator.TypeSyntax, generator.ImporterTypeSyntax]));
             }
+            case DictType { Key: var kt, Value: var vt, Metadata: var md } when IsEager(md):
+            {
+                return DictionaryConversionGenerator(kt, vt, "EagerDictionary");
+            }
             case DictType { Key: var kt, Value: var vt }:
             {
                 return DictionaryConversionGenerator(kt, vt, "Dictionary");
@@ -119,6 +123,14 @@ internal static class ResultConversionCodeGenerator
                 return new ConversionGenerator(TypeReflection.CreateGenericType("IAwaitable", [generator.TypeSyntax]),
                                                TypeReflection.CreateGenericType("Awaitable", [generator.TypeSyntax, generator.ImporterTypeSyntax]));
             }
+            case AsyncIteratorType { Of: var t }:
+            {
+                return AsyncIteratorConversionGenerator(t);
+            }
+            case AsyncGeneratorType { Yield: var yt }:
+            {
+                return AsyncIteratorConversionGenerator(yt);
+            }
             case var other:
             {
                 var typeSyntax = TypeReflection.AsPredefinedType(other, TypeReflection.ConversionDirection.FromPython).First(); // TODO: Investigate union
@@ -127,6 +139,22 @@ internal static class ResultConversionCodeGenerator
         }
     }
 
+    /// <summary>
+    /// Determines whether a type is annotated with <c>"eager"</c>, as in <c>Annotated[dict[str,
+    /// int], "eager"]</c>, asking for the value to be converted in full up front rather than
+    /// lazily.
+    /// </summary>
+    private static bool IsEager(ValueArray<PythonConstant> metadata)
+    {
+        foreach (var md in metadata)
+        {
+            if (md is PythonConstant.String { Value: "eager" })
+                return true;
+        }
+
+        return false;
+    }
+
     private sealed class ConversionGenerator(TypeSyntax typeSyntax, TypeSyntax importerTypeSyntax) :
         IResultConversionCodeGenerator
     {
@@ -161,6 +189,13 @@ internal static class ResultConversionCodeGenerator
                                        TypeReflection.CreateGenericType(importerTypeName, [generator.TypeSyntax, generator.ImporterTypeSyntax]));
     }
 
+    public static IResultConversionCodeGenerator AsyncIteratorConversionGenerator(PythonTypeSpec itemTypeSpec)
+    {
+        var generator = Create(itemTypeSpec);
+        return new ConversionGenerator(TypeReflection.CreateGenericType("IAsyncEnumerable", [generator.TypeSyntax]),
+                                       TypeReflection.CreateGenericType("AsyncIterator", [generator.TypeSyntax, generator.ImporterTypeSyntax]));
+    }
+
     public static IResultConversionCodeGenerator DictionaryConversionGenerator(PythonTypeSpec keyTypeSpec,
                                                                                PythonTypeSpec valueTypeSpec,
                                                                                string importerTypeName)
@@ -59,6 +59,8 @@ public class GeneratedSignatureTests
     [InlineData("def hello(val: str = u'world', /) -> None:\n ...\n", "void Hello(string val = \"world\")")]
     [InlineData("def hello() -> Awaitable[int]:\n ...\n", "IAwaitable<long> Hello()")]
     [InlineData("async def hello() -> None:\n ...\n", "Task Hello(CancellationToken cancellationToken = default)")]
+    [InlineData("async def hello() -> AsyncIterator[int]:\n ...\n", "IAsyncEnumerable<long> Hello()")]
+    [InlineData("async def hello() -> AsyncGenerator[str, None]:\n ...\n", "IAsyncEnumerable<string> Hello()")]
     [InlineData("async def hello():\n ...\n", "Task<PyObject> Hello(CancellationToken cancellationToken = default)")]
     [InlineData("def hello(n: Foo = ...) -> None:\n ...\n", "void Hello(PyObject? n = null)")]
     [InlineData("def hello(a: str, b: int = 4, *, kw: str) -> None:\n ...\n", "void Hello(string a, string kw, long b = 4)")]
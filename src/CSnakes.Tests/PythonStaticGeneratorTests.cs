@@ -82,4 +82,45 @@ public class PythonStaticGeneratorTests
         names.GeneratedFileName.ShouldBe(expectedFileName);
         names.ModuleAbsoluteName.ShouldBe(expectedModuleAbsoluteName);
     }
+
+    [Fact]
+    public void BytecodeResourceNameIgnoresLineEndings()
+    {
+        // The hash must match the one computed by csnakes_compile_bytecode.py for the same source.
+        const string expected = "CSnakes.Bytecode.a59760db044bfa69a85d92d8ecfd8b7fa63530d743fd9828be52f4b24eb8da36";
+        PythonStaticGenerator.GetBytecodeResourceName(SourceText.From("x = 1\nprint(x)\n")).ShouldBe(expected);
+        PythonStaticGenerator.GetBytecodeResourceName(SourceText.From("x = 1\r\nprint(x)\r\n")).ShouldBe(expected);
+    }
+
+    [Fact]
+    public void FormatClassFromMethodsWithBytecode()
+    {
+        var sourceText = SourceText.From("def hello() -> None:\n    pass\n");
+        _ = PythonParser.TryParseFunctionDefinitions(sourceText, out var functions, out var errors);
+        Assert.Empty(errors);
+        var module = ModuleReflection.MethodsFromFunctionDefinitions(functions, LanguageVersion.CSharp12.Features).ToImmutableArray();
+
+        string compiledCode = PythonStaticGenerator.FormatClassFromMethods("Python.Generated.Tests", "TestClass", module, "test", functions, sourceText,
+                                                                           embedSourceText: true, embedBytecode: true);
+
+        compiledCode.ShouldContain($"GetManifestResourceStream(\"{PythonStaticGenerator.GetBytecodeResourceName(sourceText)}\")");
+        compiledCode.ShouldContain("Import.ImportModule(\"test\", source, \"test.py\", bytecode)");
+    }
+
+    [Fact]
+    public void FormatClassFromMethodsWithAmbiguousKeywordNames()
+    {
+        var sourceText = SourceText.From("def f(*, a__b: int) -> None:\n    pass\n\ndef g(*, a: int, b: int) -> None:\n    pass\n");
+        _ = PythonParser.TryParseFunctionDefinitions(sourceText, out var functions, out var errors);
+        Assert.Empty(errors);
+        var module = ModuleReflection.MethodsFromFunctionDefinitions(functions, LanguageVersion.CSharp12.Features).ToImmutableArray();
+
+        string compiledCode = PythonStaticGenerator.FormatClassFromMethods("Python.Generated.Tests", "TestClass", module, "test", functions, sourceText);
+
+        var fields = Regex.Matches(compiledCode, @"private PyObject\? (__kwnamesfld_\w+);").Select(m => m.Groups[1].Value).ToList();
+        fields.Count.ShouldBe(2);
+        fields.ShouldBeUnique();
+        compiledCode.ShouldContain("PyObject.CreateKeywordNames([\"a__b\"])");
+        compiledCode.ShouldContain("PyObject.CreateKeywordNames([\"a\", \"b\"])");
+    }
 }
@@ -252,6 +252,31 @@ public class PythonTypeDefinitionParserTests
         _ = Assert.IsType<BoolType>(type.Return);
     }
 
+    [Theory]
+    [InlineData("AsyncIterator[int]")]
+    [InlineData("typing.AsyncIterator[int]")]
+    [InlineData("collections.abc.AsyncIterator[int]")]
+    // Trailing comma in generic type argument list
+    [InlineData("AsyncIterator[int, ]")]
+    public void AsyncIteratorTest(string input)
+    {
+        var type = TestParse<AsyncIteratorType>(input);
+        _ = Assert.IsType<IntType>(type.Of);
+    }
+
+    [Theory]
+    [InlineData("AsyncGenerator[int, str]")]
+    [InlineData("typing.AsyncGenerator[int, str]")]
+    [InlineData("collections.abc.AsyncGenerator[int, str]")]
+    // Trailing comma in generic type argument list
+    [InlineData("AsyncGenerator[int, str, ]")]
+    public void AsyncGeneratorTest(string input)
+    {
+        var type = TestParse<AsyncGeneratorType>(input);
+        _ = Assert.IsType<IntType>(type.Yield);
+        _ = Assert.IsType<StrType>(type.Send);
+    }
+
     [Theory]
     [InlineData("Callable[[int, str], bool]")]
     [InlineData("typing.Callable[[int, str], bool]")]
@@ -45,7 +45,9 @@ public class TypeReflectionTests
         // A "Coroutine" where send or yield types are not "None" becomes "PyObject"
         ("Coroutine[bool, int, str]", "PyObject"),
         ("Coroutine[None, int, str]", "PyObject"),
-        ("Coroutine[bool, None, str]", "PyObject"));
+        ("Coroutine[bool, None, str]", "PyObject"),
+        ("AsyncIterator[int]", "IAsyncEnumerable<long>"),
+        ("AsyncGenerator[str, None]", "IAsyncEnumerable<string>"));
 
     [Theory]
     [MemberData(nameof(AsPredefinedTypeData))]
@@ -142,6 +144,18 @@ public class TypeReflectionTests
         }
     }
 
+    [Fact]
+    public void BufferToPythonTest()
+    {
+        var tokens = PythonTokenizer.Instance.Tokenize("Buffer");
+        var result = PythonParser.PythonTypeDefinitionParser.TryParse(tokens);
+        Assert.True(result.HasValue, result.ToString());
+        var reflectedTypes = TypeReflection.AsPredefinedType(result.Value, TypeReflection.ConversionDirection.ToPython);
+
+        string[] expectedTypes = ["PyObject", "ReadOnlyMemory<byte>", "ReadOnlyMemory<int>", "ReadOnlyMemory<long>", "ReadOnlyMemory<float>", "ReadOnlyMemory<double>"];
+        Assert.Equal(expectedTypes, reflectedTypes.Select(t => t.ToString()));
+    }
+
     [Theory]
     [InlineData("int")]
     [InlineData("str | None")]
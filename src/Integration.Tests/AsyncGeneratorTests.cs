@@ -0,0 +1,61 @@
+using System;
+using System.Collections.Generic;
+using System.Threading;
+using System.Threading.Tasks;
+
+namespace Integration.Tests;
+public class AsyncGeneratorTests(PythonEnvironmentFixture fixture) : IntegrationTestBase(fixture)
+{
+    [Fact]
+    public async Task AsyncIterator()
+    {
+        var mod = Env.TestAsyncGenerators();
+        var items = new List<long>();
+        await foreach (var item in mod.CountAsync(5).WithCancellation(TestContext.Current.CancellationToken))
+            items.Add(item);
+        Assert.Equal<long[]>([0, 1, 2, 3, 4], items);
+    }
+
+    [Fact]
+    public async Task AsyncGenerator()
+    {
+        var mod = Env.TestAsyncGenerators();
+        var items = new List<string>();
+        await foreach (var item in mod.WordsAsync().WithCancellation(TestContext.Current.CancellationToken))
+            items.Add(item);
+        Assert.Equal<string[]>(["foo", "bar", "baz"], items);
+    }
+
+    [Fact]
+    public async Task BreakEarly()
+    {
+        var mod = Env.TestAsyncGenerators();
+        var items = new List<long>();
+        await foreach (var item in mod.EndlessAsync(0).WithCancellation(TestContext.Current.CancellationToken))
+        {
+            items.Add(item);
+            if (items.Count == 3)
+                break;
+        }
+        Assert.Equal<long[]>([0, 1, 2], items);
+    }
+
+    [Fact]
+    public async Task Cancellation()
+    {
+        var mod = Env.TestAsyncGenerators();
+        using var cts = CancellationTokenSource.CreateLinkedTokenSource(TestContext.Current.CancellationToken);
+        var count = 0;
+
+        await Assert.ThrowsAnyAsync<OperationCanceledException>(async () =>
+        {
+            await foreach (var _ in mod.EndlessAsync(0.05).WithCancellation(cts.Token))
+            {
+                if (++count == 2)
+                    cts.CancelAfter(TimeSpan.FromMilliseconds(10));
+            }
+        });
+
+        Assert.True(count >= 2);
+    }
+}
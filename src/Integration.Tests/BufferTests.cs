@@ -479,9 +479,56 @@ public class BufferTests(PythonEnvironmentFixture fixture) : IntegrationTestBase
     [Fact]
     public void TestTransposedBuffer()
     {
-        // ndarray transposed buffer is not contiguous, this should raise a clean error
+        // ndarray transposed buffer is Fortran-ordered, so it can only be read once densified
         var testModule = Env.TestBuffer();
-        Assert.Throws<PythonInvocationException>(testModule.TestTransposedBuffer);
+        using var array = testModule.TestTransposedBuffer();
+        Assert.False(array.IsContiguous);
+        Assert.Equal(2, array.Dimensions);
+        Assert.Throws<InvalidOperationException>(() => array.AsInt32ReadOnlySpan2D());
+        Assert.Equal(new[] { 1, 4, 2, 5, 3, 6 }, array.ToArray<int>());
+    }
+
+    [Fact]
+    public void TestColumnSlicedBuffer()
+    {
+        var testModule = Env.TestBuffer();
+        using var array = testModule.TestColumnSlicedBuffer();
+        Assert.False(array.IsContiguous);
+        Assert.Equal(sizeof(int) * 6, array.Length);
+        Assert.Throws<InvalidOperationException>(() => array.AsInt32ReadOnlySpan2D());
+        Assert.Equal(new[] { 0, 2, 4, 6, 8, 10 }, array.ToArray<int>());
+
+        var destination = new int[7];
+        array.CopyTo<int>(destination);
+        Assert.Equal(new[] { 0, 2, 4, 6, 8, 10, 0 }, destination);
+        Assert.Throws<ArgumentException>(() => array.CopyTo<int>(new int[5]));
+    }
+
+    [Fact]
+    public void TestRowSlicedBufferToArray()
+    {
+        var testModule = Env.TestBuffer();
+        using var array = testModule.TestNonContiguousBuffer();
+        Assert.Equal(new[] { 1, 2, 3 }, array.ToArray<int>());
+    }
+
+    [Fact]
+    public void TestReversedBuffer()
+    {
+        var testModule = Env.TestBuffer();
+        using var array = testModule.TestReversedBuffer();
+        Assert.False(array.IsContiguous);
+        Assert.Throws<InvalidOperationException>(() => array.AsInt64ReadOnlySpan());
+        Assert.Equal(new long[] { 4, 3, 2, 1, 0 }, array.ToArray<long>());
+    }
+
+    [Fact]
+    public void TestContiguousBufferToArray()
+    {
+        var testModule = Env.TestBuffer();
+        using var array = testModule.TestInt322dBuffer();
+        Assert.True(array.IsContiguous);
+        Assert.Equal(new[] { 1, 2, 3, 4, 5, 6 }, array.ToArray<int>());
     }
 
     [Fact]
@@ -512,6 +559,32 @@ public class BufferTests(PythonEnvironmentFixture fixture) : IntegrationTestBase
         Assert.Equal(75, result);
     }
 
+    [Fact]
+    public void TestMemoryAsBufferArgument()
+    {
+        var testModule = Env.TestBuffer();
+        Assert.Equal(6, testModule.TestSumOfBuffer(new byte[] { 1, 2, 3 }.AsMemory()));
+        Assert.Equal(6, testModule.TestSumOfBuffer(new int[] { 1, 2, 3 }.AsMemory()));
+        Assert.Equal(6, testModule.TestSumOfBuffer(new long[] { 1, 2, 3 }.AsMemory()));
+        Assert.Equal(7.5, testModule.TestSumOfBuffer(new float[] { 1.5f, 2.5f, 3.5f }.AsMemory()));
+        Assert.Equal(7.5, testModule.TestSumOfBuffer(new double[] { 1.5, 2.5, 3.5 }.AsMemory()));
+        Assert.Equal(0, testModule.TestSumOfBuffer(ReadOnlyMemory<double>.Empty));
+    }
+
+    [Fact]
+    public void TestWritableMemoryAsBufferArgument()
+    {
+        var testModule = Env.TestBuffer();
+        var values = new double[] { 1, 2, 3 };
+        using var view = PyObject.From(values.AsMemory());
+        using (var setItem = view.GetAttr("__setitem__"))
+        using (var index = PyObject.From(1L))
+        using (var value = PyObject.From(20.0))
+            setItem.Call(index, value).Dispose();
+        Assert.Equal(new double[] { 1, 20, 3 }, values);
+        Assert.Equal(24, testModule.TestSumOfBuffer(view));
+    }
+
 #if NET9_0_OR_GREATER
     [Fact]
     public void TestNDim3Tensor()
@@ -525,6 +598,22 @@ public class BufferTests(PythonEnvironmentFixture fixture) : IntegrationTestBase
         Assert.Equal(3, tensor[1, 2, 3]);
     }
 
+    [Fact]
+    public void TestStridedTensor()
+    {
+        var testModule = Env.TestBuffer();
+        using var bufferObject = testModule.TestColumnSlicedBuffer();
+        var tensor = bufferObject.AsReadOnlyTensorSpan<int>();
+        Assert.Equal(2, tensor.Rank);
+        Assert.Equal(6, tensor[1, 1]);
+        Assert.Equal(10, tensor[2, 1]);
+
+        using var transposed = testModule.TestTransposedBuffer();
+        var transposedTensor = transposed.AsReadOnlyTensorSpan<int>();
+        Assert.Equal(4, transposedTensor[0, 1]);
+        Assert.Equal(3, transposedTensor[2, 0]);
+    }
+
     [Fact]
     public void TestNDim3Float32TensorProductPrimitive()
     {
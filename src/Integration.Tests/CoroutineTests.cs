@@ -29,6 +29,19 @@ public class CoroutineTests(PythonEnvironmentFixture fixture) : IntegrationTestB
         Assert.All(r, x => Assert.Equal(5, x));
     }
 
+    [Fact]
+    public async Task ManyConcurrentCoroutines()
+    {
+        var mod = Env.TestCoroutines();
+        var tasks = new List<Task<long>>();
+        for (int i = 0; i < 1_000; i++)
+        {
+            tasks.Add(mod.TestCoroutine(seconds: 0.01, cancellationToken: TestContext.Current.CancellationToken));
+        }
+        var r = await Task.WhenAll(tasks);
+        Assert.All(r, x => Assert.Equal(5, x));
+    }
+
     [Fact]
     public async Task SequentialCoroutinesWithCompletedCancellation()
     {
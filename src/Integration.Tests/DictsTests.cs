@@ -1,4 +1,5 @@
 using System.Collections.Generic;
+using System.Linq;
 
 namespace Integration.Tests;
 public class TestDicts(PythonEnvironmentFixture fixture) : IntegrationTestBase(fixture)
@@ -58,4 +59,32 @@ public class TestDicts(PythonEnvironmentFixture fixture) : IntegrationTestBase(f
         var roundTrip = testDicts.TestDictStrInt(result);
         Assert.Equal(1, roundTrip["dictkey1"]);
     }
+
+    [Fact]
+    public void TestDicts_TestDictStrIntEager()
+    {
+        var testDicts = Env.TestDicts();
+
+        IReadOnlyDictionary<string, long> testDict = new Dictionary<string, long> { { "dictkey1", 1 }, { "dictkey2", 2 } };
+        var result = testDicts.TestDictStrIntEager(testDict);
+        Assert.IsType<Dictionary<string, long>>(result);
+        Assert.Equal(testDict.OrderBy(e => e.Key), result.OrderBy(e => e.Key));
+    }
+
+    [Fact]
+    public void TestDicts_TryGetValue()
+    {
+        var testDicts = Env.TestDicts();
+
+        IReadOnlyDictionary<string, long> testDict = new Dictionary<string, long> { { "dictkey1", 1 } };
+        var result = testDicts.TestDictStrInt(testDict);
+        Assert.True(result.TryGetValue("dictkey1", out var value));
+        Assert.Equal(1, value);
+        Assert.False(result.TryGetValue("missing", out _));
+
+        var mapping = testDicts.TestMapping(testDict);
+        Assert.True(mapping.TryGetValue("dictkey1", out value));
+        Assert.Equal(1, value);
+        Assert.False(mapping.TryGetValue("missing", out _));
+    }
 }
@@ -1,3 +1,4 @@
+using CSnakes.Runtime.Python;
 using System.Collections.Generic;
 using System.Linq;
 
@@ -27,6 +28,20 @@ public class GeneratorTests(PythonEnvironmentFixture fixture) : IntegrationTestB
         Assert.Equal<string[]>(["one", "two"], generator.ToArray());
     }
 
+    [Fact]
+    public void TestMoveNextBatch()
+    {
+        var mod = Env.TestGenerators();
+        using var generator = mod.ExampleGenerator(5);
+
+        var batch = new string[3];
+        Assert.Equal(3, generator.MoveNextBatch(batch));
+        Assert.Equal<string[]>(["Item 0", "Item 1", "Item 2"], batch);
+        Assert.Equal(2, generator.MoveNextBatch(batch));
+        Assert.Equal<string[]>(["Item 3", "Item 4"], batch[..2]);
+        Assert.True(generator.Return);
+    }
+
     [Fact]
     public void TestIdempotentDisposal()
     {
@@ -0,0 +1,22 @@
+import asyncio
+from collections.abc import AsyncGenerator, AsyncIterator
+
+
+async def count_async(n: int) -> AsyncIterator[int]:
+    for i in range(n):
+        await asyncio.sleep(0)
+        yield i
+
+
+async def words_async() -> AsyncGenerator[str, None]:
+    for word in ["foo", "bar", "baz"]:
+        await asyncio.sleep(0)
+        yield word
+
+
+async def endless_async(delay: float) -> AsyncIterator[int]:
+    i = 0
+    while True:
+        await asyncio.sleep(delay)
+        yield i
+        i += 1
@@ -112,6 +112,12 @@ def test_non_contiguous_buffer() -> Buffer:
 def test_transposed_buffer() -> Buffer:
     return _as_buffer(np.array([[1, 2, 3], [4, 5, 6]], dtype=np.int32).T)
 
+def test_column_sliced_buffer() -> Buffer:
+    return _as_buffer(np.arange(12, dtype=np.int32).reshape(3, 4)[:, ::2])
+
+def test_reversed_buffer() -> Buffer:
+    return _as_buffer(np.arange(5, dtype=np.int64)[::-1])
+
 def test_ndim_3d_buffer() -> Buffer:
     arr =  np.zeros((2, 3, 4), dtype=np.int32)
     arr[0, 0, 0] = 1
@@ -131,6 +137,10 @@ def test_ndim_4d_buffer() -> Buffer:
     return _as_buffer(arr)
 
 
+def test_sum_of_buffer(a: Buffer) -> float:
+    return float(np.asarray(a).sum())
+
+
 def sum_of_2d_array(n: int) -> Generator[Buffer, None, int]:
     arr = np.zeros((n, n), dtype=np.int32)
     yield _as_buffer(arr)
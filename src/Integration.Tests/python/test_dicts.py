@@ -1,4 +1,4 @@
-from typing import ItemsView, Iterator, Mapping
+from typing import Annotated, ItemsView, Iterator, Mapping
 
 def test_dict_str_int(a: dict[str, int]) -> dict[str, int]:
     return a
@@ -9,6 +9,9 @@ def test_dict_str_list_int(a: dict[str, list[int]]) -> dict[str, list[int]]:
 def test_dict_str_dict_int(a: dict[str, dict[str, int]]) -> dict[str, dict[str, int]]:
     return a
 
+def test_dict_str_int_eager(a: dict[str, int]) -> Annotated[dict[str, int], 'eager']:
+    return a
+
 class MyMappingType(Mapping[str, int]):
     def __init__(self, a):
         self.actual_dict = dict(a)
@@ -13,7 +13,7 @@ public class AsyncBenchmarks : BaseBenchmark
         mod = Env.AsyncBenchmarks();
     }
 
-    [Params(1, 10, 100, 1_000)]
+    [Params(1, 10, 100, 1_000, 10_000)]
     public int N { get; set; }
 
     [Params(0.001, 1)]
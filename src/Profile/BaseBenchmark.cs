@@ -10,12 +10,16 @@ public class BaseBenchmark
 {
     protected readonly IPythonEnvironment Env;
 
-    public BaseBenchmark()
+    public BaseBenchmark() : this(null) { }
+
+    protected BaseBenchmark(Action<IPythonEnvironmentBuilder>? configure)
     {
         var builder = Host.CreateApplicationBuilder();
         var pb = builder.Services.WithPython();
         pb.WithHome(Path.Join(Environment.CurrentDirectory))
-          .FromRedistributable(Environment.GetEnvironmentVariable("PYTHON_VERSION") ?? "3.12");
+          .FromRedistributable(Environment.GetEnvironmentVariable("PYTHON_VERSION") ?? "3.12",
+                               freeThreaded: Environment.GetEnvironmentVariable("PYTHON_FREE_THREADED") == "1");
+        configure?.Invoke(pb);
 
         IHost app = builder.Build();
 
@@ -0,0 +1,35 @@
+using BenchmarkDotNet.Attributes;
+using CSnakes.Runtime;
+
+namespace Profile;
+
+public class BatchBenchmarks : BaseBenchmark
+{
+    private ICallBenchmarks mod = null!;
+
+    [Params(1, 20, 50)]
+    public int N { get; set; }
+
+    [GlobalSetup]
+    public void Setup()
+    {
+        mod = Env.CallBenchmarks();
+    }
+
+    [Benchmark(Baseline = true)]
+    public void OneByOne()
+    {
+        for (var i = 0; i < N; i++)
+            mod.PositionalOnlyArgs(1, 2, 3);
+    }
+
+    [Benchmark]
+    public void InBatch()
+    {
+        Env.RunBatch(() =>
+        {
+            for (var i = 0; i < N; i++)
+                mod.PositionalOnlyArgs(1, 2, 3);
+        });
+    }
+}
@@ -0,0 +1,33 @@
+using BenchmarkDotNet.Attributes;
+using CSnakes.Runtime.Python;
+using System.Numerics;
+
+namespace Profile;
+
+public class BigIntegerBenchmarks : BaseBenchmark
+{
+    private BigInteger value;
+    private PyObject pyValue = null!;
+
+    [Params(64, 2048, 65_536, 1_048_576)]
+    public int Bits { get; set; }
+
+    [GlobalSetup]
+    public void Setup()
+    {
+        value = BigInteger.Pow(2, Bits - 1) - 12345;
+        pyValue = PyObject.From(value);
+    }
+
+    [GlobalCleanup]
+    public void Cleanup() => pyValue.Dispose();
+
+    [Benchmark]
+    public void ToPython()
+    {
+        using var obj = PyObject.From(value);
+    }
+
+    [Benchmark]
+    public BigInteger FromPython() => pyValue.As<BigInteger>();
+}
@@ -21,6 +21,19 @@ public class CallBenchmarks : BaseBenchmark
         mod.PositionalOnlyArgs(1, 2, 3);
     }
 
+    [Benchmark]
+    public void PositionalOnlyArgsCachedIntegers()
+    {
+        // Within the default small integer cache, but beyond the one CPython keeps
+        mod.PositionalOnlyArgs(300, 600, 900);
+    }
+
+    [Benchmark]
+    public void PositionalOnlyArgsUncachedIntegers()
+    {
+        mod.PositionalOnlyArgs(100_000, 200_000, 300_000);
+    }
+
     [Benchmark]
     public void CollectStarArgs()
     {
@@ -80,4 +93,10 @@ public class CallBenchmarks : BaseBenchmark
     {
         mod.ManyKeywordOnlyArgs(PyObject.None, []);
     }
+
+    [Benchmark]
+    public void ManyKeywordOnlyWithValues()
+    {
+        mod.ManyKeywordOnlyArgs(PyObject.None, [], maxLength: 100, temperature: 0.5, topK: 10);
+    }
 }
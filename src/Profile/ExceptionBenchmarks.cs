@@ -0,0 +1,70 @@
+using BenchmarkDotNet.Attributes;
+using CSnakes.Runtime;
+
+namespace Profile;
+
+/// <summary>
+/// Calls a Python function that raises <c>ValueError</c> for some of its inputs, as a validation
+/// function would. <see cref="LightweightExceptionBenchmarks"/> runs the same calls with
+/// lightweight exceptions enabled.
+/// </summary>
+public class ExceptionBenchmarks : BaseBenchmark
+{
+    private IExceptionBenchmarks mod = null!;
+
+    public ExceptionBenchmarks() { }
+
+    protected ExceptionBenchmarks(Action<IPythonEnvironmentBuilder> configure) : base(configure) { }
+
+    [GlobalSetup]
+    public void Setup()
+    {
+        mod = Env.ExceptionBenchmarks();
+    }
+
+    [Benchmark]
+    public void Raise()
+    {
+        try
+        {
+            mod.Validate(-1);
+        }
+        catch (PythonInvocationException)
+        {
+        }
+    }
+
+    [Benchmark]
+    public object? RaiseAndReadLocals()
+    {
+        try
+        {
+            mod.Validate(-1);
+            return null;
+        }
+        catch (PythonInvocationException ex)
+        {
+            return ex.InnerException?.Data["locals"];
+        }
+    }
+
+    [Benchmark]
+    public long OneInTwentyRaises()
+    {
+        long total = 0;
+        for (var i = 0; i < 100; i++)
+        {
+            try
+            {
+                total += mod.Validate(i % 20 == 0 ? -i - 1 : i);
+            }
+            catch (PythonInvocationException)
+            {
+            }
+        }
+        return total;
+    }
+}
+
+public class LightweightExceptionBenchmarks() :
+    ExceptionBenchmarks(pb => pb.WithLightweightExceptions());
@@ -0,0 +1,49 @@
+using BenchmarkDotNet.Attributes;
+using CSnakes.Runtime;
+using CSnakes.Runtime.Python;
+
+namespace Profile;
+
+public class GeneratorBenchmarks : BaseBenchmark
+{
+    private IGeneratorBenchmarks mod = null!;
+
+    [GlobalSetup]
+    public void Setup()
+    {
+        mod = Env.GeneratorBenchmarks();
+    }
+
+    [Params(1_000, 1_000_000)]
+    public int N { get; set; }
+
+    [Benchmark]
+    public long Drain()
+    {
+        using var generator = mod.CountUp(N);
+        long sum = 0;
+        while (generator.MoveNext())
+            sum += generator.Current;
+        return sum + generator.Return;
+    }
+
+    [Params(64)]
+    public int BatchSize { get; set; }
+
+    [Benchmark]
+    public long DrainInBatches()
+    {
+        using var generator = mod.CountUp(N);
+        Span<long> batch = stackalloc long[BatchSize];
+        long sum = 0;
+        int count;
+        do
+        {
+            count = generator.MoveNextBatch(batch);
+            foreach (var item in batch[..count])
+                sum += item;
+        }
+        while (count == batch.Length);
+        return sum + generator.Return;
+    }
+}
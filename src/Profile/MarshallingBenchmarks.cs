@@ -32,6 +32,24 @@ public class MarshallingBenchmarks : BaseBenchmark
         mod!.GenerateSequence();
     }
 
+    [Benchmark]
+    public long FunctionReturnsLargeIntList()
+    {
+        long sum = 0;
+        foreach (var item in mod!.GenerateIntSequence(100_000))
+            sum += item;
+        return sum;
+    }
+
+    [Benchmark]
+    public double FunctionReturnsLargeFloatList()
+    {
+        double sum = 0;
+        foreach (var item in mod!.GenerateFloatSequence(100_000))
+            sum += item;
+        return sum;
+    }
+
     [Benchmark]
     public void FunctionTakesList()
     {
@@ -0,0 +1,31 @@
+using BenchmarkDotNet.Attributes;
+using CSnakes.Runtime;
+
+namespace Profile;
+
+/// <summary>
+/// Calls a CPU-bound Python function from a growing number of threads at once. With the GIL, the
+/// total time grows with the number of threads; on a free-threaded build (run with
+/// <c>PYTHON_VERSION=3.13</c> and <c>PYTHON_FREE_THREADED=1</c>), it should stay roughly flat
+/// until the threads outnumber the cores.
+/// </summary>
+public class ParallelBenchmarks : BaseBenchmark
+{
+    private IParallelBenchmarks mod = null!;
+
+    [Params(1, 2, 4, 8)]
+    public int Threads { get; set; }
+
+    [GlobalSetup]
+    public void Setup()
+    {
+        mod = Env.ParallelBenchmarks();
+    }
+
+    [Benchmark]
+    public void SumOfSquares()
+    {
+        Parallel.For(0, Threads, new ParallelOptions { MaxDegreeOfParallelism = Threads },
+                     _ => mod.SumOfSquares(100_000));
+    }
+}
@@ -0,0 +1,42 @@
+using BenchmarkDotNet.Attributes;
+using CSnakes.Runtime;
+
+namespace Profile;
+
+/// <summary>
+/// The string-heavy <see cref="MarshallingBenchmarks"/> with the runtime string cache enabled,
+/// for comparison against the uncached baseline.
+/// </summary>
+public class StringCacheBenchmarks() : BaseBenchmark(pb => pb.WithStringCache())
+{
+    private IMarshallingBenchmarks? mod;
+
+    [GlobalSetup]
+    public void Setup()
+    {
+        mod = Env.MarshallingBenchmarks();
+    }
+
+    [Benchmark]
+    public void FunctionTakesDictionary()
+    {
+        Dictionary<string, long> hundredNumbers = [];
+        for (int i = 0; i < 100; i++)
+        {
+            hundredNumbers.Add(i.ToString(), i);
+        }
+        mod!.ConsumeDictionary(hundredNumbers);
+    }
+
+    [Benchmark]
+    public void FunctionReturnsDictionary()
+    {
+        mod!.GenerateDictionary();
+    }
+
+    [Benchmark]
+    public void FunctionTakesValueTypes()
+    {
+        mod!.ConsumeValueTypes(5, "hello", 4.2, true);
+    }
+}
@@ -0,0 +1,4 @@
+def validate(value: int) -> int:
+    if value < 0:
+        raise ValueError(f"value must not be negative, got {value}")
+    return value
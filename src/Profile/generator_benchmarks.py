@@ -0,0 +1,7 @@
+from typing import Generator
+
+
+def count_up(n: int) -> Generator[int, None, int]:
+    for i in range(n):
+        yield i
+    return n
@@ -43,6 +43,12 @@ def generate_sequence() -> list[int]:
 def consume_sequence(sequence: list[int]) -> None:
     assert(isinstance(sequence, list) and len(sequence) == 100)
 
+def generate_int_sequence(n: int) -> list[int]:
+    return list(range(n))
+
+def generate_float_sequence(n: int) -> list[float]:
+    return [i * 0.5 for i in range(n)]
+
 def generate_sequence_any() -> Any:
     return [i for i in range(100)]
 